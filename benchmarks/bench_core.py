@@ -0,0 +1,211 @@
+import numpy as np
+
+import waveresponse as wr
+
+from .common import N_DIRS, N_FREQ, freq_dirs, rao, wave
+
+
+class CalculateResponse:
+    params = (N_FREQ, N_DIRS)
+    param_names = ["n_freq", "n_dirs"]
+
+    def setup(self, n_freq, n_dirs):
+        self.rao = rao(n_freq, n_dirs)
+        self.wave = wave(n_freq, n_dirs)
+
+    def time_calculate_response(self, n_freq, n_dirs):
+        wr.calculate_response(self.rao, self.wave, 30.0, heading_degrees=True)
+
+    def time_calculate_response_rao_coords(self, n_freq, n_dirs):
+        wr.calculate_response(
+            self.rao,
+            self.wave,
+            30.0,
+            heading_degrees=True,
+            coord_freq="rao",
+            coord_dirs="rao",
+        )
+
+    def time_calculate_response_std(self, n_freq, n_dirs):
+        wr.calculate_response(self.rao, self.wave, 30.0, heading_degrees=True).std()
+
+    def peakmem_calculate_response(self, n_freq, n_dirs):
+        wr.calculate_response(self.rao, self.wave, 30.0, heading_degrees=True)
+
+    def time_response_std(self, n_freq, n_dirs):
+        wr.response_std(self.rao, self.wave, 30.0, heading_degrees=True)
+
+    def time_response_moments(self, n_freq, n_dirs):
+        wr.response_moments(
+            self.rao, self.wave, 30.0, n=(0, 2, 4), heading_degrees=True
+        )
+
+
+class FromSpectrum1d:
+    params = (N_FREQ, N_DIRS)
+    param_names = ["n_freq", "n_dirs"]
+
+    def setup(self, n_freq, n_dirs):
+        self.freq, self.dirs = freq_dirs(n_freq, n_dirs)
+        _, self.spectrum1d = wr.JONSWAP(self.freq, freq_hz=True)(3.5, 10.0)
+        self.spreading = wr.CosineHalfSpreading(s=4, degrees=True)
+
+    def time_from_spectrum1d(self, n_freq, n_dirs):
+        wr.WaveSpectrum.from_spectrum1d(
+            self.freq,
+            self.dirs,
+            self.spectrum1d,
+            self.spreading,
+            45.0,
+            freq_hz=True,
+            degrees=True,
+        )
+
+
+class GridInterpolate:
+    params = (N_FREQ, N_DIRS)
+    param_names = ["n_freq", "n_dirs"]
+
+    def setup(self, n_freq, n_dirs):
+        self.rao = rao(n_freq, n_dirs)
+        self.freq_new, self.dirs_new = freq_dirs(2 * n_freq, 2 * n_dirs)
+
+    def time_interpolate(self, n_freq, n_dirs):
+        self.rao.interpolate(self.freq_new, self.dirs_new, freq_hz=True, degrees=True)
+
+    def time_interpolate_polar(self, n_freq, n_dirs):
+        self.rao.interpolate(
+            self.freq_new,
+            self.dirs_new,
+            freq_hz=True,
+            degrees=True,
+            complex_convert="polar",
+        )
+
+    def time_reshape(self, n_freq, n_dirs):
+        self.rao.reshape(self.freq_new, self.dirs_new, freq_hz=True, degrees=True)
+
+    def time_reshape_new_grid(self, n_freq, n_dirs):
+        # Includes building the interpolation function
+        self.rao.copy().reshape(
+            self.freq_new, self.dirs_new, freq_hz=True, degrees=True
+        )
+
+    def time_rotate(self, n_freq, n_dirs):
+        self.rao.rotate(12.5, degrees=True)
+
+    def time_set_wave_convention(self, n_freq, n_dirs):
+        self.rao.set_wave_convention(clockwise=True, waves_coming_from=False)
+        self.rao.set_wave_convention(clockwise=False, waves_coming_from=True)
+
+    def time_copy(self, n_freq, n_dirs):
+        self.rao.copy()
+
+
+class SpectrumStatistics:
+    params = (N_FREQ, N_DIRS)
+    param_names = ["n_freq", "n_dirs"]
+
+    def setup(self, n_freq, n_dirs):
+        self.wave = wave(n_freq, n_dirs)
+
+    def time_var(self, n_freq, n_dirs):
+        self.wave.var()
+
+    def time_moment(self, n_freq, n_dirs):
+        self.wave.moment(2, freq_hz=True)
+
+    def time_spectrum1d(self, n_freq, n_dirs):
+        self.wave.spectrum1d(axis=1)
+
+    def time_hs(self, n_freq, n_dirs):
+        self.wave.hs
+
+    def time_tp(self, n_freq, n_dirs):
+        self.wave.tp
+
+    def time_dirp(self, n_freq, n_dirs):
+        self.wave.dirp()
+
+    def time_dirm(self, n_freq, n_dirs):
+        self.wave.dirm()
+
+    def time_tz(self, n_freq, n_dirs):
+        self.wave.tz
+
+
+class Mirror:
+    params = (N_FREQ, N_DIRS)
+    param_names = ["n_freq", "n_dirs"]
+
+    def setup(self, n_freq, n_dirs):
+        freq, dirs = freq_dirs(n_freq, n_dirs)
+        dirs = dirs[dirs <= 180.0]
+        vals = np.ones((n_freq, len(dirs)), dtype=complex)
+        self.rao = wr.RAO(freq, dirs, vals, freq_hz=True, degrees=True)
+
+    def time_mirror(self, n_freq, n_dirs):
+        wr.mirror(self.rao, "roll", sym_plane="xz")
+
+
+class Encounter:
+    params = (N_FREQ, N_DIRS)
+    param_names = ["n_freq", "n_dirs"]
+
+    def setup(self, n_freq, n_dirs):
+        self.wave = wave(n_freq, n_dirs)
+        self.sailing_direction = np.linspace(0.0, 360.0, 8, endpoint=False)
+        self.sailing_velocity = np.linspace(0.0, 10.0, 6)
+
+    def time_encounter(self, n_freq, n_dirs):
+        self.wave.copy().encounter(30.0, 5.0)
+
+    def time_encounter_values_matrix(self, n_freq, n_dirs):
+        self.wave.encounter_values(
+            self.sailing_direction[:, np.newaxis],
+            self.sailing_velocity[np.newaxis, :],
+        )
+
+
+class BatchResponse:
+    params = (N_FREQ, N_DIRS)
+    param_names = ["n_freq", "n_dirs"]
+
+    def setup(self, n_freq, n_dirs):
+        self.rao = rao(n_freq, n_dirs)
+        self.wave = wave(n_freq, n_dirs)
+        self.vals = np.stack([self.wave._vals] * 24)
+
+    def time_calculate_response_batch(self, n_freq, n_dirs):
+        freq, dirs, _ = self.wave.grid(freq_hz=False, degrees=False)
+        wr.calculate_response_batch(self.rao, freq, dirs, self.vals, 0.5)
+
+    def time_heading_sweep_fft(self, n_freq, n_dirs):
+        wr.heading_sweep_fft(self.rao, self.wave)
+
+
+class HeadingSweep:
+    params = (N_FREQ, N_DIRS, ["grid", "off-grid"])
+    param_names = ["n_freq", "n_dirs", "headings"]
+
+    def setup(self, n_freq, n_dirs, headings):
+        self.rao = rao(n_freq, n_dirs)
+        self.wave = wave(n_freq, n_dirs)
+        self.headings = np.linspace(0.0, 360.0, 36, endpoint=False)
+        if headings == "off-grid":
+            self.headings += 0.5
+
+    def time_heading_sweep(self, n_freq, n_dirs, headings):
+        wr.heading_sweep(
+            self.rao, self.wave, self.headings, heading_degrees=True, output="var"
+        )
+
+    def time_heading_sweep_spectrum(self, n_freq, n_dirs, headings):
+        wr.heading_sweep(self.rao, self.wave, self.headings, heading_degrees=True)
+
+    def time_calculate_response_loop(self, n_freq, n_dirs, headings):
+        # Reference for the heading sweep
+        for heading in self.headings:
+            wr.calculate_response(
+                self.rao, self.wave, heading, heading_degrees=True
+            ).var()
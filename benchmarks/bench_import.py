@@ -0,0 +1,17 @@
+class Import:
+    """
+    Import time, measured in a fresh interpreter for each sample.
+    """
+
+    timeout = 60.0
+
+    def timeraw_import_waveresponse(self):
+        return "import waveresponse"
+
+    def timeraw_import_jonswap(self):
+        return """
+        import numpy as np
+        import waveresponse as wr
+
+        wr.JONSWAP(np.linspace(0.1, 2.0, 100))(3.5, 10.0)
+        """
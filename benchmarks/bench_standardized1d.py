@@ -0,0 +1,30 @@
+import numpy as np
+
+import waveresponse as wr
+
+N_FREQ = [100, 400, 4000]
+
+
+class Spectra1d:
+    params = N_FREQ
+    param_names = ["n_freq"]
+
+    def setup(self, n_freq):
+        self.freq = np.linspace(0.01, 1.0, n_freq)
+        self.hs = np.linspace(0.5, 8.0, 1000)
+        self.tp = np.linspace(4.0, 18.0, 1000)
+
+    def time_modified_pierson_moskowitz(self, n_freq):
+        wr.ModifiedPiersonMoskowitz(self.freq, freq_hz=True)(3.5, 10.0)
+
+    def time_jonswap(self, n_freq):
+        wr.JONSWAP(self.freq, freq_hz=True)(3.5, 10.0, gamma=3.3)
+
+    def time_ochi_hubble(self, n_freq):
+        wr.OchiHubble(self.freq, freq_hz=True)(3.5, 10.0, q=2.0)
+
+    def time_torsethaugen(self, n_freq):
+        wr.Torsethaugen(self.freq, freq_hz=True)(3.5, 10.0)
+
+    def time_jonswap_1000_sea_states(self, n_freq):
+        wr.JONSWAP(self.freq, freq_hz=True)(self.hs, self.tp)
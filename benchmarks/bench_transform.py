@@ -0,0 +1,21 @@
+import numpy as np
+
+import waveresponse as wr
+
+from .common import N_DIRS, N_FREQ, rao
+
+
+class RigidTransform:
+    params = (N_FREQ, N_DIRS)
+    param_names = ["n_freq", "n_dirs"]
+
+    def setup(self, n_freq, n_dirs):
+        self.raos = [rao(n_freq, n_dirs, seed=seed) for seed in range(6)]
+        self.t = np.array([10.0, -5.0, 20.0])
+        self.t_points = np.random.default_rng(0).uniform(-50.0, 50.0, (100, 3))
+
+    def time_rigid_transform(self, n_freq, n_dirs):
+        wr.rigid_transform(self.t, *self.raos)
+
+    def time_rigid_transform_100_points(self, n_freq, n_dirs):
+        wr.rigid_transform(self.t_points, *self.raos)
@@ -0,0 +1,43 @@
+"""
+Test data shared by the benchmarks.
+
+Grid sizes span typical RAO and (hindcast) wave spectrum resolutions.
+"""
+
+import numpy as np
+
+import waveresponse as wr
+
+N_FREQ = [100, 400]
+N_DIRS = [36, 360]
+
+
+def freq_dirs(n_freq, n_dirs):
+    """Frequency [Hz] and direction [deg] coordinates"""
+    freq = np.linspace(0.01, 1.0, n_freq)
+    dirs = np.linspace(0.0, 360.0, n_dirs, endpoint=False)
+    return freq, dirs
+
+
+def rao(n_freq, n_dirs, seed=0):
+    """RAO with random (complex) values"""
+    rng = np.random.default_rng(seed)
+    freq, dirs = freq_dirs(n_freq, n_dirs)
+    vals = rng.random((n_freq, n_dirs)) + 1j * rng.random((n_freq, n_dirs))
+    return wr.RAO(freq, dirs, vals, freq_hz=True, degrees=True)
+
+
+def wave(n_freq, n_dirs):
+    """JONSWAP wave spectrum with cosine-2s spreading"""
+    freq, dirs = freq_dirs(n_freq, n_dirs)
+    spectrum = wr.JONSWAP(freq, freq_hz=True)
+    _, vals = spectrum(3.5, 10.0)
+    return wr.WaveSpectrum.from_spectrum1d(
+        freq,
+        dirs,
+        vals,
+        wr.CosineFullSpreading(s=2, degrees=True),
+        45.0,
+        freq_hz=True,
+        degrees=True,
+    )
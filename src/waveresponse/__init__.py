@@ -1,16 +1,28 @@
 from ._core import (
     RAO,
+    BaseSpreading,
     CosineFullSpreading,
     CosineHalfSpreading,
     DirectionalSpectrum,
     Grid,
     WaveSpectrum,
     calculate_response,
+    calculate_response_batch,
     complex_to_polar,
+    heading_sweep,
+    heading_sweep_fft,
     mirror,
     multiply,
     polar_to_complex,
+    response_moments,
+    response_std,
 )
+from ._io import GridLibrary, ResultsWriter, write_library
+from ._parallel import calculate_response_parallel
+from ._pipeline import response_stats_stream
+from ._profiling import ProfileResult, profile
+from ._raoset import RAOSet
+from ._regrid import Regridder
 from ._standardized1d import (
     JONSWAP,
     BasePMSpectrum,
@@ -31,23 +43,38 @@ __version__ = "0.0.1"
 __all__ = [
     "BasePMSpectrum",
     "BaseSpectrum1d",
+    "BaseSpreading",
     "calculate_response",
+    "calculate_response_batch",
+    "calculate_response_parallel",
     "complex_to_polar",
     "CosineFullSpreading",
     "CosineHalfSpreading",
     "DirectionalSpectrum",
     "Grid",
+    "GridLibrary",
+    "heading_sweep",
+    "heading_sweep_fft",
     "JONSWAP",
     "ModifiedPiersonMoskowitz",
     "OchiHubble",
     "multiply",
     "mirror",
     "polar_to_complex",
+    "ProfileResult",
+    "profile",
     "RAO",
+    "RAOSet",
+    "Regridder",
+    "response_moments",
+    "response_stats_stream",
+    "response_std",
+    "ResultsWriter",
     "rigid_transform",
     "rigid_transform_heave",
     "rigid_transform_surge",
     "rigid_transform_sway",
     "Torsethaugen",
     "WaveSpectrum",
+    "write_library",
 ]
@@ -1,11 +1,17 @@
 import copy
+import math
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from numbers import Number
 
 import numpy as np
-from scipy.integrate import trapezoid
-from scipy.interpolate import RegularGridInterpolator as RGI
-from scipy.special import gamma
+
+from . import _shared_memory
+from ._profiling import _instrument
+
+# Number of reshaped versions of the squared RAO magnitude kept in the cache of
+# each RAO object (see ``RAO._squared_magnitude_reshaped``)
+_RESHAPED_CACHE_SIZE = 8
 
 
 def _robust_modulus(x, periodicity):
@@ -82,6 +88,7 @@ def polar_to_complex(amp, phase, phase_degrees=False):
     return amp * np.exp(1j * phase)
 
 
+@_instrument
 def _check_is_similar(*grids, exact_type=True):
     """
     Check if grid objects are similar.
@@ -147,16 +154,12 @@ def multiply(grid1, grid2, output_type="grid"):
     vals = np.multiply(grid1._vals, grid2._vals)
     convention = grid1.wave_convention
 
-    new = Grid(
-        freq,
-        dirs,
-        vals,
-        freq_hz=False,
-        degrees=False,
-        **convention,
-    )
+    new = type_._new(freq, dirs, vals, **convention)
+
+    if isinstance(new, DirectionalSpectrum):
+        new._check_vals(new._vals)
 
-    return type_.from_grid(new)
+    return new
 
 
 def _cast_to_grid(grid):
@@ -166,8 +169,10 @@ def _cast_to_grid(grid):
     Note that this type conversion may lead to loss of information/functionality
     for derived classes.
     """
-    new = Grid(
-        *grid.grid(freq_hz=grid._freq_hz, degrees=grid._degrees),
+    new = Grid._new(
+        grid._freq,
+        grid._dirs,
+        grid._vals,
         freq_hz=grid._freq_hz,
         degrees=grid._degrees,
         **grid.wave_convention,
@@ -210,7 +215,38 @@ def _sort(dirs, vals):
     dirs = np.asarray_chkfinite(dirs)
     vals = np.asarray_chkfinite(vals)
     sorted_args = np.argsort(dirs)
-    return dirs[sorted_args], vals[:, sorted_args]
+    return dirs[sorted_args], vals[..., sorted_args]
+
+
+def _uniform_step(dirs):
+    """
+    Step size of uniformly spaced directions covering the full circle, in 'radians'.
+
+    Returns ``None`` if the directions are not uniformly spaced.
+    """
+    step = 2.0 * np.pi / len(dirs)
+    if not np.allclose(np.diff(dirs), step, rtol=0.0, atol=1e-10):
+        return None
+    return step
+
+
+def _cyclic_shift(dirs, angle):
+    """
+    Number of direction steps equivalent to rotating uniformly spaced directions
+    (covering the full circle) by `angle`, in 'radians'.
+
+    Returns ``None`` if the directions are not uniformly spaced, or if the angle is
+    not a multiple of the direction step.
+    """
+    step = _uniform_step(dirs)
+    if step is None:
+        return None
+
+    shift = angle / step
+    shift_int = np.round(shift)
+    if abs(shift - shift_int) > 1e-8:
+        return None
+    return int(shift_int) % len(dirs)
 
 
 def mirror(rao, dof, sym_plane="xz"):
@@ -258,29 +294,61 @@ def mirror(rao, dof, sym_plane="xz"):
     ... )
     """
 
+    freq, dirs, vals = rao.grid()
+    scale_phase = _mirror_phase_sign(dof, sym_plane)
+    dirs_mirrored, vals_mirrored = _mirror(
+        dirs, vals, scale_phase, sym_plane, degrees=rao._degrees
+    )
+
+    return RAO(
+        freq,
+        dirs_mirrored,
+        vals_mirrored,
+        degrees=rao._degrees,
+        freq_hz=rao._freq_hz,
+        **rao.wave_convention,
+        copy=False,
+    )
+
+
+def _mirror_phase_sign(dof, sym_plane="xz"):
+    """
+    Sign of the mirrored (folded) RAO values for a degree-of-freedom.
+    """
     sym_plane = sym_plane.lower()
     dof = dof.lower()
-    freq, dirs, vals = rao.grid()
 
     if dof not in ("surge", "sway", "heave", "roll", "pitch", "yaw"):
         raise ValueError(
             "`dof` must be 'surge', 'sway', 'heave', 'roll', 'pitch' or 'yaw'"
         )
 
-    if rao._degrees:
+    if sym_plane == "xz":
+        return -1 if dof in ("sway", "roll", "yaw") else 1
+    elif sym_plane == "yz":
+        return -1 if dof in ("surge", "pitch", "yaw") else 1
+    else:
+        raise ValueError("`sym_plane` should be 'xz' or 'yz'")
+
+
+def _mirror(dirs, vals, scale_phase, sym_plane="xz", degrees=False):
+    """
+    Mirror/fold directions and values about a symmetry plane. See :func:`mirror`.
+
+    The directions correspond to the last axis of `vals`, and `scale_phase` must
+    be broadcastable with `vals`.
+    """
+    sym_plane = sym_plane.lower()
+
+    if degrees:
         periodicity = 360.0
     else:
         periodicity = 2 * np.pi
 
-    scale_phase = 1
     if sym_plane == "xz":
         bounds = (0.0, periodicity / 2.0)
-        if dof in ("sway", "roll", "yaw"):
-            scale_phase = -1
     elif sym_plane == "yz":
         bounds = (periodicity / 4.0, 3.0 * periodicity / 4.0)
-        if dof in ("surge", "pitch", "yaw"):
-            scale_phase = -1
     else:
         raise ValueError("`sym_plane` should be 'xz' or 'yz'")
 
@@ -290,27 +358,75 @@ def mirror(rao, dof, sym_plane="xz"):
         ((dirs >= ub_1) | (dirs <= lb_1))
     )
 
-    _check_foldable(dirs[exclude_bounds], degrees=rao._degrees, sym_plane=sym_plane)
+    _check_foldable(dirs[exclude_bounds], degrees=degrees, sym_plane=sym_plane)
 
-    vals_folded = scale_phase * vals[:, exclude_bounds]
+    vals_folded = scale_phase * vals[..., exclude_bounds]
     if sym_plane == "xz":
         dirs_folded = -1 * dirs[exclude_bounds]
     elif sym_plane == "yz":
         dirs_folded = -1 * dirs[exclude_bounds] + periodicity / 2.0
 
-    vals_mirrored = np.concatenate((vals, vals_folded), axis=1)
+    vals_mirrored = np.concatenate((vals, vals_folded), axis=-1)
     dirs_mirrored = np.concatenate((dirs, dirs_folded))
     dirs_mirrored = _robust_modulus(dirs_mirrored, periodicity)
-    dirs_mirrored, vals_mirrored = _sort(dirs_mirrored, vals_mirrored)
+    return _sort(dirs_mirrored, vals_mirrored)
 
-    return RAO(
-        freq,
-        dirs_mirrored,
-        vals_mirrored,
-        degrees=rao._degrees,
-        freq_hz=rao._freq_hz,
-        **rao.wave_convention,
-    )
+
+def _interp_rows(x, xp, fp, fill_value=0.0):
+    """
+    Row-wise 1-D linear interpolation.
+
+    Equivalent to ``np.interp(x[i], xp[i], fp[i])`` for each row, ``i``, but
+    without looping over rows. Values outside the range of each row of `xp` are
+    set to `fill_value`.
+
+    Parameters
+    ----------
+    x : array (L, Q)
+        Coordinates to interpolate at.
+    xp : array (L, P)
+        Data coordinates. Must be increasing along each row.
+    fp : array (L, P)
+        Data values.
+    """
+    lower = xp[:, :1]
+    upper = xp[:, -1:]
+
+    # Shift each row to its own (non-overlapping) interval, and interpolate all
+    # rows with a single call.
+    span = np.max(upper - lower) + 1.0
+    offset = span * np.arange(len(xp)).reshape(-1, 1)
+    vals = np.interp(
+        (x - lower + offset).ravel(), (xp - lower + offset).ravel(), fp.ravel()
+    ).reshape(x.shape)
+
+    return np.where((x < lower) | (x > upper), fill_value, vals)
+
+
+def _take_interp(vals, idx0, idx1, t):
+    """
+    Linear interpolation between rows of `vals`, i.e.,
+    ``(1 - t) * vals[idx0] + t * vals[idx1]``, where `t` has the shape of the
+    indices.
+    """
+    if not np.any(t):
+        return vals[idx0]
+    t = t[..., np.newaxis]
+    return (1.0 - t) * vals[idx0] + t * vals[idx1]
+
+
+def _storage_dtype(vals, dtype):
+    """
+    Data type used to store grid values with the given (floating point) precision.
+
+    Complex values are stored with the complex data type of the same precision.
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind not in "fc":
+        raise ValueError("`dtype` must be a floating point or complex data type.")
+    if np.iscomplexobj(vals):
+        return np.result_type(dtype, np.complex64)
+    return dtype
 
 
 class Grid:
@@ -337,6 +453,22 @@ class Grid:
     waves_coming_from : bool
         If waves are 'coming from' the given directions. If ``False``, 'going towards'
         convention is assumed.
+    copy : bool
+        Whether to copy the given arrays. If ``False``, the arrays are used by the
+        object without copying (where possible), and should not be modified afterwards.
+    dtype : data-type, optional
+        Floating point precision used to store the grid values, e.g. ``numpy.float32``
+        for single precision. Complex values are stored with the complex data type
+        of the same precision (e.g., ``numpy.complex64``). If ``None`` (default),
+        the data type of `vals` is kept. See Notes.
+
+    Notes
+    -----
+    Storing the values in single precision halves the memory usage (and memory
+    bandwidth) of large grids. The precision is kept by operations returning new
+    grid objects (e.g., interpolation with :meth:`reshape`, and multiplication),
+    while integrals (e.g., the variance and spectral moments of spectra) are always
+    accumulated in double precision.
     """
 
     def __init__(
@@ -348,14 +480,26 @@ class Grid:
         degrees=False,
         clockwise=False,
         waves_coming_from=True,
+        copy=True,
+        dtype=None,
     ):
-        self._freq = np.asarray_chkfinite(freq).copy()  # [rad/s]
-        self._dirs = np.asarray_chkfinite(dirs).copy()  # [rad]
-        self._vals = np.asarray_chkfinite(vals).copy()  # [xxx/(rad^2/s)]
+        self._freq = np.asarray_chkfinite(freq)  # [rad/s]
+        self._dirs = np.asarray_chkfinite(dirs)  # [rad]
+        self._vals = np.asarray_chkfinite(vals)  # [xxx/(rad^2/s)]
+        if copy:
+            self._freq = self._freq.copy()
+            self._dirs = self._dirs.copy()
+        if dtype is not None:
+            self._vals = self._vals.astype(_storage_dtype(self._vals, dtype), copy=copy)
+        elif copy:
+            self._vals = self._vals.copy()
         self._clockwise = clockwise
         self._waves_coming_from = waves_coming_from
         self._freq_hz = freq_hz
         self._degrees = degrees
+        self._cache = {}
+        self._cache_ref = None
+        self._shared = {}
 
         if freq_hz:
             self._freq = 2.0 * np.pi * self._freq
@@ -391,8 +535,40 @@ class Grid:
             freq_hz=grid._freq_hz,
             degrees=grid._degrees,
             **grid.wave_convention,
+            copy=False,
         )
 
+    @classmethod
+    def _new(
+        cls,
+        freq,
+        dirs,
+        vals,
+        freq_hz=False,
+        degrees=False,
+        clockwise=False,
+        waves_coming_from=True,
+    ):
+        """
+        Construct from trusted arrays, without copying or validating them.
+
+        Intended for internal use, where `freq`, `dirs` and `vals` are already
+        validated, and given in 'rad/s' and 'radians'. `freq_hz` and `degrees`
+        only set the default units of the new object.
+        """
+        new = cls.__new__(cls)
+        new._freq = freq
+        new._dirs = dirs
+        new._vals = vals
+        new._clockwise = clockwise
+        new._waves_coming_from = waves_coming_from
+        new._freq_hz = freq_hz
+        new._degrees = degrees
+        new._cache = {}
+        new._cache_ref = None
+        new._shared = {}
+        return new
+
     def _check_freq(self, freq):
         """
         Check frequency bins.
@@ -484,6 +660,22 @@ class Grid:
 
         return freq, dirs, vals
 
+    @property
+    def dtype(self):
+        """
+        Data type of the grid values.
+        """
+        return self._vals.dtype
+
+    def _vals_dtype(self, vals):
+        """
+        Data type for new grid values (e.g., interpolated), keeping the precision
+        of single precision grids.
+        """
+        if self._vals.dtype in (np.float32, np.complex64):
+            return _storage_dtype(vals, np.float32)
+        return vals.dtype
+
     @property
     def wave_convention(self):
         """
@@ -517,17 +709,19 @@ class Grid:
         self._clockwise = conv_new["clockwise"]
         self._waves_coming_from = conv_new["waves_coming_from"]
 
+    @_instrument
     def _convert(self, freq, dirs, vals, config_new, config_org):
         """
         Convert grid from one wave convention to another.
         """
-        freq_org = np.asarray_chkfinite(freq).copy()
-        dirs_org = np.asarray_chkfinite(dirs).copy()
-        vals_org = np.asarray_chkfinite(vals).copy()
+        freq_new = np.asarray_chkfinite(freq)
+        dirs_new = self._convert_dirs(dirs, config_new, config_org, degrees=False)
+        dirs_new, vals_new = _sort(dirs_new, vals)
 
-        freq_new = freq_org
-        dirs_new = self._convert_dirs(dirs_org, config_new, config_org, degrees=False)
-        dirs_new, vals_new = _sort(dirs_new, vals_org)
+        # Keep the original directions if they are only permuted (e.g., uniformly
+        # spaced directions), so that round-off does not change the coordinates
+        if np.allclose(dirs_new, dirs, rtol=0.0, atol=1e-10):
+            dirs_new = dirs
 
         return freq_new, dirs_new, vals_new
 
@@ -566,10 +760,143 @@ class Grid:
 
         return _robust_modulus(dirs, periodicity)
 
+    @_instrument
     def copy(self):
         """Return a copy of the object."""
         return copy.deepcopy(self)
 
+    def astype(self, dtype):
+        """
+        Return a copy of the object where the values are stored with the given
+        floating point precision.
+
+        Parameters
+        ----------
+        dtype : data-type
+            Floating point precision, e.g. ``numpy.float32`` for single precision.
+            Complex values are stored with the complex data type of the same
+            precision (e.g., ``numpy.complex64``).
+
+        Returns
+        -------
+        obj :
+            A copy of the object with values of the given precision.
+        """
+        new = self._shallow_copy()
+        new._vals = self._vals.astype(_storage_dtype(self._vals, dtype))
+        return new
+
+    def _shallow_copy(self):
+        """
+        Return a shallow copy of the object, sharing the coordinate and value arrays.
+
+        Intended for internal use, where (some of) the arrays are replaced right
+        after copying.
+        """
+        return copy.copy(self)
+
+    def __copy__(self):
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new._cache = {}
+        new._cache_ref = None
+        new._shared = self._shared.copy()
+        return new
+
+    def __deepcopy__(self, memo):
+        new = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new
+        for key, value in self.__dict__.items():
+            if key not in ("_cache", "_cache_ref", "_shared"):
+                setattr(new, key, copy.deepcopy(value, memo))
+        new._cache = {}
+        new._cache_ref = None
+        new._shared = {}
+        return new
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_cache"] = {}
+        state["_cache_ref"] = None
+
+        # Arrays in shared memory are pickled as handles (unless the memory block
+        # is unlinked, e.g. by the object this object is derived from)
+        state["_shared"] = {}
+        for attr, (arr, handle) in self._shared.items():
+            if state[attr] is arr and _shared_memory.is_linked(handle):
+                state[attr] = handle
+                state["_shared"][attr] = handle
+        return state
+
+    def __setstate__(self, state):
+        shared = state.pop("_shared", {})
+        self.__dict__.update(state)
+        self._shared = {}
+        for attr, handle in shared.items():
+            arr = _shared_memory.from_shared(handle)
+            setattr(self, attr, arr)
+            self._shared[attr] = (arr, handle)
+
+    def share_memory(self):
+        """
+        Return a copy of the object where the frequency/direction coordinates and
+        the values are stored in shared memory blocks (see ``multiprocessing.shared_memory``).
+
+        When pickled (e.g., when sent to worker processes), the object is serialized
+        as small handles to the shared memory blocks, and the unpickled object reads
+        the same blocks without copying. The shared arrays are read-only.
+
+        The shared memory blocks should be released with :meth:`unlink_shared_memory`
+        (by the creating process) when they are no longer needed.
+
+        Returns
+        -------
+        obj :
+            A copy of the object backed by shared memory.
+        """
+        new = self._shallow_copy()
+        new._shared = {}
+        for attr in ("_freq", "_dirs", "_vals"):
+            arr, handle = _shared_memory.to_shared(getattr(self, attr))
+            setattr(new, attr, arr)
+            new._shared[attr] = (arr, handle)
+        return new
+
+    def unlink_shared_memory(self):
+        """
+        Release the shared memory blocks of the object.
+
+        The arrays of the object are copied to regular memory, and the blocks are
+        closed once no other objects in this process use them. The object (and
+        other objects in this process using the same blocks) is still valid, but
+        it will be pickled as a regular object afterwards, and new processes can
+        no longer attach to the blocks.
+        """
+        shared, self._shared = self._shared, {}
+        for attr, (arr, _) in shared.items():
+            if getattr(self, attr) is arr:
+                setattr(self, attr, np.array(arr))
+        for _, handle in shared.values():
+            _shared_memory.unlink(handle)
+
+    def _cached(self, key, fun, *args, **kwargs):
+        """
+        Return the cached result of ``fun(*args, **kwargs)`` stored under `key`.
+
+        The cache is invalidated whenever the grid's frequency/direction coordinates
+        or values change (i.e., are replaced).
+        """
+        ref = (self._freq, self._dirs, self._vals)
+        if self._cache_ref is None or any(
+            a is not b for a, b in zip(ref, self._cache_ref)
+        ):
+            self._cache = {}
+            self._cache_ref = ref
+
+        if key not in self._cache:
+            self._cache[key] = fun(*args, **kwargs)
+        return self._cache[key]
+
     def rotate(self, angle, degrees=False):
         """
         Rotate the underlying grid coordinate system a given angle.
@@ -596,15 +923,39 @@ class Grid:
         if degrees:
             angle = (np.pi / 180.0) * angle
 
-        new = self.copy()
+        new = self._shallow_copy()
+
+        # Rotating uniformly spaced directions by a multiple of the direction step
+        # is an (exact) cyclic shift of the values
+        shift = _cyclic_shift(new._dirs, angle)
+        if shift is not None:
+            if shift:
+                new._vals = np.roll(new._vals, -shift, axis=-1)
+            return new
+
         dirs_new = _robust_modulus(new._dirs - angle, 2.0 * np.pi)
         new._dirs, new._vals = _sort(dirs_new, new._vals)
         return new
 
+    @_instrument
     def _interpolate_function(self, complex_convert="rectangular", **kw):
         """
         Interpolation function based on ``scipy.interpolate.RegularGridInterpolator``.
+
+        The interpolation function is cached, and reused for as long as the grid
+        is unchanged.
+        """
+        key = ("interpolate", complex_convert.lower(), tuple(sorted(kw.items())))
+        return self._cached(
+            key, self._build_interpolate_function, complex_convert, **kw
+        )
+
+    def _build_interpolate_function(self, complex_convert, **kw):
         """
+        Build interpolation function. See ``_interpolate_function``.
+        """
+        from scipy.interpolate import RegularGridInterpolator as RGI
+
         xp = np.concatenate(
             (self._dirs[-1:] - 2 * np.pi, self._dirs, self._dirs[:1] + 2.0 * np.pi)
         )
@@ -618,6 +969,9 @@ class Grid:
             ),
             axis=1,
         )
+        # Interpolate in double precision (single precision values are not
+        # supported by the fast paths of ``RegularGridInterpolator``)
+        zp = zp.astype(np.result_type(zp, np.float64), copy=False)
 
         if np.all(np.isreal(zp)):
             return RGI((xp, yp), zp.T, **kw)
@@ -715,6 +1069,7 @@ class Grid:
         dirsnew, freqnew = np.meshgrid(dirs, freq, indexing="ij", sparse=True)
         return interp_fun((dirsnew, freqnew)).T
 
+    @_instrument
     def reshape(
         self,
         freq,
@@ -778,8 +1133,9 @@ class Grid:
             complex_convert=complex_convert,
             fill_value=fill_value,
         )
-        new = self.copy()
-        new._freq, new._dirs, new._vals = freq_new, dirs_new, vals_new
+        new = self._shallow_copy()
+        new._freq, new._dirs = freq_new, dirs_new
+        new._vals = vals_new.astype(self._vals_dtype(vals_new), copy=False)
         return new
 
     def bandpassed(self, freq_min=None, freq_max=None):
@@ -820,88 +1176,115 @@ class Grid:
     ):
         """
         Calculates the encounter spectrum for a given sailing direction and velocity.
-        """
 
-        if waterdepth > 0:
-            raise NotImplementedError(
-                "Waterdepth is not yet supported, only deep-water (<=0) is implemented"
-            )
+        The grid values are converted (in-place) to encounter frequency. See
+        :meth:`encounter_values` for details.
 
-        # get the grid
-        freq = self.freq(freq_hz=True)
-        dirs = self.dirs(degrees=True)
-        vals = self._vals
+        Parameters
+        ----------
+        sailing_direction : float
+            Sailing direction in 'degrees'.
+        sailing_velocity : float
+            Sailing velocity in 'm/s'.
+        waterdepth : float
+            Water depth. Only deep water (``waterdepth <= 0``) is supported.
+        """
+        self._vals = self.encounter_values(
+            sailing_direction, sailing_velocity, waterdepth=waterdepth
+        )
 
-        # treat opposite directions as negative frequencies
-        ddir = dirs[dirs < 180]
-        for d in ddir:
-            # assert d+180 in dirs, f"Direction {d} is missing its opposite direction {d+180}" # fails
-            assert (
-                min(abs(dirs - (d + 180))) < 1e-6
-            ), f"Direction {d} is missing its opposite direction {d+180}"
-
-        assert len(dirs) == 2 * len(
-            ddir
-        ), "Directions must be defined in pairs separated by 180 degrees"
-        nd = len(ddir)
-        nf = len(freq)
+    def encounter_values(self, sailing_direction, sailing_velocity, waterdepth=0):
+        """
+        Grid values converted to encounter frequency, for one or more sailing
+        directions and velocities.
 
-        dfreq = np.zeros((2 * nf, nd))
-        dvals = np.zeros((2 * nf, nd))
-        ddirs = np.zeros((2 * nf, nd))
+        The (deep water) encounter frequency, ``w_e``, is given by:
 
-        omega = 2 * np.pi * freq
+            ``w_e = w - w ** 2 * u / g``
 
-        for i in range(len(ddir)):
-            S = vals[:, i]
+        where ``u`` is the sailing velocity component along the wave direction.
+        Each direction is transformed independently, and opposite directions are
+        treated as a pair (encounter frequencies that change sign are attributed
+        to the opposite direction). The transformed values are interpolated (linear)
+        back onto the original frequency coordinates, direction by direction.
 
-            velocity_in_direction = sailing_velocity * np.cos(
-                np.deg2rad(sailing_direction - dirs[i])
-            )
+        Parameters
+        ----------
+        sailing_direction : float or array-like
+            Sailing direction(s) in 'degrees'.
+        sailing_velocity : float or array-like
+            Sailing velocity(ies) in 'm/s'. Must be broadcastable with `sailing_direction`.
+        waterdepth : float
+            Water depth. Only deep water (``waterdepth <= 0``) is supported.
 
-            omega_e = omega - omega**2 * velocity_in_direction / 9.81
-            S_e = S / (1 - (2 * omega * velocity_in_direction / 9.81))
+        Returns
+        -------
+        array (..., N, M) :
+            Grid values in terms of encounter frequency. The leading dimensions
+            are given by the broadcast shape of `sailing_direction` and `sailing_velocity`.
+            ``N`` and ``M`` are the number of frequency and direction coordinates.
 
-            dfreq[:nf,i] = (omega_e / (2 * np.pi))[::-1]
-            dvals[:nf,i] = S_e[::-1]
-            ddirs[:,i] = dirs[i]
+        Notes
+        -----
+        The directions must be defined in pairs separated by 180 degrees.
+        """
 
-            # the opposite direction
-            S = vals[:, i + nd]
-            velocity_in_direction = sailing_velocity * np.cos(
-                np.deg2rad(sailing_direction - dirs[i + nd])
+        if waterdepth > 0:
+            raise NotImplementedError(
+                "Waterdepth is not yet supported, only deep-water (<=0) is implemented"
             )
 
-            omega_e = omega - omega**2 * velocity_in_direction / 9.81
-            S_e = S / (1 - (2 * omega * velocity_in_direction / 9.81))
-
-            dfreq[nf:, i] = -omega_e / (2 * np.pi)
-            dvals[nf:, i] = S_e
-
+        g = 9.81
+        freq = self.freq(freq_hz=True)
+        dirs = self.dirs(degrees=True)
+        omega = self._freq.reshape(-1, 1)
 
-        # verify that all grid-points are unique
-        test = zip(ddirs.flat, dfreq.flat)
-        assert len(set(test)) == len(ddirs.flat), "Not all grid points are unique"
+        # treat opposite directions as negative frequencies
+        nd = np.count_nonzero(dirs < 180.0)
+        nf = len(freq)
+        if len(dirs) != 2 * nd or np.any(
+            np.abs(dirs[nd:] - (dirs[:nd] + 180.0)) >= 1e-6
+        ):
+            raise ValueError(
+                "Directions must be defined in pairs separated by 180 degrees."
+            )
 
-        # make an interpolation function for the new grid
-        f = LinearNDInterpolator(
-            (ddirs.flat, dfreq.flat), dvals.flat, fill_value=0.0
+        sailing_direction, sailing_velocity = np.broadcast_arrays(
+            np.asarray_chkfinite(sailing_direction, dtype=float),
+            np.asarray_chkfinite(sailing_velocity, dtype=float),
         )
+        shape = sailing_direction.shape
+        sailing_direction = sailing_direction.reshape(-1, 1, 1)
+        sailing_velocity = sailing_velocity.reshape(-1, 1, 1)
 
-        # fill the new original grid with the interpolated values
-        # expand ddir such that its second dimension has the length of freq
-        ddir_exp = np.tile(ddir, (nf, 1))
-        freq_exp = np.tile(freq, (nd, 1)).T
-
-        vals_new_left = f(ddir_exp, freq_exp)
-        vals_new_right = f(ddir_exp, -freq_exp)
-        vals_new = np.concatenate((vals_new_left, vals_new_right), axis=1)
-
-        assert (
-            self._vals.shape == vals_new.shape
-        ), "The new grid must have the same shape as the original grid"
+        # (K, N, M) arrays of encounter frequency [Hz] and values
+        velocity_in_direction = sailing_velocity * np.cos(
+            np.radians(sailing_direction - dirs)
+        )
+        omega_e = omega - omega**2 * velocity_in_direction / g
+        vals_e = self._vals / (1.0 - 2.0 * omega * velocity_in_direction / g)
+        freq_e = omega_e / (2.0 * np.pi)
+
+        # (K * nd, 2 * N) arrays of 'signed' encounter frequency along each direction
+        # pair (positive towards the first direction), sorted per direction pair
+        freq_signed = np.concatenate((freq_e[..., :nd], -freq_e[..., nd:]), axis=1)
+        vals_signed = np.concatenate((vals_e[..., :nd], vals_e[..., nd:]), axis=1)
+        freq_signed = freq_signed.transpose(0, 2, 1).reshape(-1, 2 * nf)
+        vals_signed = vals_signed.transpose(0, 2, 1).reshape(-1, 2 * nf)
+        sorted_args = np.argsort(freq_signed, axis=1, kind="stable")
+        freq_signed = np.take_along_axis(freq_signed, sorted_args, axis=1)
+        vals_signed = np.take_along_axis(vals_signed, sorted_args, axis=1)
+
+        freq_new = np.broadcast_to(
+            np.concatenate((freq, -freq)), (len(freq_signed), 2 * nf)
+        )
+        vals_new = _interp_rows(freq_new, freq_signed, vals_signed)
 
-        self._vals = vals_new
+        # back to (K, N, M), with the opposite directions at negative frequencies
+        vals_new = vals_new.reshape(-1, nd, 2 * nf).transpose(0, 2, 1)
+        vals_new = np.concatenate((vals_new[:, :nf, :], vals_new[:, nf:, :]), axis=2)
+        vals_new = vals_new.astype(self._vals_dtype(vals_new), copy=False)
+        return vals_new.reshape(shape + (nf, 2 * nd))
 
     def __mul__(self, other):
         """
@@ -921,7 +1304,7 @@ class Grid:
             A copy of the object where the values are multiplied with values of
             another grid.
         """
-        new = self.copy()
+        new = self._shallow_copy()
 
         if isinstance(other, Number):
             new._vals = new._vals * other
@@ -951,7 +1334,7 @@ class Grid:
         obj :
             A copy of the object where the values are added with another grid's values.
         """
-        new = self.copy()
+        new = self._shallow_copy()
 
         if isinstance(other, Number):
             new._vals = new._vals + other
@@ -981,7 +1364,7 @@ class Grid:
         obj :
             A copy of the object where the values are subtracted with another grid's values.
         """
-        new = self.copy()
+        new = self._shallow_copy()
 
         if isinstance(other, Number):
             new._vals = new._vals - other
@@ -1001,7 +1384,7 @@ class Grid:
         """
         Return a copy of the object with complex conjugate values.
         """
-        new = self.copy()
+        new = self._shallow_copy()
         new._vals = new._vals.conjugate()
         return new
 
@@ -1024,6 +1407,31 @@ class Grid:
         return new
 
 
+def _spread_vectorized(spread_fun, freq, dirs):
+    """
+    Evaluate a spreading function on a frequency/direction grid.
+
+    `freq` and `dirs` should be broadcastable arrays of shape (N, 1) and (1, M),
+    respectively. Spreading functions that do not support array input, or that do
+    not return an array of shape (N, M), are evaluated once for each
+    frequency/direction coordinate.
+    """
+    shape = (freq.shape[0], dirs.shape[1])
+
+    try:
+        spread = np.asarray(spread_fun(freq, dirs))
+    except (TypeError, ValueError):  # scalar-only spreading function
+        pass
+    else:
+        if spread.shape == shape:
+            return spread
+
+    spread = np.empty(shape)
+    for idx_f, idx_d in np.ndindex(shape):
+        spread[idx_f, idx_d] = spread_fun(freq[idx_f, 0], dirs[0, idx_d])
+    return spread
+
+
 class DisableComplexMixin:
     @property
     def imag(self):
@@ -1068,6 +1476,13 @@ class RAO(Grid):
     waves_coming_from : bool
         If waves are 'coming from' the given directions. If ``False``, 'going towards'
         convention is assumed.
+    copy : bool
+        Whether to copy the given arrays. If ``False``, the arrays are used by the
+        object without copying (where possible), and should not be modified afterwards.
+    dtype : data-type, optional
+        Floating point precision used to store the values, e.g. ``numpy.float32``
+        for single precision. If ``None`` (default), the data type of `vals` is
+        kept. See :class:`~waveresponse.Grid`.
 
     Notes
     -----
@@ -1089,6 +1504,8 @@ class RAO(Grid):
         degrees=False,
         clockwise=False,
         waves_coming_from=True,
+        copy=True,
+        dtype=None,
     ):
         super().__init__(
             freq,
@@ -1098,10 +1515,19 @@ class RAO(Grid):
             degrees=degrees,
             clockwise=clockwise,
             waves_coming_from=waves_coming_from,
+            copy=copy,
+            dtype=dtype,
         )
         self._phase_degrees = False
         self._phase_leading = True
 
+    @classmethod
+    def _new(cls, *args, **kwargs):
+        new = super()._new(*args, **kwargs)
+        new._phase_degrees = False
+        new._phase_leading = True
+        return new
+
     @classmethod
     def from_amp_phase(
         cls,
@@ -1203,7 +1629,7 @@ class RAO(Grid):
         obj :
             Differentiated RAO object.
         """
-        new = self.copy()
+        new = self._shallow_copy()
         new._vals = new._vals * ((1j * new._freq.reshape(-1, 1)) ** n)
         return new
 
@@ -1268,6 +1694,64 @@ class RAO(Grid):
 
         return freq, dirs, vals_amp, vals_phase
 
+    def squared_magnitude(self):
+        """
+        Squared magnitude of the RAO, ``|RAO|^2``.
+
+        Equivalent to ``(rao * rao.conjugate()).real``. The squared magnitude is
+        cached, and reused for as long as the RAO is unchanged (e.g., by
+        :meth:`~waveresponse.Grid.set_wave_convention`).
+
+        Returns
+        -------
+        obj :
+            Squared magnitude of the RAO as a :class:`~waveresponse.Grid` object.
+        """
+        return self._squared_magnitude()._shallow_copy()
+
+    def _squared_magnitude(self):
+        """
+        Cached squared magnitude of the RAO. See ``squared_magnitude``.
+
+        The returned object is shared between calls, and must not be modified.
+        """
+
+        def squared_magnitude():
+            return Grid._new(
+                self._freq,
+                self._dirs,
+                (self._vals * self._vals.conjugate()).real,
+                freq_hz=self._freq_hz,
+                degrees=self._degrees,
+                **self.wave_convention,
+            )
+
+        return self._cached(("squared_magnitude",), squared_magnitude)
+
+    def _squared_magnitude_reshaped(self, freq, dirs):
+        """
+        Squared magnitude of the RAO reshaped to the given frequency/direction
+        coordinates (in 'rad/s' and 'radians').
+
+        The reshaped grids are cached for the most recently used coordinates. The
+        returned object is shared between calls, and must not be modified.
+        """
+        if np.array_equal(freq, self._freq) and np.array_equal(dirs, self._dirs):
+            return self._squared_magnitude()
+
+        reshaped = self._cached(("squared_magnitude_reshaped",), OrderedDict)
+
+        key = (freq.tobytes(), dirs.tobytes())
+        if key in reshaped:
+            reshaped.move_to_end(key)
+        else:
+            reshaped[key] = self._squared_magnitude().reshape(
+                freq, dirs, freq_hz=False, degrees=False
+            )
+            if len(reshaped) > _RESHAPED_CACHE_SIZE:
+                reshaped.popitem(last=False)
+        return reshaped[key]
+
     def __repr__(self):
         return "RAO"
 
@@ -1303,6 +1787,13 @@ class DirectionalSpectrum(DisableComplexMixin, Grid):
     waves_coming_from : bool
         If waves are 'coming from' the given directions. If ``False``, 'going towards'
         convention is assumed.
+    copy : bool
+        Whether to copy the given arrays. If ``False``, the arrays are used by the
+        object without copying (where possible), and should not be modified afterwards.
+    dtype : data-type, optional
+        Floating point precision used to store the values, e.g. ``numpy.float32``
+        for single precision. If ``None`` (default), the data type of `vals` is
+        kept. See :class:`~waveresponse.Grid`.
     """
 
     def __init__(
@@ -1314,6 +1805,8 @@ class DirectionalSpectrum(DisableComplexMixin, Grid):
         degrees=False,
         clockwise=False,
         waves_coming_from=True,
+        copy=True,
+        dtype=None,
     ):
         super().__init__(
             freq,
@@ -1323,6 +1816,8 @@ class DirectionalSpectrum(DisableComplexMixin, Grid):
             degrees=degrees,
             clockwise=clockwise,
             waves_coming_from=waves_coming_from,
+            copy=copy,
+            dtype=dtype,
         )
 
         if freq_hz:
@@ -1332,9 +1827,15 @@ class DirectionalSpectrum(DisableComplexMixin, Grid):
             if degrees:
                 self._vals = 180.0 / np.pi * self._vals
 
-        if np.any(np.iscomplex(self._vals)):
+        self._check_vals(self._vals)
+
+    def _check_vals(self, vals):
+        """
+        Check spectrum values.
+        """
+        if np.any(np.iscomplex(vals)):
             raise ValueError("Spectrum values can not be complex.")
-        elif np.any(self._vals < 0.0):
+        elif np.any(vals < 0.0):
             raise ValueError("Spectrum values must be positive.")
 
     @property
@@ -1387,9 +1888,12 @@ class DirectionalSpectrum(DisableComplexMixin, Grid):
             to all frequency/direction coordinates. `spectrum1d` must have the same
             length as `freq`.
         spread_fun : callable
-            Spreading function. Takes a frequency coordinate (float) and a direction
-            coordinate (float) as input, and returns a corresponding scaling value
-            (float).
+            Spreading function. Takes a frequency coordinate and a direction coordinate
+            as input, and returns a corresponding scaling value. The function is first
+            evaluated with broadcastable arrays of frequency (shape (N, 1)) and direction
+            (shape (1, M)) coordinates. If this fails, or does not yield an array of
+            shape (N, M), the function is evaluated once for each frequency/direction
+            coordinate (float) instead.
         dirp : float
             Peak direction. Direction in which the spectrum has its maximum values.
         freq_hz : bool
@@ -1404,17 +1908,19 @@ class DirectionalSpectrum(DisableComplexMixin, Grid):
             convention is assumed.
         """
         spectrum1d = np.asarray_chkfinite(spectrum1d).reshape(-1, 1)
-        vals = np.tile(spectrum1d, (1, len(dirs)))
 
         if degrees:
             period = 360.0
         else:
             period = 2.0 * np.pi
 
-        for (idx_f, idx_d), val_i in np.ndenumerate(vals):
-            f_i = freq[idx_f]
-            d_i = _robust_modulus(dirs[idx_d] - dirp, period)
-            vals[idx_f, idx_d] = spread_fun(f_i, d_i) * val_i
+        freq_ = np.asarray_chkfinite(freq).reshape(-1, 1)
+        dirs_ = _robust_modulus(np.asarray_chkfinite(dirs) - dirp, period).reshape(
+            1, -1
+        )
+        spread = _spread_vectorized(spread_fun, freq_, dirs_)
+
+        vals = spectrum1d * spread
 
         return cls(
             freq,
@@ -1527,14 +2033,28 @@ class DirectionalSpectrum(DisableComplexMixin, Grid):
             x = np.r_[x, range_end]
         return x
 
+    def _quadrature_weights(self):
+        """
+        Trapezoid quadrature weights along the frequency axis (in 'rad/s'), and
+        along the (periodic) direction axis (in 'radians').
+        """
+
+        def weights():
+            return (
+                _trapezoid_weights(self._freq),
+                _trapezoid_weights_periodic(self._dirs),
+            )
+
+        return self._cached(("quadrature_weights",), weights)
+
+    @_instrument
     def var(self):
         """
         Variance (integral) of the spectrum.
         """
-        x = self._full_range_dir(self._dirs)
-        y = self._freq
-        zz = self.interpolate(y, x, freq_hz=False, degrees=False)
-        return trapezoid([trapezoid(zz_x, x) for zz_x in zz], y)
+        w_freq, w_dirs = self._quadrature_weights()
+        # Accumulated in double precision (also for single precision values)
+        return w_freq @ self._vals @ w_dirs
 
     def std(self):
         """
@@ -1585,27 +2105,27 @@ class DirectionalSpectrum(DisableComplexMixin, Grid):
             else:
                 return f, v
 
-        if axis == 1:
-            degrees = False
-        elif degrees is None:
+        if degrees is None:
             degrees = self._degrees
 
-        freq, dirs, vals = self.grid(freq_hz=freq_hz, degrees=degrees)
+        w_freq, w_dirs = self._quadrature_weights()
 
         if axis == 0:
-            y = freq
-            x = dirs
-            zz = vals.T
+            x = self.dirs(degrees=degrees)
+            spectrum = w_freq @ self._vals
+            if degrees:
+                spectrum *= np.pi / 180.0
         elif axis == 1:
-            y = self._full_range_dir(dirs)
-            x = freq
-            zz = self.interpolate(x, y, freq_hz=freq_hz, degrees=degrees)
+            x = self.freq(freq_hz=freq_hz)
+            spectrum = self._vals @ w_dirs
+            if freq_hz:
+                spectrum *= 2.0 * np.pi
         else:
             raise ValueError("'axis' must be 0 or 1.")
 
-        spectrum = np.array([trapezoid(zz_y, y) for zz_y in zz])
         return x, spectrum
 
+    @_instrument
     def moment(self, n, freq_hz=None):
         """
         Calculate spectral moment (along the frequency domain).
@@ -1634,8 +2154,16 @@ class DirectionalSpectrum(DisableComplexMixin, Grid):
         Cambridge University Press.
 
         """
-        f, spectrum = self.spectrum1d(axis=1, freq_hz=freq_hz)
-        m_n = trapezoid((f**n) * spectrum, f)
+        if freq_hz is None:
+            freq_hz = self._freq_hz
+
+        w_freq, _ = self._quadrature_weights()
+        omega, spectrum = self.spectrum1d(axis=1, freq_hz=False)
+        m_n = w_freq @ ((omega**n) * spectrum)
+
+        if freq_hz:
+            m_n /= (2.0 * np.pi) ** n
+
         return m_n
 
     @property
@@ -1758,7 +2286,7 @@ class WaveSpectrum(DirectionalSpectrum):
         return 1.0 / fp
 
     @staticmethod
-    def _mean_direction(dirs, spectrum):
+    def _mean_direction(dirs, spectrum, weights=None):
         """
         Mean spectrum direction.
 
@@ -1768,10 +2296,19 @@ class WaveSpectrum(DirectionalSpectrum):
             Directions in 'radians'.
         spectrum : array-like
             1-D spectrum directional distribution.
+        weights : array-like, optional
+            Quadrature weights for `dirs`. If ``None``, the trapezoid rule is
+            applied over `dirs` (without wrapping around the period).
         """
 
-        sin = trapezoid(np.sin(dirs) * spectrum, dirs)
-        cos = trapezoid(np.cos(dirs) * spectrum, dirs)
+        if weights is None:
+            from scipy.integrate import trapezoid
+
+            sin = trapezoid(np.sin(dirs) * spectrum, dirs)
+            cos = trapezoid(np.cos(dirs) * spectrum, dirs)
+        else:
+            sin = weights @ (np.sin(dirs) * spectrum)
+            cos = weights @ (np.cos(dirs) * spectrum)
         return _robust_modulus(np.arctan2(sin, cos), 2.0 * np.pi)
 
     def dirp(self, degrees=None):
@@ -1792,14 +2329,12 @@ class WaveSpectrum(DirectionalSpectrum):
         if degrees is None:
             degrees = self._degrees
 
-        freq, spectrum1d = self.spectrum1d(axis=1, freq_hz=False)
-
-        dirs = self._full_range_dir(self._dirs)  # radians
-        spectrum2d = self.interpolate(freq, dirs, freq_hz=False, degrees=False)
+        _, spectrum1d = self.spectrum1d(axis=1, freq_hz=False)
+        _, w_dirs = self._quadrature_weights()
 
-        spectrum_peak_dir = spectrum2d[np.argmax(spectrum1d), :]
+        spectrum_peak_dir = self._vals[np.argmax(spectrum1d), :]
 
-        dirp = self._mean_direction(dirs, spectrum_peak_dir)
+        dirp = self._mean_direction(self._dirs, spectrum_peak_dir, weights=w_dirs)
 
         if degrees:
             dirp = (180.0 / np.pi) * dirp
@@ -1818,12 +2353,10 @@ class WaveSpectrum(DirectionalSpectrum):
             during instantiation.
         """
 
-        dp, sp = self.spectrum1d(axis=0, degrees=False)
+        w_freq, w_dirs = self._quadrature_weights()
+        spectrum_dir = w_freq @ self._vals
 
-        d = self._full_range_dir(dp)
-        spectrum_dir = np.interp(d, dp, sp, period=2.0 * np.pi)
-
-        dirm = self._mean_direction(d, spectrum_dir)
+        dirm = self._mean_direction(self._dirs, spectrum_dir, weights=w_dirs)
 
         if degrees:
             dirm = np.degrees(dirm)
@@ -1866,25 +2399,635 @@ def calculate_response(
     wave_body = wave.rotate(heading, degrees=heading_degrees)
     wave_body.set_wave_convention(**rao.wave_convention)
 
+    freq, dirs = _response_coords(
+        rao, wave_body._freq, wave_body._dirs, coord_freq, coord_dirs
+    )
+
+    rao_squared = rao._squared_magnitude_reshaped(freq, dirs)
+    if not (
+        np.array_equal(freq, wave_body._freq) and np.array_equal(dirs, wave_body._dirs)
+    ):
+        wave_body = wave_body.reshape(freq, dirs, freq_hz=False, degrees=False)
+
+    return multiply(rao_squared, wave_body, output_type="directional_spectrum")
+
+
+def response_moments(
+    rao,
+    wave,
+    heading,
+    n=(0, 2),
+    heading_degrees=False,
+    coord_freq="wave",
+    coord_dirs="wave",
+    freq_hz=False,
+):
+    """
+    Calculate spectral moments of the response.
+
+    Equivalent to calling :func:`calculate_response`, and computing the spectral
+    moments of the response spectrum with :meth:`DirectionalSpectrum.moment`.
+    However, no intermediate grid objects are created; the squared RAO magnitude
+    and the (rotated) wave spectrum are interpolated only where the coordinates
+    differ from the response coordinates, and all moments are computed with a
+    single weighted reduction.
+
+    Parameters
+    ----------
+    rao : obj
+        Response amplitude operator (RAO) as a :class:`~waveresponse.RAO` object,
+        or a :class:`~waveresponse.RAOSet` object.
+    wave : obj
+        2-D wave spectrum as a :class:`~waveresponse.WaveSpectrum` object.
+    heading : float
+        Heading of vessel relative to wave spectrum coordinate system.
+    n : int or sequence of int
+        Order(s) of the spectral moments.
+    heading_degrees : bool
+        Whether the heading is given in 'degrees'. If ``False``, 'radians' is assumed.
+    coord_freq : str, optional
+        Frequency coordinates for interpolation. Should be 'wave' or 'rao'. See
+        :func:`calculate_response`.
+    coord_dirs : str, optional
+        Direction coordinates for interpolation. Should be 'wave' or 'rao'. See
+        :func:`calculate_response`.
+    freq_hz : bool
+        If frequencies in 'Hz' should be used. If ``False``, 'rad/s' is used.
+
+    Returns
+    -------
+    float or array :
+        Spectral moment(s) of the response, with the same shape as `n`. If `rao`
+        is an RAO set, there is an additional (last) axis with one column per
+        degree-of-freedom.
+
+    Examples
+    --------
+    >>> m0, m2, m4 = wr.response_moments(rao, wave, heading, n=(0, 2, 4))
+    """
+    n = np.asarray(n)
+
+    if heading_degrees:
+        heading = (np.pi / 180.0) * heading
+
+    plan = _ResponsePlan(
+        rao, wave, heading, coord_freq=coord_freq, coord_dirs=coord_dirs
+    )
+    m = plan.moments(wave._vals[np.newaxis], n=n.reshape(-1))[:, 0]
+    if freq_hz:
+        m /= (2.0 * np.pi) ** n.reshape(-1, 1)
+
+    if np.ndim(rao._vals) == 2:
+        return m[:, 0].reshape(n.shape)[()]
+    return m.reshape(n.shape + (-1,))
+
+
+def response_std(
+    rao, wave, heading, heading_degrees=False, coord_freq="wave", coord_dirs="wave"
+):
+    """
+    Calculate the standard deviation of the response.
+
+    Equivalent to ``calculate_response(rao, wave, heading, ...).std()``, but
+    without creating intermediate grid objects. See :func:`response_moments`.
+
+    Parameters
+    ----------
+    rao : obj
+        Response amplitude operator (RAO) as a :class:`~waveresponse.RAO` object,
+        or a :class:`~waveresponse.RAOSet` object.
+    wave : obj
+        2-D wave spectrum as a :class:`~waveresponse.WaveSpectrum` object.
+    heading : float
+        Heading of vessel relative to wave spectrum coordinate system.
+    heading_degrees : bool
+        Whether the heading is given in 'degrees'. If ``False``, 'radians' is assumed.
+    coord_freq : str, optional
+        Frequency coordinates for interpolation. Should be 'wave' or 'rao'. See
+        :func:`calculate_response`.
+    coord_dirs : str, optional
+        Direction coordinates for interpolation. Should be 'wave' or 'rao'. See
+        :func:`calculate_response`.
+
+    Returns
+    -------
+    float or array (6,) :
+        Standard deviation of the response. If `rao` is an RAO set, there is one
+        value per degree-of-freedom.
+    """
+    m0 = response_moments(
+        rao,
+        wave,
+        heading,
+        n=0,
+        heading_degrees=heading_degrees,
+        coord_freq=coord_freq,
+        coord_dirs=coord_dirs,
+    )
+    return np.sqrt(m0)
+
+
+@_instrument
+def _trapezoid_weights(x):
+    """
+    Trapezoid quadrature weights for (monotonically increasing) coordinates.
+
+    Integrating ``y`` over ``x`` is then equivalent to ``np.sum(w * y)``.
+    """
+    x = np.asarray_chkfinite(x)
+    dx = np.diff(x)
+    w = np.zeros(len(x))
+    w[:-1] += dx / 2.0
+    w[1:] += dx / 2.0
+    return w
+
+
+@_instrument
+def _trapezoid_weights_periodic(x, period=2.0 * np.pi):
+    """
+    Trapezoid quadrature weights for periodic (monotonically increasing) coordinates.
+
+    The interval between the last and the first coordinate (wrapping around the
+    period) is included in the integration.
+    """
+    x = np.asarray_chkfinite(x)
+    x_ext = np.concatenate((x[-1:] - period, x, x[:1] + period))
+    return (x_ext[2:] - x_ext[:-2]) / 2.0
+
+
+def _body_dirs(rao, wave, heading):
+    """
+    Wave spectrum directions rotated by `heading` (in 'radians'), and converted
+    to the wave convention of the RAO.
+
+    Returns the sorted directions, and the indices that sort the (original) wave
+    spectrum directions accordingly. If `heading` is a 1-D array, the directions
+    and indices have one row per heading. As with :meth:`Grid.rotate` and
+    :meth:`Grid.set_wave_convention`, directions that are only permuted (e.g.,
+    uniformly spaced directions rotated by a multiple of the direction step) keep
+    their original values.
+    """
+    heading = np.asarray(heading)
+    n_dirs = len(wave._dirs)
+    heading_ = heading.reshape(-1, 1)
+
+    dirs = _robust_modulus(wave._dirs - heading_, 2.0 * np.pi)
+    order = np.argsort(dirs, axis=1)
+    dirs = np.take_along_axis(dirs, order, axis=1)
+
+    # Rotating by a multiple of the direction step is a cyclic shift (see
+    # ``_cyclic_shift``)
+    step = _uniform_step(wave._dirs)
+    if step is not None:
+        shift = heading_ / step
+        cyclic = np.abs(shift - np.round(shift)).ravel() <= 1e-8
+        dirs[cyclic] = wave._dirs
+        order[cyclic] = (
+            np.arange(n_dirs) + np.round(shift[cyclic]).astype(int)
+        ) % n_dirs
+
+    dirs_body = Grid._convert_dirs(dirs, rao.wave_convention, wave.wave_convention)
+    sorted_args = np.argsort(dirs_body, axis=1)
+    dirs_body = np.take_along_axis(dirs_body, sorted_args, axis=1)
+    order = np.take_along_axis(order, sorted_args, axis=1)
+
+    permuted = np.all(np.abs(dirs_body - dirs) <= 1e-10, axis=1)
+    dirs_body[permuted] = dirs[permuted]
+
+    shape = heading.shape + (n_dirs,)
+    return dirs_body.reshape(shape), order.reshape(shape)
+
+
+def _response_coords(rao, freq_wave, dirs_wave, coord_freq, coord_dirs):
+    """
+    Frequency and direction coordinates of the response, according to `coord_freq`
+    and `coord_dirs` (see :func:`calculate_response`).
+    """
     if coord_freq.lower() == "wave":
-        freq = wave_body._freq
+        freq = freq_wave
     elif coord_freq.lower() == "rao":
         freq = rao._freq
     else:
         raise ValueError("Invalid `coord_freq` value. Should be 'wave' or 'rao'.")
 
     if coord_dirs.lower() == "wave":
-        dirs = wave_body._dirs
+        dirs = dirs_wave
     elif coord_dirs.lower() == "rao":
         dirs = rao._dirs
     else:
         raise ValueError("Invalid `coord_dirs` value. Should be 'wave' or 'rao'.")
 
-    rao_squared = (rao * rao.conjugate()).real
-    rao_squared = rao_squared.reshape(freq, dirs, freq_hz=False, degrees=False)
-    wave_body = wave_body.reshape(freq, dirs, freq_hz=False, degrees=False)
+    return freq, dirs
 
-    return multiply(rao_squared, wave_body, output_type="directional_spectrum")
+
+class _ResponsePlan:
+    """
+    Precomputed response calculation for wave spectra sharing the same coordinates
+    and wave convention.
+
+    Combines the stages of :func:`calculate_response` (rotation, wave convention
+    conversion, interpolation and multiplication with the squared RAO) with the
+    spectral moment integration, as a direction permutation, an (optional) sparse
+    interpolation and a weighted reduction. `rao` may be an RAO or an RAO set.
+    """
+
+    def __init__(self, rao, wave, heading, coord_freq="wave", coord_dirs="wave"):
+        self._freq_org = wave._freq
+        self._dirs_org = wave._dirs
+        self._convention_org = wave.wave_convention
+
+        self._dirs_body, self._order = _body_dirs(rao, wave, heading)
+        freq, dirs = _response_coords(
+            rao, wave._freq, self._dirs_body, coord_freq, coord_dirs
+        )
+        self._freq, self._dirs = freq, dirs
+        self._interpolate = not (freq is wave._freq and dirs is self._dirs_body)
+        self._regridder = None
+
+        if np.ndim(rao._vals) == 2:
+            self._rao_squared = rao._squared_magnitude_reshaped(freq, dirs)._vals
+        else:  # RAO set
+            from ._regrid import Regridder
+
+            rao_squared = (rao._vals * rao._vals.conjugate()).real
+            if not (
+                np.array_equal(freq, rao._freq) and np.array_equal(dirs, rao._dirs)
+            ):
+                rao_squared = Regridder(rao._freq, rao._dirs, freq, dirs)(rao_squared)
+            self._rao_squared = rao_squared
+
+        self._w_freq = _trapezoid_weights(freq)
+        self._w_dirs = _trapezoid_weights_periodic(dirs)
+        self._moment_weights = {}
+
+    def matches(self, wave):
+        """
+        Whether the plan is valid for a wave spectrum.
+        """
+        return (
+            wave.wave_convention == self._convention_org
+            and (
+                wave._freq is self._freq_org
+                or np.array_equal(wave._freq, self._freq_org)
+            )
+            and (
+                wave._dirs is self._dirs_org
+                or np.array_equal(wave._dirs, self._dirs_org)
+            )
+        )
+
+    def wave_vals(self, vals):
+        """
+        Wave spectrum values, ``(N, M)`` or ``(K, N, M)``, in the response
+        coordinates (and the RAO's wave convention).
+        """
+        vals = vals[..., self._order]
+        if not self._interpolate:
+            return vals
+
+        if vals.ndim == 2:
+            # Building the sparse interpolation weights only pays off for stacks
+            grid = Grid._new(self._freq_org, self._dirs_body, vals)
+            return grid.interpolate(self._freq, self._dirs)
+
+        if self._regridder is None:
+            from ._regrid import Regridder
+
+            self._regridder = Regridder(
+                self._freq_org, self._dirs_body, self._freq, self._dirs
+            )
+        return self._regridder(vals)
+
+    def _weights(self, n):
+        """
+        Quadrature weights (including the squared RAO) for the n-th order spectral
+        moment, with shape (n_rao, N * M).
+
+        Without interpolation, the weights are given in the original direction
+        order of the wave spectra, so that the values need not be permuted.
+        """
+        weights = self._moment_weights.get(n)
+        if weights is None:
+            weights = (
+                np.outer(self._freq**n * self._w_freq, self._w_dirs) * self._rao_squared
+            )
+            if not self._interpolate:
+                weights_org = np.empty_like(weights)
+                weights_org[..., self._order] = weights
+                weights = weights_org
+            weights = weights.reshape(-1, weights.shape[-2] * weights.shape[-1])
+            self._moment_weights[n] = weights
+        return weights
+
+    def moments(self, vals, n=(0, 2)):
+        """
+        Spectral moments (in terms of 'rad/s') of the response, for a stack of wave
+        spectrum values, ``(K, N, M)``, in the original coordinates.
+
+        Returns an array of shape (len(n), K, n_rao).
+        """
+        n = np.asarray(n, dtype=float)
+
+        if len(vals) == 1:
+            # A single response is cheaper to integrate directly
+            response = self._rao_squared * self.wave_vals(vals[0])
+            w_freq = self._freq ** n.reshape(-1, 1) * self._w_freq
+            m = (response @ self._w_dirs) @ w_freq.T
+            return m.reshape(-1, len(n)).T[:, np.newaxis, :]
+
+        if self._interpolate:
+            vals = self.wave_vals(vals)
+        vals = vals.reshape(len(vals), -1)
+        return np.stack([vals @ self._weights(n_i).T for n_i in n])
+
+
+def heading_sweep(
+    rao,
+    wave,
+    headings,
+    heading_degrees=False,
+    coord_freq="wave",
+    coord_dirs="wave",
+    output="spectrum",
+):
+    """
+    Calculate response spectra for a sequence of vessel headings.
+
+    Equivalent to calling :func:`calculate_response` once per heading. However,
+    the RAO and the wave spectrum are interpolated in frequency only once, leaving
+    a linear interpolation in direction per heading. With ``output="var"``, the
+    frequency integrals are also shared, such that the variance for each heading is
+    a weighted sum over directions.
+
+    Parameters
+    ----------
+    rao : obj
+        Response amplitude operator (RAO) as a :class:`~waveresponse.RAO` object.
+    wave : obj
+        2-D wave spectrum as a :class:`~waveresponse.WaveSpectrum` object.
+    headings : array-like
+        1-D array of vessel headings relative to wave spectrum coordinate system.
+    heading_degrees : bool
+        Whether the headings are given in 'degrees'. If ``False``, 'radians' is assumed.
+    coord_freq : str, optional
+        Frequency coordinates for interpolation. Should be 'wave' or 'rao'. See
+        :func:`calculate_response`.
+    coord_dirs : str, optional
+        Direction coordinates for interpolation. Should be 'wave' or 'rao'. See
+        :func:`calculate_response`.
+    output : str {"spectrum", "var"}
+        Whether to return the response spectra or only their variance.
+
+    Returns
+    -------
+    freq : array
+        1-D array of response spectrum frequency coordinates in 'rad/s'. Only
+        returned if ``output="spectrum"``.
+    dirs : array (K, M)
+        Response spectrum direction coordinates in 'radians', one row per heading.
+        Only returned if ``output="spectrum"``.
+    vals : array (K, N, M)
+        Response spectrum density values (in terms of 'rad/s' and 'radians'),
+        stacked along the first axis such that ``K=len(headings)``. Only returned
+        if ``output="spectrum"``.
+    var : array (K,)
+        Response variance for each heading. Only returned if ``output="var"``.
+    """
+    headings = np.asarray_chkfinite(headings).reshape(-1)
+
+    if heading_degrees:
+        headings = (np.pi / 180.0) * headings
+
+    if output.lower() not in ("spectrum", "var"):
+        raise ValueError("Invalid `output` value. Should be 'spectrum' or 'var'.")
+    freq, _ = _response_coords(rao, wave._freq, wave._dirs, coord_freq, coord_dirs)
+
+    from ._regrid import _periodic_stencil
+
+    # Bilinear interpolation is separable; both grids are interpolated (in
+    # frequency) once, so that only a linear direction interpolation (i.e., two
+    # neighbor indices and a weight) remains per heading
+    rao_squared = rao._squared_magnitude()
+    if freq is rao._freq:
+        rao_vals = rao_squared._vals
+    else:
+        rao_vals = rao_squared.interpolate(freq, rao._dirs)
+    if freq is wave._freq:
+        wave_vals = wave._vals
+    else:
+        wave_vals = wave.interpolate(freq, wave._dirs)
+
+    if coord_dirs.lower() == "wave":
+        # The squared RAO is interpolated to the rotated wave spectrum directions
+        dirs, order = _body_dirs(rao, wave, headings)
+        idx0, idx1, t = _periodic_stencil(rao._dirs, dirs)
+        idx_rao, idx_wave = (idx0, idx1), (order, order)
+        w_dirs = _trapezoid_weights_periodic(wave._dirs)[order]
+    else:
+        # The wave spectrum is interpolated to the RAO directions (rotated back to
+        # the wave spectrum coordinate system)
+        dirs = np.tile(rao._dirs, (len(headings), 1))
+        dirs_wave = Grid._convert_dirs(
+            rao._dirs, wave.wave_convention, rao.wave_convention
+        )
+        dirs_wave = _robust_modulus(dirs_wave + headings.reshape(-1, 1), 2.0 * np.pi)
+        idx0, idx1, t = _periodic_stencil(wave._dirs, dirs_wave)
+        idx_rao, idx_wave = (np.arange(len(rao._dirs)),) * 2, (idx0, idx1)
+        w_dirs = _trapezoid_weights_periodic(rao._dirs)
+
+    if output.lower() == "var":
+        # Frequency integrals of the products of all RAO and wave spectrum
+        # directions, such that each heading only needs a weighted sum
+        w_freq = _trapezoid_weights(freq)
+        cross = (w_freq[:, np.newaxis] * rao_vals).T @ wave_vals
+        cross_0 = cross[idx_rao[0], idx_wave[0]]
+        cross_1 = cross[idx_rao[1], idx_wave[1]]
+        return np.sum(w_dirs * ((1.0 - t) * cross_0 + t * cross_1), axis=-1)
+
+    # Interpolate whole direction columns (i.e., rows of the transposed values)
+    rao_vals, wave_vals = rao_vals.T.copy(), wave_vals.T.copy()
+    if coord_dirs.lower() == "wave":
+        vals = _take_interp(rao_vals, idx0, idx1, t) * wave_vals[order]
+    else:
+        vals = _take_interp(wave_vals, idx0, idx1, t) * rao_vals
+
+    return freq.copy(), dirs, vals.transpose(0, 2, 1)
+
+
+def heading_sweep_fft(
+    rao,
+    wave,
+    heading_degrees=False,
+    coord_freq="wave",
+    coord_dirs="wave",
+):
+    """
+    Calculate the response variance for all vessel headings at the resolution of
+    a uniform direction grid (e.g., for 360-degree operability roses).
+
+    For uniformly spaced directions, the response variance as a function of heading
+    is a circular cross-correlation (along the direction axis) between the squared
+    RAO magnitude and the wave spectrum, summed over frequency. The correlation is
+    computed with FFTs, such that the cost for all ``M`` headings is ``O(N M log M)``.
+
+    The variance for each heading equals ``calculate_response(rao, wave, heading).var()``
+    with the same `coord_freq` and `coord_dirs`.
+
+    Parameters
+    ----------
+    rao : obj
+        Response amplitude operator (RAO) as a :class:`~waveresponse.RAO` object.
+    wave : obj
+        2-D wave spectrum as a :class:`~waveresponse.WaveSpectrum` object.
+    heading_degrees : bool
+        Whether to return the headings in 'degrees'. If ``False``, 'radians' is used.
+    coord_freq : str, optional
+        Frequency coordinates for interpolation. Should be 'wave' or 'rao'. See
+        :func:`calculate_response`.
+    coord_dirs : str, optional
+        Direction coordinates for interpolation. Should be 'wave' or 'rao'. See
+        :func:`calculate_response`. The direction coordinates of the chosen object
+        must be uniformly spaced, and the headings are multiples of their spacing.
+
+    Returns
+    -------
+    headings : array (M,)
+        Vessel headings relative to wave spectrum coordinate system, in [0, 360)
+        'degrees' (or [0, 2 * numpy.pi) 'radians').
+    var : array (M,)
+        Response variance for each heading.
+
+    See Also
+    --------
+    heading_sweep : Response spectra (or variance) for arbitrary headings.
+    """
+    # Wave spectrum in the RAO's convention (headings are flipped if the positive
+    # direction of rotation differs)
+    plan = _ResponsePlan(rao, wave, 0.0, coord_freq=coord_freq, coord_dirs=coord_dirs)
+    dirs = plan._dirs
+
+    step = _uniform_step(dirs)
+    if step is None:
+        raise ValueError(
+            f"Direction coordinates of the {coord_dirs.lower()} must be uniformly "
+            "spaced (and cover the full circle)."
+        )
+
+    wave_vals = plan.wave_vals(wave._vals)
+    rao_vals = plan._rao_squared
+
+    # Rotating by ``k * step`` pairs wave direction ``j`` with RAO direction
+    # ``j - k``, i.e., var[k] = sum_j S[j] * R[j - k] (per frequency)
+    n_dirs = len(dirs)
+    cross_spectrum = plan._w_freq @ (
+        np.fft.rfft(wave_vals.astype(np.float64, copy=False), axis=1)
+        * np.fft.rfft(rao_vals.astype(np.float64, copy=False), axis=1).conjugate()
+    )
+    var = step * np.fft.irfft(cross_spectrum, n=n_dirs)
+
+    if wave.wave_convention["clockwise"] != rao.wave_convention["clockwise"]:
+        var = np.roll(var[::-1], 1)
+
+    headings = step * np.arange(n_dirs)
+    if heading_degrees:
+        headings = (180.0 / np.pi) * headings
+    return headings, var
+
+
+def calculate_response_batch(
+    rao,
+    freq,
+    dirs,
+    vals,
+    heading,
+    heading_degrees=False,
+    freq_hz=False,
+    degrees=False,
+    clockwise=False,
+    waves_coming_from=True,
+):
+    """
+    Calculate response statistics for a stack of directional wave spectra.
+
+    Equivalent to constructing a :class:`~waveresponse.WaveSpectrum` for each
+    spectrum in the stack, and calling :func:`calculate_response` (with wave
+    spectrum frequency/direction coordinates). However, the RAO is interpolated
+    only once onto the (shared) wave spectrum grid, and the response statistics
+    for all spectra are computed with a single weighted reduction. No response
+    spectra are stored in memory.
+
+    Parameters
+    ----------
+    rao : obj
+        Response amplitude operator (RAO) as a :class:`~waveresponse.RAO` object.
+    freq : array-like
+        1-D array of wave spectrum frequency coordinates. Positive and monotonically
+        increasing.
+    dirs : array-like
+        1-D array of wave spectrum direction coordinates. Positive and monotonically
+        increasing. Must cover the directional range [0, 360) degrees (or [0, 2 * numpy.pi)
+        radians).
+    vals : array-like (K, N, M)
+        Wave spectrum density values. Should be a 3-D array of shape (K, N, M),
+        such that ``K`` is the number of spectra, ``N=len(freq)`` and ``M=len(dirs)``.
+        The values are assumed to be valid (i.e., real and positive) spectrum
+        densities, and are not checked.
+    heading : float
+        Heading of vessel relative to wave spectrum coordinate system.
+    heading_degrees : bool
+        Whether the heading is given in 'degrees'. If ``False``, 'radians' is assumed.
+    freq_hz : bool
+        If frequency is given in 'Hz'. If ``False``, 'rad/s' is assumed.
+    degrees : bool
+        If direction is given in 'degrees'. If ``False``, 'radians' is assumed.
+    clockwise : bool
+        If positive directions of the wave spectra are defined to be 'clockwise'.
+        If ``False``, 'counterclockwise' is assumed.
+    waves_coming_from : bool
+        If waves are 'coming from' the given directions. If ``False``, 'going towards'
+        convention is assumed.
+
+    Returns
+    -------
+    var : array (K,)
+        Response variance for each wave spectrum.
+    tz : array (K,)
+        Mean zero-crossing period of the response, in 'seconds', for each wave
+        spectrum. See :attr:`DirectionalSpectrum.tz`.
+    """
+    vals = np.asarray(vals)
+
+    # Validates the wave spectrum coordinates and takes care of unit conversion
+    wave = WaveSpectrum(
+        freq,
+        dirs,
+        np.zeros((len(freq), len(dirs))),
+        freq_hz=freq_hz,
+        degrees=degrees,
+        clockwise=clockwise,
+        waves_coming_from=waves_coming_from,
+    )
+
+    if vals.ndim != 3 or vals.shape[1:] != wave._vals.shape:
+        raise ValueError(
+            "Values must have shape (K, N, M), such that ``N=len(freq)`` "
+            "and ``M=len(dirs)``."
+        )
+
+    if heading_degrees:
+        heading = (np.pi / 180.0) * heading
+
+    scale = 1.0
+    if freq_hz:
+        scale /= 2.0 * np.pi
+    if degrees and len(wave._dirs) > 1:
+        scale *= 180.0 / np.pi
+
+    plan = _ResponsePlan(rao, wave, heading)
+    m0, m2 = scale * plan.moments(vals, n=(0, 2))[..., 0]
+
+    tz = 2.0 * np.pi * np.sqrt(m0 / m2)
+    return m0, tz
 
 
 class BaseSpreading(ABC):
@@ -1899,6 +3042,16 @@ class BaseSpreading(ABC):
     degrees : bool
         If directions passed to the spreading function will be given in 'degrees'.
         If ``False``, 'radians' is assumed.
+
+    Notes
+    -----
+    Custom spreading functions are implemented by subclassing, and overriding
+    ``_spread_fun(omega, theta)``. The spreading function receives (broadcastable)
+    arrays of frequency coordinates in 'rad/s' and direction coordinates in
+    [0, 2 * pi) 'radians', and should be normalized such that it integrates to
+    ``2 * pi`` over the directional range. Unit conversion, scaling and broadcasting
+    are handled by the base class. Constants (e.g., normalization constants) should
+    be computed once during initialization.
     """
 
     def __init__(self, freq_hz=False, degrees=False):
@@ -1907,17 +3060,26 @@ class BaseSpreading(ABC):
 
     def __call__(self, frequency, direction):
         """
-        Get spreading value for given frequency/direction coordinate.
+        Get spreading value for given frequency/direction coordinates.
 
         Parameters
         ----------
-        frequency : float
-            Frequency coordinate. Units should be according to the `freq_hz` flag
-            given during initialization.
-        direction : float
-            Direction coordinate. Units should be according to the `degrees` flag
-            given during initialization.
+        frequency : float or array-like
+            Frequency coordinate(s). Units should be according to the `freq_hz`
+            flag given during initialization.
+        direction : float or array-like
+            Direction coordinate(s). Units should be according to the `degrees`
+            flag given during initialization. Must be broadcastable with `frequency`.
+
+        Returns
+        -------
+        float or array :
+            Spreading value(s), with the broadcast shape of `frequency` and
+            `direction`.
         """
+        frequency = np.asarray(frequency)
+        direction = np.asarray(direction)
+
         if self._freq_hz:
             frequency = 2.0 * np.pi * frequency
 
@@ -1927,25 +3089,46 @@ class BaseSpreading(ABC):
         else:
             scale = 1.0 / (2.0 * np.pi)
 
-        return scale * self._spread_fun(
+        spread = scale * self._spread_fun(
             frequency, _robust_modulus(direction, 2.0 * np.pi)
         )
+        if frequency.ndim > 0 and np.shape(spread) != frequency.shape:
+            # Frequency-independent spreading
+            spread = np.broadcast_to(
+                spread, np.broadcast_shapes(frequency.shape, direction.shape)
+            )
+        return spread[()]
 
     @abstractmethod
     def _spread_fun(self, omega, theta):
         """
-        Get spreading value for given frequency/direction coordinate.
+        Get spreading value for given frequency/direction coordinates.
 
         Parameters
         ----------
-        omega : float
-            Frequency coordinate in 'rad/s'.
-        direction : float
-            Direction coordinate in 'radians'.
+        omega : array
+            Frequency coordinate(s) in 'rad/s'.
+        theta : array
+            Direction coordinate(s) in 'radians', in the range [0, 2 * pi).
+            Broadcastable with `omega`.
         """
         raise NotImplementedError()
 
 
+def _cosine_2s_constant(s, full):
+    """
+    Normalization constant, C(s), of cosine-2s type spreading functions.
+
+    Computed in log-space, so that it does not overflow for large `s`.
+    """
+    log_c = (
+        (2 * s + (0 if full else 1)) * math.log(2.0)
+        + 2.0 * math.lgamma(s + 1)
+        - math.lgamma(2 * s + 1)
+    )
+    return math.exp(log_c)
+
+
 class CosineHalfSpreading(BaseSpreading):
     """
     Cosine-2s type spreading (half directional range).
@@ -1992,15 +3175,15 @@ class CosineHalfSpreading(BaseSpreading):
 
     def __init__(self, s=1, degrees=False):
         self._s = s
+        self._c = _cosine_2s_constant(s, full=False)
         super().__init__(degrees=degrees)
 
     def _spread_fun(self, _, theta, /):
-        if (np.pi / 2.0) <= theta <= (3.0 * np.pi / 2.0):
-            return 0
-
-        s = self._s
-        c = 2 ** (2 * s + 1) * gamma(s + 1) ** 2 / gamma(2 * s + 1)
-        return c * (np.cos(theta) ** 2.0) ** s
+        return np.where(
+            ((np.pi / 2.0) <= theta) & (theta <= (3.0 * np.pi / 2.0)),
+            0.0,
+            self._c * (np.cos(theta) ** 2.0) ** self._s,
+        )
 
 
 class CosineFullSpreading(BaseSpreading):
@@ -2047,9 +3230,8 @@ class CosineFullSpreading(BaseSpreading):
 
     def __init__(self, s=1, degrees=False):
         self._s = s
+        self._c = _cosine_2s_constant(s, full=True)
         super().__init__(degrees=degrees)
 
     def _spread_fun(self, _, theta, /):
-        s = self._s
-        c = 2 ** (2 * s) * gamma(s + 1) ** 2 / gamma(2 * s + 1)
-        return c * (np.cos(theta / 2.0) ** 2.0) ** s
+        return self._c * (np.cos(theta / 2.0) ** 2.0) ** self._s
@@ -0,0 +1,490 @@
+import functools
+import json
+from pathlib import Path
+
+import numpy as np
+
+from ._core import RAO, DirectionalSpectrum, Grid, WaveSpectrum
+
+_GRID_TYPES = {
+    "Grid": Grid,
+    "RAO": RAO,
+    "DirectionalSpectrum": DirectionalSpectrum,
+    "WaveSpectrum": WaveSpectrum,
+}
+
+_KEYS_METADATA = b"waveresponse.keys"
+
+
+@functools.cache
+def _schema():
+    """
+    File schema, with one row (record batch / row group) per grid.
+
+    Coordinates are stored in 'rad/s' and 'radians', and complex values are stored
+    as interleaved real and imaginary parts, so that they can be read without
+    copying. Values are stored in their own precision; double precision values in
+    the 'vals' column and single precision values in the 'vals_float32' column
+    (the other column is null).
+    """
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("key", pa.string()),
+            ("type", pa.string()),
+            ("freq", pa.list_(pa.float64())),
+            ("dirs", pa.list_(pa.float64())),
+            ("vals", pa.list_(pa.float64())),
+            ("vals_float32", pa.list_(pa.float32())),
+            ("complex", pa.bool_()),
+            ("freq_hz", pa.bool_()),
+            ("degrees", pa.bool_()),
+            ("clockwise", pa.bool_()),
+            ("waves_coming_from", pa.bool_()),
+            ("phase_degrees", pa.bool_()),
+            ("phase_leading", pa.bool_()),
+        ]
+    )
+
+
+_COORD_COLUMNS = ["freq", "dirs", "freq_hz", "degrees"]
+
+
+def _is_parquet(path, file_format):
+    """
+    Whether to use Parquet (or Arrow IPC) file format.
+    """
+    if file_format is None:
+        return Path(path).suffix.lower() in (".parquet", ".pq")
+    elif file_format.lower() == "parquet":
+        return True
+    elif file_format.lower() == "arrow":
+        return False
+    else:
+        raise ValueError("Invalid `format` value. Should be 'arrow' or 'parquet'.")
+
+
+def _list_array(arr):
+    """
+    Single-row list array from a 1-D array.
+    """
+    import pyarrow as pa
+
+    return pa.ListArray.from_arrays(pa.array([0, len(arr)], pa.int32()), pa.array(arr))
+
+
+def _to_record_batch(key, grid):
+    """
+    Convert a grid object to a (single-row) record batch.
+    """
+    import pyarrow as pa
+
+    type_name = type(grid).__name__
+    if _GRID_TYPES.get(type_name) is not type(grid):
+        raise ValueError(
+            "Grid objects must be of type 'Grid', 'RAO', 'DirectionalSpectrum' "
+            "or 'WaveSpectrum'."
+        )
+
+    is_complex = np.iscomplexobj(grid._vals)
+    if grid._vals.dtype in (np.float32, np.complex64):
+        real_dtype = np.float32
+    else:
+        real_dtype = np.float64
+    vals = np.ascontiguousarray(
+        grid._vals, dtype=np.result_type(real_dtype, grid._vals.dtype)
+    )
+    vals = _list_array(vals.reshape(-1).view(real_dtype))
+    vals_null = pa.array([None], vals.type)
+    is_rao = isinstance(grid, RAO)
+
+    return pa.record_batch(
+        [
+            pa.array([str(key)]),
+            pa.array([type_name]),
+            _list_array(np.asarray(grid._freq, dtype=float)),
+            _list_array(np.asarray(grid._dirs, dtype=float)),
+            vals if real_dtype is np.float64 else vals_null,
+            vals if real_dtype is np.float32 else vals_null,
+            pa.array([is_complex]),
+            pa.array([grid._freq_hz]),
+            pa.array([grid._degrees]),
+            pa.array([grid._clockwise]),
+            pa.array([grid._waves_coming_from]),
+            pa.array([grid._phase_degrees if is_rao else None], pa.bool_()),
+            pa.array([grid._phase_leading if is_rao else None], pa.bool_()),
+        ],
+        schema=_schema(),
+    )
+
+
+def write_library(path, grids, format=None):
+    """
+    Write a library of grid objects (e.g., RAOs and wave spectra) to file.
+
+    The grids are stored in Arrow IPC or Parquet file format, with one row (record
+    batch or row group) per grid, so that a single grid can be read from the
+    library without reading the others. Grid values are stored (and read) in
+    their own precision (e.g., single precision). See :class:`GridLibrary`.
+
+    Parameters
+    ----------
+    path : str or path-like
+        File path.
+    grids : dict
+        Grid objects (:class:`~waveresponse.Grid`, :class:`~waveresponse.RAO`,
+        :class:`~waveresponse.DirectionalSpectrum` or :class:`~waveresponse.WaveSpectrum`),
+        given as a mapping from (unique) keys to grids. The keys are converted to
+        strings.
+    format : {'arrow', 'parquet'}, optional
+        File format. If ``None``, Parquet is used for files with '.parquet' or '.pq'
+        extension, and Arrow IPC otherwise. Arrow IPC files can be memory-mapped
+        and read without copying.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    keys = [str(key) for key in grids]
+    if len(set(keys)) != len(keys):
+        raise ValueError("Grid keys must be unique.")
+
+    schema = _schema().with_metadata({_KEYS_METADATA: json.dumps(keys)})
+    batches = (_to_record_batch(key, grid) for key, grid in zip(keys, grids.values()))
+
+    if _is_parquet(path, format):
+        with pq.ParquetWriter(str(path), schema) as writer:
+            for batch in batches:
+                writer.write_batch(batch, row_group_size=1)
+    else:
+        with pa.OSFile(str(path), "wb") as sink:
+            with pa.ipc.new_file(sink, schema) as writer:
+                for batch in batches:
+                    writer.write_batch(batch)
+
+
+class GridLibrary:
+    """
+    Library of grid objects stored in file (see :func:`write_library`).
+
+    Opening a library only reads the file metadata. Grids are read (lazily) when
+    accessed, and only the row and columns belonging to the requested grid are
+    read. Arrow IPC files are memory-mapped, and values are read without copying.
+
+    Parameters
+    ----------
+    path : str or path-like
+        File path.
+    format : {'arrow', 'parquet'}, optional
+        File format. If ``None``, Parquet is assumed for files with '.parquet' or
+        '.pq' extension, and Arrow IPC otherwise.
+    memory_map : bool
+        Whether to memory-map the file.
+
+    Examples
+    --------
+    >>> wr.write_library("raos.arrow", {"vessel_a/ballast/heave": rao_heave, ...})
+    >>> with wr.GridLibrary("raos.arrow") as library:
+    ...     rao_heave = library["vessel_a/ballast/heave"]
+    """
+
+    def __init__(self, path, format=None, memory_map=True):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._path = path
+        self._parquet = _is_parquet(path, format)
+
+        if self._parquet:
+            self._file = pq.ParquetFile(str(path), memory_map=memory_map)
+            metadata = self._file.schema_arrow.metadata
+        else:
+            if memory_map:
+                self._source = pa.memory_map(str(path), "r")
+            else:
+                self._source = pa.OSFile(str(path), "rb")
+            self._file = pa.ipc.open_file(self._source)
+            metadata = self._file.schema.metadata
+
+        keys = json.loads(metadata[_KEYS_METADATA])
+        self._index = {key: i for i, key in enumerate(keys)}
+
+    def close(self):
+        """Close the underlying file."""
+        if self._parquet:
+            self._file.close()
+        else:
+            self._source.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def keys(self):
+        """Grid keys."""
+        return list(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def _read(self, key, columns):
+        """
+        Read the given columns of a grid's row, as a dict of (Arrow) arrays.
+        """
+        try:
+            i = self._index[key]
+        except KeyError:
+            raise KeyError(f"No grid with key '{key}' in library.")
+
+        if self._parquet:
+            table = self._file.read_row_group(i, columns=columns)
+            return {name: table.column(name).combine_chunks() for name in columns}
+        else:
+            batch = self._file.get_batch(i)
+            return {name: batch.column(name) for name in columns}
+
+    @staticmethod
+    def _to_numpy(list_array):
+        return list_array.flatten().to_numpy(zero_copy_only=False)
+
+    def coords(self, key):
+        """
+        Frequency and direction coordinates of a grid, without reading its values.
+
+        Parameters
+        ----------
+        key : str
+            Grid key.
+
+        Returns
+        -------
+        freq : array
+            1-D array of grid frequency coordinates, in the grid's default units.
+        dirs : array
+            1-D array of grid direction coordinates, in the grid's default units.
+        """
+        columns = self._read(key, _COORD_COLUMNS)
+        freq = self._to_numpy(columns["freq"])
+        dirs = self._to_numpy(columns["dirs"])
+
+        if columns["freq_hz"][0].as_py():
+            freq = 1.0 / (2.0 * np.pi) * freq
+        if columns["degrees"][0].as_py():
+            dirs = (180.0 / np.pi) * dirs
+        return freq, dirs
+
+    def __getitem__(self, key):
+        """
+        Read a grid object.
+
+        Parameters
+        ----------
+        key : str
+            Grid key.
+
+        Returns
+        -------
+        obj :
+            Grid object (of the stored type). Note that the arrays of the object
+            may be read-only views of the (memory-mapped) file.
+        """
+        columns = self._read(key, _schema().names[1:])
+        scalars = {name: columns[name][0].as_py() for name in _schema().names[6:]}
+
+        freq = self._to_numpy(columns["freq"])
+        dirs = self._to_numpy(columns["dirs"])
+        if columns["vals"].null_count:
+            vals = self._to_numpy(columns["vals_float32"])
+        else:
+            vals = self._to_numpy(columns["vals"])
+        if scalars["complex"]:
+            vals = vals.view(np.result_type(vals.dtype, np.complex64))
+        vals = vals.reshape(len(freq), len(dirs))
+
+        type_ = _GRID_TYPES[columns["type"][0].as_py()]
+        grid = type_._new(
+            freq,
+            dirs,
+            vals,
+            freq_hz=scalars["freq_hz"],
+            degrees=scalars["degrees"],
+            clockwise=scalars["clockwise"],
+            waves_coming_from=scalars["waves_coming_from"],
+        )
+        if isinstance(grid, RAO):
+            grid._phase_degrees = scalars["phase_degrees"]
+            grid._phase_leading = scalars["phase_leading"]
+        return grid
+
+    def __repr__(self):
+        return f"GridLibrary({len(self)} grids)"
+
+
+class ResultsWriter:
+    """
+    Streaming writer of response statistics to a Parquet file.
+
+    Results are appended as they are computed, and buffered only until a full row
+    group is available, which is then written to file. Memory usage is thus bounded
+    by the row group size, regardless of the total number of results.
+
+    Parameters
+    ----------
+    path : str or path-like
+        File path.
+    row_group_size : int
+        Number of rows per row group.
+
+    Examples
+    --------
+    >>> with wr.ResultsWriter("results.parquet") as writer:
+    ...     for time, wave in hindcast:
+    ...         response = wr.calculate_response(rao, wave, heading)
+    ...         writer.append_response(response, t=3 * 3600.0, time=time, dof="heave")
+    """
+
+    def __init__(self, path, row_group_size=65_536):
+        if row_group_size < 1:
+            raise ValueError("`row_group_size` must be a positive integer.")
+
+        self._path = path
+        self._row_group_size = row_group_size
+        self._writer = None
+        self._schema = None
+        self._names = None
+        self._buffer = []
+        self._n_buffered = 0
+        self._n_rows = 0
+
+    @property
+    def n_rows(self):
+        """Number of rows appended."""
+        return self._n_rows
+
+    def append(self, **columns):
+        """
+        Append rows of results.
+
+        Parameters
+        ----------
+        **columns :
+            Column values, given as scalars or 1-D arrays (one value per row).
+            Scalars are repeated for all rows. The same columns must be given
+            for all appends.
+        """
+        names = list(columns)
+        if self._names is None:
+            if not names:
+                raise ValueError("At least one column must be given.")
+            self._names = names
+        elif names != self._names:
+            raise ValueError(
+                f"Columns must be the same for all appends. Expected {self._names}."
+            )
+
+        try:
+            arrays = np.broadcast_arrays(*(np.asarray(v) for v in columns.values()))
+        except ValueError:
+            raise ValueError("Column values must have the same length.")
+        if arrays[0].ndim > 1:
+            raise ValueError("Column values must be scalars or 1-D arrays.")
+
+        arrays = [np.atleast_1d(arr) for arr in arrays]
+        self._buffer.append(arrays)
+        self._n_buffered += len(arrays[0])
+        self._n_rows += len(arrays[0])
+
+        if self._n_buffered >= self._row_group_size:
+            self._write(full_row_groups_only=True)
+
+    def append_response(self, response, t=None, q=0.37, absmax=False, **labels):
+        """
+        Append statistics of a response spectrum.
+
+        The standard deviation ('std'), mean zero-crossing period ('tz') and, if
+        a duration is given, the q-th quantile extreme value ('extreme') are appended,
+        together with the given labels. If several quantiles are given, one row is
+        appended per quantile, and the quantiles are written to a 'q' column.
+
+        Parameters
+        ----------
+        response : obj
+            Response spectrum as :class:`~waveresponse.DirectionalSpectrum` object.
+        t : float, optional
+            Duration in seconds used for the extreme value. See
+            :meth:`~waveresponse.DirectionalSpectrum.extreme`.
+        q : float or array-like
+            Quantile(s) used for the extreme value.
+        absmax : bool
+            Whether to compute absolute value extremes.
+        **labels :
+            Additional columns (e.g., time, heading, degree-of-freedom and location).
+        """
+        stats = {"std": response.std(), "tz": response.tz}
+        if t is not None:
+            if np.ndim(q) > 0:
+                stats["q"] = q
+            stats["extreme"] = response.extreme(t, q=q, absmax=absmax)
+        self.append(**labels, **stats)
+
+    def _write(self, full_row_groups_only=False, schema_only=False):
+        """
+        Write buffered rows to file. If `schema_only` is ``True``, the file is
+        created even if there are no buffered rows.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if not (self._n_buffered or schema_only):
+            return
+
+        columns = [np.concatenate(arrays) for arrays in zip(*self._buffer)]
+        n_write = self._n_buffered
+        if full_row_groups_only:
+            n_write -= n_write % self._row_group_size
+
+        table = pa.table([column[:n_write] for column in columns], names=self._names)
+        if self._writer is None:
+            self._schema = table.schema
+            self._writer = pq.ParquetWriter(str(self._path), self._schema)
+        else:
+            table = table.cast(self._schema)
+        if n_write:
+            self._writer.write_table(table, row_group_size=self._row_group_size)
+
+        self._buffer = [[column[n_write:] for column in columns]]
+        self._n_buffered -= n_write
+
+    def flush(self):
+        """
+        Write all buffered rows to file (as a, possibly smaller, row group).
+        """
+        self._write()
+
+    def close(self):
+        """
+        Write remaining rows and close the file.
+
+        If only empty appends (i.e., with zero rows) are made, a file without rows
+        is written, with the columns of the appends. If nothing is appended, no
+        file is written.
+        """
+        self._write(schema_only=self._writer is None and bool(self._buffer))
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self._buffer = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,152 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from ._core import calculate_response
+
+# RAO objects shipped to a worker process once (see ``_init_worker``)
+_WORKER_RAOS = None
+
+
+def _init_worker(raos):
+    """
+    Initialize worker process with the (unique) RAO objects of the jobs.
+    """
+    global _WORKER_RAOS
+    _WORKER_RAOS = raos
+
+
+def _response_output(response, output):
+    """
+    Reduce a response spectrum to the requested output.
+    """
+    if output == "spectrum":
+        return response
+    elif output == "var":
+        return response.var()
+    elif output == "std":
+        return response.std()
+
+
+def _response_chunk(tasks, raos=None, **kwargs):
+    """
+    Calculate responses for a chunk of ``(rao_index, wave, heading)`` tasks.
+    """
+    if raos is None:
+        raos = _WORKER_RAOS
+
+    output = kwargs.pop("output")
+    return [
+        _response_output(
+            calculate_response(raos[rao_index], wave, heading, **kwargs), output
+        )
+        for rao_index, wave, heading in tasks
+    ]
+
+
+def calculate_response_parallel(
+    jobs,
+    heading_degrees=False,
+    coord_freq="wave",
+    coord_dirs="wave",
+    output="spectrum",
+    max_workers=None,
+    chunksize=None,
+    mp_context=None,
+):
+    """
+    Calculate responses for many (RAO, wave spectrum, heading) combinations in
+    parallel, using a pool of worker processes.
+
+    Each job is evaluated with :func:`~waveresponse.calculate_response`. The
+    jobs are split into chunks, and each chunk is evaluated by one worker process.
+    The RAO objects are sent to each worker process only once (when the process
+    is started), so that only the wave spectra and headings are sent per chunk.
+    RAO objects backed by shared memory (see :meth:`~waveresponse.Grid.share_memory`)
+    are sent as small handles, and read by the worker processes without copying.
+
+    Parameters
+    ----------
+    jobs : iterable
+        Sequence of ``(rao, wave, heading)`` tuples, where ``rao`` is an
+        :class:`~waveresponse.RAO` object, ``wave`` is a :class:`~waveresponse.WaveSpectrum`
+        object, and ``heading`` is the heading of the vessel relative to the wave
+        spectrum coordinate system.
+    heading_degrees : bool
+        Whether the headings are given in 'degrees'. If ``False``, 'radians' is assumed.
+    coord_freq : str, optional
+        Frequency coordinates for interpolation. Should be 'wave' or 'rao'. See
+        :func:`~waveresponse.calculate_response`.
+    coord_dirs : str, optional
+        Direction coordinates for interpolation. Should be 'wave' or 'rao'. See
+        :func:`~waveresponse.calculate_response`.
+    output : {'spectrum', 'var', 'std'}
+        Output type. If 'spectrum' (default), the response spectra are returned
+        as :class:`~waveresponse.DirectionalSpectrum` objects. If 'var' or 'std',
+        only the variance or standard deviation of each response is returned
+        (which is much cheaper to send back from the worker processes).
+    max_workers : int, optional
+        Number of worker processes. Defaults to the number of CPUs. If ``1``, the
+        jobs are evaluated in the current process.
+    chunksize : int, optional
+        Number of jobs per chunk. Defaults to splitting the jobs in (about) four
+        chunks per worker process.
+    mp_context : multiprocessing context, optional
+        Context used to start the worker processes. See
+        ``concurrent.futures.ProcessPoolExecutor``.
+
+    Returns
+    -------
+    list :
+        Responses, in the same order as the given jobs.
+    """
+    if output not in ("spectrum", "var", "std"):
+        raise ValueError(
+            "Invalid `output` value. Should be 'spectrum', 'var' or 'std'."
+        )
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 1:
+        raise ValueError("`max_workers` must be a positive integer.")
+
+    # Replace RAO objects by indices to the unique RAOs
+    raos, rao_index, tasks = [], {}, []
+    for job in jobs:
+        try:
+            rao, wave, heading = job
+        except (TypeError, ValueError):
+            raise ValueError("Each job must be a tuple of (rao, wave, heading).")
+        if id(rao) not in rao_index:
+            rao_index[id(rao)] = len(raos)
+            raos.append(rao)
+        tasks.append((rao_index[id(rao)], wave, heading))
+
+    if not tasks:
+        return []
+
+    if chunksize is None:
+        chunksize = max(1, -(-len(tasks) // (4 * max_workers)))
+    if chunksize < 1:
+        raise ValueError("`chunksize` must be a positive integer.")
+
+    chunks = [tasks[i : i + chunksize] for i in range(0, len(tasks), chunksize)]
+    kwargs = dict(
+        heading_degrees=heading_degrees,
+        coord_freq=coord_freq,
+        coord_dirs=coord_dirs,
+        output=output,
+    )
+
+    if max_workers == 1 or len(chunks) == 1:
+        results = [_response_chunk(chunk, raos=raos, **kwargs) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(chunks)),
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(raos,),
+        ) as executor:
+            results = list(executor.map(partial(_response_chunk, **kwargs), chunks))
+
+    return [response for chunk in results for response in chunk]
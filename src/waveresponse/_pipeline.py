@@ -0,0 +1,108 @@
+from itertools import islice
+
+import numpy as np
+
+from ._core import WaveSpectrum, _ResponsePlan
+
+
+def response_stats_stream(
+    rao,
+    waves,
+    heading,
+    heading_degrees=False,
+    coord_freq="wave",
+    coord_dirs="wave",
+    chunksize=1000,
+):
+    """
+    Stream response statistics for an iterable of wave spectra (e.g., a hindcast).
+
+    The wave spectra are consumed (lazily) in chunks, and the response statistics
+    of each chunk are yielded as soon as they are computed. Memory usage is thus
+    determined by the chunk size, and not by the total number of wave spectra.
+
+    The results are equivalent to calling :func:`~waveresponse.calculate_response`
+    for each wave spectrum, and computing the statistics of the response spectrum
+    (i.e., :meth:`~waveresponse.DirectionalSpectrum.std` and
+    :attr:`~waveresponse.DirectionalSpectrum.tz`). However, the rotation, convention
+    conversion, interpolation and integration are precomputed once for all wave spectra
+    sharing the same coordinates, and applied to a whole chunk at a time.
+
+    Parameters
+    ----------
+    rao : obj
+        Response amplitude operator (RAO) as a :class:`~waveresponse.RAO` object,
+        or a :class:`~waveresponse.RAOSet` object.
+    waves : iterable
+        Wave spectra as :class:`~waveresponse.WaveSpectrum` objects. Consecutive
+        wave spectra will usually share coordinates, which is when the precomputed
+        calculation is reused.
+    heading : float
+        Heading of vessel relative to wave spectrum coordinate system.
+    heading_degrees : bool
+        Whether the heading is given in 'degrees'. If ``False``, 'radians' is assumed.
+    coord_freq : str, optional
+        Frequency coordinates for interpolation. Should be 'wave' or 'rao'. See
+        :func:`~waveresponse.calculate_response`.
+    coord_dirs : str, optional
+        Direction coordinates for interpolation. Should be 'wave' or 'rao'. See
+        :func:`~waveresponse.calculate_response`.
+    chunksize : int
+        Number of wave spectra per chunk.
+
+    Yields
+    ------
+    std : array (K,) or (K, 6)
+        Standard deviation of the response for each wave spectrum in the chunk.
+        If `rao` is an RAO set, there is one column per degree-of-freedom.
+    tz : array (K,) or (K, 6)
+        Mean zero-crossing period of the response, in 'seconds', for each wave
+        spectrum in the chunk.
+    """
+    if chunksize < 1:
+        raise ValueError("`chunksize` must be a positive integer.")
+
+    if heading_degrees:
+        heading = (np.pi / 180.0) * heading
+
+    single = np.ndim(rao._vals) == 2
+    waves = iter(waves)
+    plan = None
+
+    while chunk := list(islice(waves, chunksize)):
+        for wave in chunk:
+            if not isinstance(wave, WaveSpectrum):
+                raise ValueError(
+                    "Wave spectra must be of type 'waveresponse.WaveSpectrum'."
+                )
+
+        m0, m2 = [], []
+        # Process runs of wave spectra sharing the same coordinates
+        start = 0
+        while start < len(chunk):
+            if plan is None or not plan.matches(chunk[start]):
+                plan = _ResponsePlan(
+                    rao,
+                    chunk[start],
+                    heading,
+                    coord_freq=coord_freq,
+                    coord_dirs=coord_dirs,
+                )
+            stop = start + 1
+            while stop < len(chunk) and plan.matches(chunk[stop]):
+                stop += 1
+
+            vals = np.stack([wave._vals for wave in chunk[start:stop]])
+            m0_i, m2_i = plan.moments(vals, n=(0, 2))
+            m0.append(m0_i)
+            m2.append(m2_i)
+            start = stop
+
+        m0 = np.concatenate(m0)
+        m2 = np.concatenate(m2)
+        std = np.sqrt(m0)
+        tz = 2.0 * np.pi * np.sqrt(m0 / m2)
+
+        if single:
+            std, tz = std[:, 0], tz[:, 0]
+        yield std, tz
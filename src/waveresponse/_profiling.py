@@ -0,0 +1,283 @@
+import atexit
+import functools
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Profiles currently collecting records. Instrumented functions only do work
+# when this list is non-empty.
+_ACTIVE = []
+
+# Allocation tracking state for nested stages; one ``[start, peak]`` pair per
+# instrumented call in progress (see ``_instrument``)
+_MEMORY_STACK = []
+
+# Number of active profiles tracking memory, and whether ``tracemalloc`` was
+# started by this module (and should thus be stopped by it)
+_MEMORY_USERS = 0
+_MEMORY_OWNER = False
+
+
+class ProfileResult:
+    """
+    Call counts, wall time and allocated memory of the internal stages of
+    ``waveresponse`` (e.g., interpolation, copying, validation and integration).
+
+    Profile results are created and activated with :func:`~waveresponse.profile`.
+
+    Notes
+    -----
+    Stages may be nested (e.g., ``Grid.reshape`` calls ``Grid._interpolate_function``).
+    The time and memory of a stage include that of its nested stages.
+    """
+
+    _COLUMNS = ["calls", "total_time", "mean_time", "max_bytes", "total_bytes"]
+
+    def __init__(self, memory=True):
+        self._memory = memory
+        self._records = {}
+
+    @property
+    def memory(self):
+        """
+        Whether memory allocations are tracked.
+        """
+        return self._memory
+
+    def _add(self, stage, elapsed, nbytes):
+        """
+        Add one call record for a stage.
+        """
+        record = self._records.get(stage)
+        if record is None:
+            record = self._records[stage] = [0, 0.0, 0, 0]
+        record[0] += 1
+        record[1] += elapsed
+        if nbytes is not None:
+            record[2] = max(record[2], nbytes)
+            record[3] += nbytes
+
+    def reset(self):
+        """
+        Remove all records.
+        """
+        self._records = {}
+
+    @property
+    def stats(self):
+        """
+        Summary of each recorded stage, as a dictionary mapping stage names to
+        dictionaries with the keys:
+
+        * 'calls': number of calls.
+        * 'total_time': total wall time in 'seconds'.
+        * 'mean_time': mean wall time per call in 'seconds'.
+        * 'max_bytes': peak memory allocated during a single call, in bytes.
+        * 'total_bytes': sum of the peak memory allocated over all calls, in bytes.
+
+        The memory entries are ``None`` if memory allocations are not tracked.
+        """
+        stats = {}
+        for stage, (calls, total_time, max_bytes, total_bytes) in sorted(
+            self._records.items(), key=lambda item: -item[1][1]
+        ):
+            stats[stage] = {
+                "calls": calls,
+                "total_time": total_time,
+                "mean_time": total_time / calls,
+                "max_bytes": max_bytes if self._memory else None,
+                "total_bytes": total_bytes if self._memory else None,
+            }
+        return stats
+
+    def to_dataframe(self):
+        """
+        Summary table of the recorded stages, sorted by total time.
+
+        Returns
+        -------
+        pandas.DataFrame :
+            One row per stage (index), with the columns described in
+            :attr:`~waveresponse.ProfileResult.stats`.
+        """
+        import pandas as pd
+
+        df = pd.DataFrame.from_dict(self.stats, orient="index", columns=self._COLUMNS)
+        df.index.name = "stage"
+        return df
+
+    def summary(self):
+        """
+        Summary table of the recorded stages, as a formatted string.
+        """
+        if not self._records:
+            return "No stages recorded."
+
+        def fmt(value):
+            if value is None:
+                return "-"
+            elif isinstance(value, float):
+                return f"{value:.6f}"
+            return str(value)
+
+        rows = [["stage"] + self._COLUMNS] + [
+            [stage] + [fmt(stats_i[column]) for column in self._COLUMNS]
+            for stage, stats_i in self.stats.items()
+        ]
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        return "\n".join(
+            "  ".join(
+                [row[0].ljust(widths[0])]
+                + [value.rjust(width) for value, width in zip(row[1:], widths[1:])]
+            )
+            for row in rows
+        )
+
+    def __repr__(self):
+        return f"ProfileResult({len(self._records)} stages)"
+
+
+def _memory_start():
+    global _MEMORY_USERS, _MEMORY_OWNER
+    if _MEMORY_USERS == 0 and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _MEMORY_OWNER = True
+    _MEMORY_USERS += 1
+
+
+def _memory_stop():
+    global _MEMORY_USERS, _MEMORY_OWNER
+    _MEMORY_USERS -= 1
+    if _MEMORY_USERS == 0 and _MEMORY_OWNER:
+        tracemalloc.stop()
+        _MEMORY_OWNER = False
+
+
+def _activate(prof):
+    if prof.memory:
+        _memory_start()
+    _ACTIVE.append(prof)
+
+
+def _deactivate(prof):
+    _ACTIVE.remove(prof)
+    if prof.memory:
+        _memory_stop()
+
+
+@contextmanager
+def profile(memory=True):
+    """
+    Context manager recording call counts, wall time and allocated memory of the
+    internal stages of ``waveresponse`` while active.
+
+    Instrumentation is opt-in; outside of this context manager, the instrumented
+    stages run with (close to) no overhead. Alternatively, instrumentation can be
+    enabled for a whole session by setting the environment variable
+    ``WAVERESPONSE_PROFILE=1``, in which case the summary table is written to
+    standard error at exit. Session-wide profiles only record call counts and wall
+    time, unless ``WAVERESPONSE_PROFILE=memory`` is set; memory tracing slows down
+    the code considerably (see `memory`).
+
+    Parameters
+    ----------
+    memory : bool
+        Whether to track the (peak) memory allocated by each stage. Memory is traced
+        with ``tracemalloc``, which slows down the code considerably. Set to
+        ``False`` for more reliable timings.
+
+    Yields
+    ------
+    obj :
+        :class:`~waveresponse.ProfileResult` object with the recorded stages.
+
+    Examples
+    --------
+    >>> with wr.profile() as prof:
+    ...     response = wr.calculate_response(rao, wave, heading)
+    ...     std = response.std()
+    >>> print(prof.summary())
+    """
+    prof = ProfileResult(memory=memory)
+    _activate(prof)
+    try:
+        yield prof
+    finally:
+        _deactivate(prof)
+
+
+def _record(stage, fun, args, kwargs):
+    """
+    Call a function, and add a record to the active profiles.
+    """
+    memory = _MEMORY_USERS > 0 and tracemalloc.is_tracing()
+
+    if memory:
+        if _MEMORY_STACK:
+            # Store the peak of the enclosing stage before resetting the peak
+            parent = _MEMORY_STACK[-1]
+            parent[1] = max(parent[1], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        frame = [tracemalloc.get_traced_memory()[0], 0]
+        _MEMORY_STACK.append(frame)
+
+    t0 = time.perf_counter()
+    try:
+        return fun(*args, **kwargs)
+    finally:
+        elapsed = time.perf_counter() - t0
+
+        nbytes = None
+        if memory:
+            _MEMORY_STACK.pop()
+            peak = max(frame[1], tracemalloc.get_traced_memory()[1])
+            nbytes = max(peak - frame[0], 0)
+            if _MEMORY_STACK:
+                parent = _MEMORY_STACK[-1]
+                parent[1] = max(parent[1], peak)
+
+        for prof in _ACTIVE:
+            prof._add(stage, elapsed, nbytes if prof.memory else None)
+
+
+def _instrument(fun):
+    """
+    Decorator registering a function as an instrumented stage (named by its
+    qualified name).
+
+    When no profile is active, the only overhead is a check of the active profiles.
+    """
+    stage = fun.__qualname__
+
+    @functools.wraps(fun)
+    def wrapper(*args, **kwargs):
+        if not _ACTIVE:
+            return fun(*args, **kwargs)
+        return _record(stage, fun, args, kwargs)
+
+    return wrapper
+
+
+def _profile_from_env():
+    """
+    Enable session-wide instrumentation if the ``WAVERESPONSE_PROFILE``
+    environment variable is set. Memory is only tracked if the variable is set to
+    'memory'.
+    """
+    value = os.environ.get("WAVERESPONSE_PROFILE", "").lower()
+    if value in ("", "0", "false"):
+        return None
+
+    prof = ProfileResult(memory=value == "memory")
+    _activate(prof)
+
+    @atexit.register
+    def _write_summary():
+        sys.stderr.write(f"waveresponse profile:\n{prof.summary()}\n")
+
+    return prof
+
+
+_SESSION_PROFILE = _profile_from_env()
@@ -0,0 +1,501 @@
+import copy
+
+import numpy as np
+
+from ._core import (
+    RAO,
+    DirectionalSpectrum,
+    Grid,
+    _check_is_similar,
+    _cyclic_shift,
+    _mirror,
+    _mirror_phase_sign,
+    _response_coords,
+    _robust_modulus,
+    _sort,
+)
+from ._regrid import Regridder
+from ._transform import _rigid_body_coeffs, _translation_vectors
+
+DOFS = ("surge", "sway", "heave", "roll", "pitch", "yaw")
+
+
+class RAOSet:
+    """
+    Six degree-of-freedom RAO set.
+
+    Stores the surge, sway, heave, roll, pitch and yaw RAOs of a rigid body as
+    one 3-D (complex) array, sharing the same frequency/(wave)direction coordinates.
+    Operations (e.g., rotation, reshaping and response calculation) are applied to all
+    degrees-of-freedom at once.
+
+    Parameters
+    ----------
+    freq : array-like
+        1-D array of grid frequency coordinates. Positive and monotonically increasing.
+    dirs : array-like
+        1-D array of grid direction coordinates. Positive and monotonically increasing.
+        Should be within the directional range [0, 360) degrees (or [0, 2*pi) radians).
+    vals : array-like (6, N, M)
+        RAO values (complex) associated with the grid. Should be a 3-D array of
+        shape (6, N, M), such that ``N=len(freq)`` and ``M=len(dirs)``. The first
+        axis represents the degrees-of-freedom, in the order surge, sway, heave,
+        roll, pitch and yaw.
+    freq_hz : bool
+        If frequency is given in 'Hz'. If ``False``, 'rad/s' is assumed.
+    degrees : bool
+        If direction is given in 'degrees'. If ``False``, 'radians' is assumed.
+    clockwise : bool
+        If positive directions are defined to be 'clockwise'. If ``False``, 'counterclockwise'
+        is assumed.
+    waves_coming_from : bool
+        If waves are 'coming from' the given directions. If ``False``, 'going towards'
+        convention is assumed.
+    copy : bool
+        Whether to copy the given arrays. If ``False``, the arrays are used by the
+        object without copying (where possible), and should not be modified afterwards.
+    """
+
+    def __init__(
+        self,
+        freq,
+        dirs,
+        vals,
+        freq_hz=False,
+        degrees=False,
+        clockwise=False,
+        waves_coming_from=True,
+        copy=True,
+    ):
+        vals = np.asarray_chkfinite(vals)
+        if vals.ndim != 3 or vals.shape[0] != len(DOFS):
+            raise ValueError(
+                "Values must have shape (6, N, M), such that ``N=len(freq)`` "
+                "and ``M=len(dirs)``."
+            )
+
+        # Use RAO for validation and unit conversion of coordinates
+        rao = RAO(
+            freq,
+            dirs,
+            vals[0],
+            freq_hz=freq_hz,
+            degrees=degrees,
+            clockwise=clockwise,
+            waves_coming_from=waves_coming_from,
+            copy=copy,
+        )
+
+        self._freq = rao._freq
+        self._dirs = rao._dirs
+        self._vals = vals.copy() if copy else vals
+        self._freq_hz = freq_hz
+        self._degrees = degrees
+        self._clockwise = clockwise
+        self._waves_coming_from = waves_coming_from
+
+    @classmethod
+    def from_raos(cls, surge, sway, heave, roll, pitch, yaw):
+        """
+        Construct from (six) RAO objects.
+
+        The RAOs must have the same frequency/direction coordinates, and the same
+        'wave convention'. Default units are taken from the surge RAO.
+
+        Parameters
+        ----------
+        surge : obj
+            Surge RAO.
+        sway : obj
+            Sway RAO.
+        heave : obj
+            Heave RAO.
+        roll : obj
+            Roll RAO.
+        pitch : obj
+            Pitch RAO.
+        yaw : obj
+            Yaw RAO.
+
+        Returns
+        -------
+        obj :
+            Initialized RAO set.
+        """
+        raos = (surge, sway, heave, roll, pitch, yaw)
+
+        for rao_i in raos:
+            if not isinstance(rao_i, RAO):
+                raise ValueError("RAO objects must be of type 'waveresponse.RAO'.")
+        _check_is_similar(*raos, exact_type=True)
+
+        return cls._new(
+            surge._freq,
+            surge._dirs,
+            np.stack([rao_i._vals for rao_i in raos]),
+            freq_hz=surge._freq_hz,
+            degrees=surge._degrees,
+            **surge.wave_convention,
+        )
+
+    @classmethod
+    def _new(
+        cls,
+        freq,
+        dirs,
+        vals,
+        freq_hz=False,
+        degrees=False,
+        clockwise=False,
+        waves_coming_from=True,
+    ):
+        """
+        Construct from trusted arrays, without copying or validating them.
+
+        Intended for internal use, where `freq`, `dirs` and `vals` are already
+        validated, and given in 'rad/s' and 'radians'.
+        """
+        new = cls.__new__(cls)
+        new._freq = freq
+        new._dirs = dirs
+        new._vals = vals
+        new._freq_hz = freq_hz
+        new._degrees = degrees
+        new._clockwise = clockwise
+        new._waves_coming_from = waves_coming_from
+        return new
+
+    def _new_like(self, freq, dirs, vals):
+        """
+        New RAO set with the given arrays, and the units and convention of this set.
+        """
+        return self._new(
+            freq,
+            dirs,
+            vals,
+            freq_hz=self._freq_hz,
+            degrees=self._degrees,
+            **self.wave_convention,
+        )
+
+    def __getitem__(self, dof):
+        """
+        RAO of a degree-of-freedom.
+
+        Parameters
+        ----------
+        dof : {'surge', 'sway', 'heave', 'roll', 'pitch', 'yaw'} or int
+            Degree-of-freedom, given by name or index.
+
+        Returns
+        -------
+        obj :
+            RAO object. The coordinate and value arrays are shared with the set.
+        """
+        if isinstance(dof, str):
+            if dof.lower() not in DOFS:
+                raise KeyError(
+                    "`dof` must be 'surge', 'sway', 'heave', 'roll', 'pitch' or 'yaw'"
+                )
+            dof = DOFS.index(dof.lower())
+
+        return RAO._new(
+            self._freq,
+            self._dirs,
+            self._vals[dof],
+            freq_hz=self._freq_hz,
+            degrees=self._degrees,
+            **self.wave_convention,
+        )
+
+    def __len__(self):
+        return len(DOFS)
+
+    def __iter__(self):
+        return (self[i] for i in range(len(DOFS)))
+
+    def to_raos(self):
+        """
+        Split the set into RAO objects.
+
+        Returns
+        -------
+        tuple :
+            Surge, sway, heave, roll, pitch and yaw RAO objects.
+        """
+        return tuple(self)
+
+    def freq(self, freq_hz=None):
+        """
+        Frequency coordinates.
+
+        Parameters
+        ----------
+        freq_hz : bool
+            If frequencies should be returned in 'Hz'. If ``False``, 'rad/s' is used.
+            Defaults to original units used during initialization.
+        """
+        if freq_hz is None:
+            freq_hz = self._freq_hz
+
+        if freq_hz:
+            return 1.0 / (2.0 * np.pi) * self._freq
+        return self._freq.copy()
+
+    def dirs(self, degrees=None):
+        """
+        Wave direction coordinates.
+
+        Parameters
+        ----------
+        degrees : bool
+            If directions should be returned in 'degrees'. If ``False``, 'radians'
+            is used. Defaults to original units used during initialization.
+        """
+        if degrees is None:
+            degrees = self._degrees
+
+        if degrees:
+            return (180.0 / np.pi) * self._dirs
+        return self._dirs.copy()
+
+    @property
+    def wave_convention(self):
+        """
+        Wave direction convention.
+        """
+        return {
+            "clockwise": self._clockwise,
+            "waves_coming_from": self._waves_coming_from,
+        }
+
+    def set_wave_convention(self, clockwise=True, waves_coming_from=True):
+        """
+        Set wave direction convention.
+
+        Directions and values will be converted (in-place) to the given convention.
+
+        Parameters
+        ----------
+        clockwise : bool
+            If positive directions are defined to be 'clockwise'. If ``False``,
+            'counterclockwise' is assumed.
+        waves_coming_from : bool
+            If waves are 'coming from' the given directions. If ``False``, 'going towards'
+            convention is assumed.
+        """
+        conv_new = {"clockwise": clockwise, "waves_coming_from": waves_coming_from}
+        dirs_new = Grid._convert_dirs(self._dirs, conv_new, self.wave_convention)
+        self._dirs, self._vals = _sort(dirs_new, self._vals)
+        self._clockwise = clockwise
+        self._waves_coming_from = waves_coming_from
+
+    def copy(self):
+        """Return a copy of the object."""
+        return copy.deepcopy(self)
+
+    def rotate(self, angle, degrees=False):
+        """
+        Rotate the underlying grid coordinate system a given angle.
+
+        All directions are converted so that:
+
+            dirs_new = dirs_old - angle
+
+        Note that the direction of positive rotation follows the set 'wave convention'.
+
+        Parameters
+        ----------
+        angle : float
+            Rotation angle.
+        degrees : bool
+            Whether the rotation angle is given in 'degrees'. If ``False``, 'radians'
+            is assumed.
+
+        Returns
+        -------
+        obj :
+            A copy of the object where the underlying coordinate system is rotated.
+        """
+        if degrees:
+            angle = (np.pi / 180.0) * angle
+
+        shift = _cyclic_shift(self._dirs, angle)
+        if shift is not None:
+            return self._new_like(
+                self._freq, self._dirs, np.roll(self._vals, -shift, axis=-1)
+            )
+
+        dirs_new = _robust_modulus(self._dirs - angle, 2.0 * np.pi)
+        dirs_new, vals_new = _sort(dirs_new, self._vals)
+        return self._new_like(self._freq, dirs_new, vals_new)
+
+    def reshape(self, freq, dirs, freq_hz=False, degrees=False, fill_value=0.0):
+        """
+        Reshape the grid to match the given frequency/direction coordinates. Grid
+        values will be interpolated (linear), with complex values interpolated in
+        rectangular form (i.e., real and imaginary part).
+
+        Parameters
+        ----------
+        freq : array-like
+            1-D array of new grid frequency coordinates. Positive and monotonically
+            increasing.
+        dirs : array-like
+            1-D array of new grid direction coordinates. Positive and monotonically increasing.
+            Must cover the directional range [0, 360) degrees (or [0, 2 * numpy.pi) radians).
+        freq_hz : bool
+            If frequency is given in 'Hz'. If ``False``, 'rad/s' is assumed.
+        degrees : bool
+            If direction is given in 'degrees'. If ``False``, 'radians' are assumed.
+        fill_value : float or None
+            The value used for extrapolation (i.e., `freq` outside the bounds of
+            the provided grid). If ``None``, values outside the frequency domain
+            are extrapolated.
+
+        Returns
+        -------
+        obj :
+            A copy of the object where the underlying coordinate system is reshaped.
+        """
+        freq = np.asarray_chkfinite(freq)
+        dirs = np.asarray_chkfinite(dirs)
+
+        if freq_hz:
+            freq = 2.0 * np.pi * freq
+
+        if degrees:
+            dirs = (np.pi / 180.0) * dirs
+
+        regridder = Regridder(self._freq, self._dirs, freq, dirs, fill_value=fill_value)
+        return self._regrid(regridder)
+
+    def _regrid(self, regridder):
+        """
+        Reshape with a (precomputed) regridder.
+        """
+        return self._new_like(
+            regridder._freq_new, regridder._dirs_new, regridder(self._vals)
+        )
+
+    def mirror(self, sym_plane="xz"):
+        """
+        Mirrors/folds the RAOs about a symmetry plane.
+
+        The phase of the folded values is flipped for the degrees-of-freedom that
+        are antisymmetric about the plane. See :func:`~waveresponse.mirror`.
+
+        Parameters
+        ----------
+        sym_plane : {'xz', 'yz'}
+            Symmetry plane, determining which axis to mirror the RAOs about.
+
+        Returns
+        -------
+        obj :
+            Extended (mirrored) RAO set.
+        """
+        scale_phase = np.array(
+            [_mirror_phase_sign(dof, sym_plane) for dof in DOFS]
+        ).reshape(-1, 1, 1)
+
+        dirs, vals = _mirror(
+            self.dirs(), self._vals, scale_phase, sym_plane, self._degrees
+        )
+        if self._degrees:
+            dirs = (np.pi / 180.0) * dirs
+        return self._new_like(self._freq, dirs, vals)
+
+    def differentiate(self, n=1):
+        """
+        Return the nth derivative of the RAOs.
+
+        Parameters
+        ----------
+        n : int
+            Order of differentiation.
+
+        Returns
+        -------
+        obj :
+            Differentiated RAO set.
+        """
+        vals_new = self._vals * ((1j * self._freq.reshape(-1, 1)) ** n)
+        return self._new_like(self._freq, self._dirs, vals_new)
+
+    def rigid_transform(self, t):
+        """
+        Rigid body transformation of the RAO set.
+
+        Transforms the surge, sway and heave RAOs from one location to another by
+        assuming rigid body motion. See :func:`~waveresponse.rigid_transform`.
+
+        Parameters
+        ----------
+        t : array-like
+            Translation vector, describing the translation 'from-old-to-new' location
+            on the rigid body. Given as ``(x_new, y_new, z_new) - (x_old, y_old, z_old)``.
+
+        Returns
+        -------
+        obj :
+            RAO set (rigid body transformed).
+        """
+        t = _translation_vectors(t)
+        if len(t) != 1:
+            raise ValueError("Translation vector, `t`, should have length 3.")
+
+        coeffs = np.asarray(_rigid_body_coeffs(*t.T))[..., 0]
+        vals_new = self._vals.copy()
+        vals_new[:3] = (coeffs @ self._vals.reshape(len(DOFS), -1)).reshape(
+            3, *self._vals.shape[1:]
+        )
+        return self._new_like(self._freq, self._dirs, vals_new)
+
+    def calculate_response(
+        self, wave, heading, heading_degrees=False, coord_freq="wave", coord_dirs="wave"
+    ):
+        """
+        Calculate response spectra for all degrees-of-freedom.
+
+        Equivalent to :func:`~waveresponse.calculate_response` for each RAO in the
+        set, but the wave spectrum is rotated and reshaped only once.
+
+        Parameters
+        ----------
+        wave : obj
+            2-D wave spectrum as a :class:`~waveresponse.WaveSpectrum` object.
+        heading : float
+            Heading of vessel relative to wave spectrum coordinate system.
+        heading_degrees : bool
+            Whether the heading is given in 'degrees'. If ``False``, 'radians' is assumed.
+        coord_freq : str, optional
+            Frequency coordinates for interpolation. Should be 'wave' or 'rao'.
+        coord_dirs : str, optional
+            Direction coordinates for interpolation. Should be 'wave' or 'rao'.
+
+        Returns
+        -------
+        tuple :
+            Response spectra (surge, sway, heave, roll, pitch and yaw) as
+            :class:`~waveresponse.DirectionalSpectrum` objects.
+        """
+        wave_body = wave.rotate(heading, degrees=heading_degrees)
+        wave_body.set_wave_convention(**self.wave_convention)
+
+        freq, dirs = _response_coords(
+            self, wave_body._freq, wave_body._dirs, coord_freq, coord_dirs
+        )
+
+        rao_squared = (self._vals * self._vals.conjugate()).real
+        rao_squared = Regridder(self._freq, self._dirs, freq, dirs)(rao_squared)
+        wave_body = wave_body.reshape(freq, dirs, freq_hz=False, degrees=False)
+
+        vals = rao_squared * wave_body._vals
+        return tuple(
+            DirectionalSpectrum._new(freq, dirs, vals_i, **self.wave_convention)
+            for vals_i in vals
+        )
+
+    def __repr__(self):
+        return "RAOSet"
@@ -0,0 +1,219 @@
+import numpy as np
+
+from ._core import Grid
+
+
+def _linear_stencil(xp, x):
+    """
+    Lower index and (linear) interpolation weight of the upper neighbor, for each
+    coordinate in `x`. Coordinates outside `xp` are extrapolated from the nearest
+    interval.
+    """
+    idx = np.clip(np.searchsorted(xp, x, side="right") - 1, 0, len(xp) - 2)
+    t = (x - xp[idx]) / (xp[idx + 1] - xp[idx])
+    return idx, t
+
+
+def _periodic_stencil(xp, x, period=2.0 * np.pi):
+    """
+    Lower and upper neighbor indices, and (linear) interpolation weight of the
+    upper neighbor, for each coordinate in `x`. The coordinates are periodic, and
+    `xp` must be increasing within one period.
+    """
+    xp_padded = np.concatenate((xp[-1:] - period, xp, xp[:1] + period))
+    idx, t = _linear_stencil(xp_padded, x)
+    return (idx - 1) % len(xp), idx % len(xp), t
+
+
+class Regridder:
+    """
+    Precomputed (linear) interpolation from one frequency/direction grid to another.
+
+    The interpolation is stored as a sparse weight matrix, so that values from
+    any number of grids sharing the same 'original' coordinates can be reshaped
+    to the 'new' coordinates with one sparse matrix multiplication each. The
+    interpolation is equivalent to :meth:`Grid.interpolate` (with 'rectangular'
+    conversion of complex values); i.e., directions are treated as periodic,
+    and a fill value is used for frequencies outside the bounds of the original
+    grid.
+
+    Parameters
+    ----------
+    freq_org : array-like
+        1-D array of original grid frequency coordinates. Positive and monotonically
+        increasing.
+    dirs_org : array-like
+        1-D array of original grid direction coordinates. Positive and monotonically
+        increasing. Must cover the directional range [0, 360) degrees (or [0, 2 * numpy.pi)
+        radians).
+    freq_new : array-like
+        1-D array of new grid frequency coordinates. Positive and monotonically
+        increasing.
+    dirs_new : array-like
+        1-D array of new grid direction coordinates. Positive and monotonically
+        increasing. Must cover the directional range [0, 360) degrees (or [0, 2 * numpy.pi)
+        radians).
+    freq_hz : bool
+        If frequencies are given in 'Hz'. If ``False``, 'rad/s' is assumed.
+    degrees : bool
+        If directions are given in 'degrees'. If ``False``, 'radians' is assumed.
+    fill_value : float or None
+        The value used for extrapolation (i.e., `freq_new` outside the bounds of
+        `freq_org`). If ``None``, values outside the frequency domain are extrapolated.
+    """
+
+    def __init__(
+        self,
+        freq_org,
+        dirs_org,
+        freq_new,
+        dirs_new,
+        freq_hz=False,
+        degrees=False,
+        fill_value=0.0,
+    ):
+        # Use Grid for validation and unit conversion of coordinates
+        grid_org = Grid(
+            freq_org,
+            dirs_org,
+            np.zeros((len(freq_org), len(dirs_org))),
+            freq_hz=freq_hz,
+            degrees=degrees,
+        )
+        grid_new = Grid(
+            freq_new,
+            dirs_new,
+            np.zeros((len(freq_new), len(dirs_new))),
+            freq_hz=freq_hz,
+            degrees=degrees,
+        )
+
+        if len(grid_org._freq) < 2:
+            raise ValueError("Original grid must have at least two frequencies.")
+
+        self._freq_org, self._dirs_org = grid_org._freq, grid_org._dirs
+        self._freq_new, self._dirs_new = grid_new._freq, grid_new._dirs
+        self._fill_value = fill_value
+        self._weights, self._fill = self._build()
+        self._weights_single = None
+
+    def _build(self):
+        """
+        Build sparse weight matrix and fill vector.
+        """
+        from scipy.sparse import csr_matrix
+
+        n_org, m_org = len(self._freq_org), len(self._dirs_org)
+        n_new, m_new = len(self._freq_new), len(self._dirs_new)
+
+        idx_f, t_f = _linear_stencil(self._freq_org, self._freq_new)
+
+        idx_d0, idx_d1, t_d = _periodic_stencil(self._dirs_org, self._dirs_new)
+
+        fill = np.zeros((n_new, m_new))
+        if self._fill_value is not None:
+            outside = (self._freq_new < self._freq_org[0]) | (
+                self._freq_new > self._freq_org[-1]
+            )
+            t_f = np.where(outside, 0.0, t_f)
+            fill[outside, :] = self._fill_value
+        else:
+            outside = np.zeros(n_new, dtype=bool)
+
+        rows = np.arange(n_new * m_new).reshape(n_new, m_new)
+        inside = ~outside[:, np.newaxis]
+
+        rows_list, cols_list, data_list = [], [], []
+        for i_f, w_f in ((idx_f, 1.0 - t_f), (idx_f + 1, t_f)):
+            for i_d, w_d in ((idx_d0, 1.0 - t_d), (idx_d1, t_d)):
+                weights = w_f[:, np.newaxis] * w_d[np.newaxis, :] * inside
+                cols = i_f[:, np.newaxis] * m_org + i_d[np.newaxis, :]
+                rows_list.append(rows.ravel())
+                cols_list.append(cols.ravel())
+                data_list.append(weights.ravel())
+
+        weights = csr_matrix(
+            (
+                np.concatenate(data_list),
+                (np.concatenate(rows_list), np.concatenate(cols_list)),
+            ),
+            shape=(n_new * m_new, n_org * m_org),
+        )
+        weights.eliminate_zeros()
+        return weights, fill
+
+    def __call__(self, vals):
+        """
+        Interpolate grid values from the original to the new coordinates.
+
+        Parameters
+        ----------
+        vals : array-like (N, M) or (K, N, M)
+            Grid values (real or complex) associated with the original coordinates,
+            such that ``N=len(freq_org)`` and ``M=len(dirs_org)``. A stack of ``K``
+            grids can be interpolated at once.
+
+        Returns
+        -------
+        array (P, Q) or (K, P, Q) :
+            Interpolated grid values, such that ``P=len(freq_new)`` and ``Q=len(dirs_new)``.
+        """
+        vals = np.asarray_chkfinite(vals)
+        shape_org = (len(self._freq_org), len(self._dirs_org))
+        shape_new = (len(self._freq_new), len(self._dirs_new))
+
+        if vals.shape[-2:] != shape_org or vals.ndim not in (2, 3):
+            raise ValueError(
+                "Values must have shape (N, M) or (K, N, M), such that "
+                "``N=len(freq_org)`` and ``M=len(dirs_org)``."
+            )
+
+        weights, fill = self._weights, self._fill
+        if vals.dtype in (np.float32, np.complex64):
+            # Single precision values are interpolated in single precision
+            if self._weights_single is None:
+                self._weights_single = self._weights.astype(np.float32)
+            weights, fill = self._weights_single, fill.astype(np.float32)
+
+        # Real and imaginary parts are filled separately (as in 'rectangular' mode)
+        if np.iscomplexobj(vals):
+            fill = fill + 1j * fill
+
+        vals_flat = vals.reshape(-1, shape_org[0] * shape_org[1]).T
+        vals_new = (weights @ vals_flat).T.reshape(-1, *shape_new) + fill
+
+        if vals.ndim == 2:
+            return vals_new[0]
+        return vals_new
+
+    def reshape(self, grid):
+        """
+        Reshape a grid object to the new frequency/direction coordinates.
+
+        Equivalent to :meth:`Grid.reshape`. The grid must be defined on the original
+        coordinates of the regridder.
+
+        Parameters
+        ----------
+        grid : obj
+            Grid object.
+
+        Returns
+        -------
+        obj :
+            A copy of the object where the underlying coordinate system is reshaped.
+        """
+        if not (
+            np.array_equal(grid._freq, self._freq_org)
+            and np.array_equal(grid._dirs, self._dirs_org)
+        ):
+            raise ValueError(
+                "Grid frequency/direction coordinates do not match the original "
+                "coordinates of the regridder."
+            )
+
+        new = grid._shallow_copy()
+        new._freq = self._freq_new.copy()
+        new._dirs = self._dirs_new.copy()
+        new._vals = self(grid._vals)
+        return new
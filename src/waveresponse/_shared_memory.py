@@ -0,0 +1,132 @@
+import weakref
+from collections import namedtuple
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+# Shared memory blocks created or attached by this process (and not unlinked).
+# The blocks are kept open, since arrays may still refer to them.
+_BLOCKS = {}
+
+# Unlinked blocks that are not closed yet, since arrays in this process still
+# refer to them (see ``unlink``)
+_UNLINKED = []
+
+# Weak references to the arrays backed by each block. Closing a block does not
+# check for such arrays (and invalidates them), so the blocks are only closed
+# once all arrays are garbage collected.
+_ARRAY_REFS = {}
+
+SharedArrayHandle = namedtuple("SharedArrayHandle", ["name", "shape", "dtype"])
+SharedArrayHandle.__doc__ = """
+Reference to a NumPy array stored in a shared memory block.
+"""
+
+
+def _as_array(shm, shape, dtype):
+    """
+    Read-only array view of a shared memory block.
+    """
+    arr = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    arr.flags.writeable = False
+    refs = _ARRAY_REFS.setdefault(shm.name, [])
+    refs[:] = [ref for ref in refs if ref() is not None]
+    refs.append(weakref.ref(arr))
+    weakref.finalize(arr, _close_unlinked)
+    return arr
+
+
+def to_shared(arr):
+    """
+    Copy an array to a new shared memory block.
+
+    Parameters
+    ----------
+    arr : array
+        Array to share.
+
+    Returns
+    -------
+    arr : array
+        Read-only array backed by the shared memory block.
+    handle : SharedArrayHandle
+        Handle that can be used to attach to the array from other processes.
+    """
+    arr = np.asarray(arr)
+    shm = SharedMemory(create=True, size=max(arr.nbytes, 1))
+    _BLOCKS[shm.name] = shm
+
+    handle = SharedArrayHandle(shm.name, arr.shape, arr.dtype.str)
+    arr_shared = _as_array(shm, arr.shape, arr.dtype)
+    arr_shared.flags.writeable = True
+    arr_shared[...] = arr
+    arr_shared.flags.writeable = False
+    return arr_shared, handle
+
+
+def from_shared(handle):
+    """
+    Attach to an array stored in a shared memory block (without copying).
+
+    Parameters
+    ----------
+    handle : SharedArrayHandle
+        Handle of the shared array.
+
+    Returns
+    -------
+    array :
+        Read-only array backed by the shared memory block.
+    """
+    shm = _BLOCKS.get(handle.name)
+    if shm is None:
+        try:
+            # Only the creating process should be responsible for unlinking the
+            # block (Python >= 3.13)
+            shm = SharedMemory(name=handle.name, track=False)
+        except TypeError:
+            # Child processes share the resource tracker of the creating process
+            shm = SharedMemory(name=handle.name)
+        _BLOCKS[handle.name] = shm
+    return _as_array(shm, handle.shape, np.dtype(handle.dtype))
+
+
+def is_linked(handle):
+    """
+    Whether the shared memory block of a handle is available to other processes
+    (i.e., it is not unlinked by this process).
+    """
+    return handle.name in _BLOCKS
+
+
+def _close_unlinked():
+    """
+    Close the unlinked blocks that are no longer referred to by any array.
+    """
+    for shm in _UNLINKED.copy():
+        refs = _ARRAY_REFS.get(shm.name, [])
+        if any(ref() is not None for ref in refs):
+            continue
+        _UNLINKED.remove(shm)
+        _ARRAY_REFS.pop(shm.name, None)
+        shm.close()
+
+
+def unlink(handle):
+    """
+    Request that a shared memory block is destroyed, and close it.
+
+    Existing arrays backed by the block stay valid, but no new processes can
+    attach to it. If arrays in this process still refer to the block, it is
+    closed once they are garbage collected. Unlinking a block that is already
+    unlinked has no effect.
+    """
+    shm = _BLOCKS.pop(handle.name, None)
+    if shm is None:
+        try:
+            shm = SharedMemory(name=handle.name)
+        except FileNotFoundError:  # already unlinked
+            return
+    shm.unlink()
+    _UNLINKED.append(shm)
+    _close_unlinked()
@@ -1,7 +1,24 @@
 from abc import ABC, abstractmethod
 
 import numpy as np
-from scipy.special import gamma as gammafun
+
+
+def _broadcast_params(*params):
+    """
+    Broadcast spectrum parameters against each other.
+
+    Scalar parameters are returned as scalars. Array-valued parameters are returned
+    as column vectors of shape (K, 1), such that they broadcast against the frequency
+    coordinates and yield spectra of shape (K, N).
+    """
+    params = np.broadcast_arrays(*(np.asarray_chkfinite(p) for p in params))
+
+    if params[0].ndim == 0:
+        return tuple(p[()] for p in params)
+    elif params[0].ndim > 2 or (params[0].ndim == 2 and params[0].shape[1] != 1):
+        raise ValueError("Spectrum parameters must be scalars or 1-D arrays.")
+
+    return tuple(p.reshape(-1, 1) for p in params)
 
 
 class BaseSpectrum1d(ABC):
@@ -109,11 +126,14 @@ class BasePMSpectrum(BaseSpectrum1d):
         """
         Generate wave spectrum.
 
+        The spectrum parameters can be given as scalars, or as 1-D arrays (of
+        equal length) to generate one spectrum per set of parameters.
+
         Parameters
         ----------
-        A : float
+        A : float or array-like
             Spektrum shape parameter.
-        B : float
+        B : float or array-like
             Spektrum shape parameter.
         freq_hz : bool, optional
             Whether to return the frequencies and spectrum in terms of Hz (`True`)
@@ -125,8 +145,10 @@ class BasePMSpectrum(BaseSpectrum1d):
         freq : 1-D array
             Frequencies corresponding to the spectrum values. Unit is set according
             to `freq_hz`.
-        spectrum : 1-D array
+        spectrum : 1-D array or 2-D array (K, N)
             Spectrum values. Unit is set according to `freq_hz`.
+            If the spectrum parameters are given as arrays, the spectra are
+            stacked along the first axis.
 
         Notes
         -----
@@ -138,10 +160,12 @@ class BasePMSpectrum(BaseSpectrum1d):
         where ``S(f)`` and ``S(w)`` are the same spectrum but expressed
         in terms of Hz and rad/s, respectively.
         """
+        A, B = _broadcast_params(A, B)
         return super().__call__(A, B, freq_hz=freq_hz)
 
     def _spectrum(self, omega, A, B):
-        return A / omega**5.0 * np.exp(-B / omega**4)
+        omega_m4 = omega**-4.0
+        return A * (omega_m4 / omega) * np.exp(-B * omega_m4)
 
 
 class ModifiedPiersonMoskowitz(BasePMSpectrum):
@@ -185,11 +209,14 @@ class ModifiedPiersonMoskowitz(BasePMSpectrum):
         """
         Generate wave spectrum.
 
+        The spectrum parameters can be given as scalars, or as 1-D arrays (of
+        equal length) to generate one spectrum per set of parameters.
+
         Parameters
         ----------
-        hs : float
+        hs : float or array-like
             Significant wave height, Hs.
-        tp : float
+        tp : float or array-like
             Peak period, Tp.
         freq_hz : bool, optional
             Whether to return the frequencies and spectrum in terms of Hz (`True`)
@@ -201,8 +228,10 @@ class ModifiedPiersonMoskowitz(BasePMSpectrum):
         freq : 1-D array
             Frequencies corresponding to the spectrum values. Unit is set according
             to `freq_hz`.
-        spectrum : 1-D array
+        spectrum : 1-D array or 2-D array (K, N)
             Spectrum values. Unit is set according to `freq_hz`.
+            If the spectrum parameters are given as arrays, the spectra are
+            stacked along the first axis.
 
         Notes
         -----
@@ -215,6 +244,7 @@ class ModifiedPiersonMoskowitz(BasePMSpectrum):
         in terms of Hz and rad/s, respectively.
         """
 
+        hs, tp = _broadcast_params(hs, tp)
         A = self._A(hs, tp)
         B = self._B(tp)
 
@@ -270,13 +300,16 @@ class JONSWAP(ModifiedPiersonMoskowitz):
         """
         Generate wave spectrum.
 
+        The spectrum parameters can be given as scalars, or as 1-D arrays (of
+        equal length) to generate one spectrum per set of parameters.
+
         Parameters
         ----------
-        hs : float
+        hs : float or array-like
             Significant wave height, Hs.
-        tp : float
+        tp : float or array-like
             Peak period, Tp.
-        gamma : float
+        gamma : float or array-like
             Peak enhancement factor. Default value is 3.3.
         freq_hz : bool, optional
             Whether to return the frequencies and spectrum in terms of Hz (`True`)
@@ -288,8 +321,10 @@ class JONSWAP(ModifiedPiersonMoskowitz):
         freq : 1-D array
             Frequencies corresponding to the spectrum values. Unit is set according
             to `freq_hz`.
-        spectrum : 1-D array
+        spectrum : 1-D array or 2-D array (K, N)
             Spectrum values. Unit is set according to `freq_hz`.
+            If the spectrum parameters are given as arrays, the spectra are
+            stacked along the first axis.
 
         Notes
         -----
@@ -301,6 +336,7 @@ class JONSWAP(ModifiedPiersonMoskowitz):
         where ``S(f)`` and ``S(w)`` are the same spectrum but expressed
         in terms of Hz and rad/s, respectively.
         """
+        hs, tp, gamma = _broadcast_params(hs, tp, gamma)
         alpha = self._alpha(gamma)
         b = self._b(tp)
 
@@ -320,11 +356,7 @@ class JONSWAP(ModifiedPiersonMoskowitz):
         """
         Spectral width.
         """
-        arg = self._freq <= omega_p
-        sigma = np.empty_like(self._freq)
-        sigma[arg] = 0.07
-        sigma[~arg] = 0.09
-        return sigma
+        return np.where(self._freq <= omega_p, 0.07, 0.09)
 
 
 class OchiHubble(BaseSpectrum1d):
@@ -371,13 +403,16 @@ class OchiHubble(BaseSpectrum1d):
         """
         Generate wave spectrum.
 
+        The spectrum parameters can be given as scalars, or as 1-D arrays (of
+        equal length) to generate one spectrum per set of parameters.
+
         Parameters
         ----------
-        hs : float
+        hs : float or array-like
             Significant wave height, Hs.
-        tp : float
+        tp : float or array-like
             Peak period, Tp.
-        q : float
+        q : float or array-like
             Spectral shape parameter.
         freq_hz : bool, optional
             Whether to return the frequencies and spectrum in terms of Hz (`True`)
@@ -389,8 +424,10 @@ class OchiHubble(BaseSpectrum1d):
         freq : 1-D array
             Frequencies corresponding to the spectrum values. Unit is set according
             to `freq_hz`.
-        spectrum : 1-D array
+        spectrum : 1-D array or 2-D array (K, N)
             Spectrum values. Unit is set according to `freq_hz`.
+            If the spectrum parameters are given as arrays, the spectra are
+            stacked along the first axis.
 
         Notes
         -----
@@ -403,15 +440,19 @@ class OchiHubble(BaseSpectrum1d):
         in terms of Hz and rad/s, respectively.
         """
 
+        hs, tp, q = _broadcast_params(hs, tp, q)
         return super().__call__(hs, tp, q=q, freq_hz=freq_hz)
 
     def _spectrum(self, omega, hs, tp, q):
         C = self._C(hs, tp, q)
         d = self._d(tp, q)
 
-        return C / omega ** (4 * q + 1) * np.exp(-d / omega**4)
+        omega_m4 = omega**-4.0
+        return C * (omega_m4**q / omega) * np.exp(-d * omega_m4)
 
     def _C(self, hs, tp, q):
+        from scipy.special import gamma as gammafun
+
         omega_p = 2.0 * np.pi / tp
         c = (4.0 * q + 1.0) * omega_p**4 / 4.0
         return (1.0 / 4.0) * (c**q * hs**2) / gammafun(q)
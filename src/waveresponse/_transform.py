@@ -1,6 +1,94 @@
 import numpy as np
 
-from ._core import RAO
+from ._core import RAO, _check_is_similar
+
+
+def _translation_vectors(t):
+    """
+    Validate translation vector(s), and return as a 2-D array of shape (n_points, 3).
+    """
+    t = np.asarray_chkfinite(t)
+
+    if t.shape == (3,):
+        return t.reshape(1, 3)
+    elif t.ndim == 2 and t.shape[1] == 3:
+        return t
+    else:
+        raise ValueError(
+            "Translation vector, `t`, should have length 3, "
+            "or be an array of shape (n_points, 3)."
+        )
+
+
+def _linear_combination(t, coeffs, *raos):
+    """
+    Rigid body transformation as a (fused) linear combination of RAOs.
+
+    Parameters
+    ----------
+    t : array-like
+        Translation vector(s).
+    coeffs : callable
+        Function taking the translation components, ``(tx, ty, tz)``, (1-D arrays)
+        and returning the coefficients of `raos` as a 3-D array, with shape
+        (n_out, len(raos), n_points).
+    *raos : obj
+        RAO objects. The first RAO serves as a template for the output RAO(s).
+
+    Returns
+    -------
+    list :
+        Transformed RAO values, one per output. Given as RAO objects if `t` is a single
+        translation vector, and as (n_points, N, M) arrays otherwise.
+    """
+    t_2d = _translation_vectors(t)
+
+    for rao_i in raos:
+        if not isinstance(rao_i, RAO):
+            raise ValueError("RAO objects must be of type 'waveresponse.RAO'.")
+    _check_is_similar(*raos, exact_type=True)
+
+    coeffs = np.asarray(coeffs(*t_2d.T), dtype=float)
+    n_out, n_raos, n_points = coeffs.shape
+    shape = raos[0]._vals.shape
+
+    vals = np.stack([rao_i._vals for rao_i in raos]).reshape(n_raos, -1)
+    vals_new = (coeffs.transpose(0, 2, 1) @ vals).reshape(n_out, n_points, *shape)
+
+    if np.ndim(t) == 2:
+        return list(vals_new)
+
+    out = []
+    for vals_i in vals_new:
+        new = raos[0]._shallow_copy()
+        new._vals = vals_i[0]
+        out.append(new)
+    return out
+
+
+def _surge_coeffs(tx, ty, tz):
+    """Coefficients of (surge, pitch, yaw)"""
+    return [[np.ones_like(tx), tz, -ty]]
+
+
+def _sway_coeffs(tx, ty, tz):
+    """Coefficients of (sway, roll, yaw)"""
+    return [[np.ones_like(tx), -tz, tx]]
+
+
+def _heave_coeffs(tx, ty, tz):
+    """Coefficients of (heave, roll, pitch)"""
+    return [[np.ones_like(tx), ty, -tx]]
+
+
+def _rigid_body_coeffs(tx, ty, tz):
+    """Coefficients of (surge, sway, heave, roll, pitch, yaw)"""
+    one, zero = np.ones_like(tx), np.zeros_like(tx)
+    return [
+        [one, zero, zero, zero, tz, -ty],
+        [zero, one, zero, -tz, zero, tx],
+        [zero, zero, one, ty, -tx, zero],
+    ]
 
 
 def rigid_transform(
@@ -21,6 +109,8 @@ def rigid_transform(
         on the rigid body. Given as ``(x_new, y_new, z_new) - (x_old, y_old, z_old)``,
         where ``(x_new, y_new, z_new)`` are coordinates of the 'new' location, and
         ``(x_old, y_old, z_old)`` are coordinates of the 'old' location.
+        Several locations can be transformed at once by giving an array of
+        translation vectors with shape (n_points, 3).
     surge : obj
         Surge RAO.
     sway : obj
@@ -36,17 +126,22 @@ def rigid_transform(
 
     Returns
     -------
-    surge_new : obj
-        Surge RAO (rigid body transformed).
-    sway_new : obj
-        Sway RAO (rigid body transformed).
-    heave_new : obj
-        Heave RAO (rigid body transformed).
+    surge_new : obj or array
+        Surge RAO (rigid body transformed). If several translation
+        vectors are given, the transformed RAO values are returned as an array
+        of shape (n_points, N, M).
+    sway_new : obj or array
+        Sway RAO (rigid body transformed). If several translation
+        vectors are given, the transformed RAO values are returned as an array
+        of shape (n_points, N, M).
+    heave_new : obj or array
+        Heave RAO (rigid body transformed). If several translation
+        vectors are given, the transformed RAO values are returned as an array
+        of shape (n_points, N, M).
     """
-    surge_new = rigid_transform_surge(t, surge, pitch, yaw)
-    sway_new = rigid_transform_sway(t, sway, roll, yaw)
-    heave_new = rigid_transform_heave(t, heave, roll, pitch)
-
+    surge_new, sway_new, heave_new = _linear_combination(
+        t, _rigid_body_coeffs, surge, sway, heave, roll, pitch, yaw
+    )
     return surge_new, sway_new, heave_new
 
 
@@ -63,6 +158,8 @@ def rigid_transform_surge(t: np.array, surge: RAO, pitch: RAO, yaw: RAO) -> RAO:
         on the rigid body. Given as ``(x_new, y_new, z_new) - (x_old, y_old, z_old)``,
         where ``(x_new, y_new, z_new)`` are coordinates of the 'new' location, and
         ``(x_old, y_old, z_old)`` are coordinates of the 'old' location.
+        Several locations can be transformed at once by giving an array of
+        translation vectors with shape (n_points, 3).
     surge : obj
         Surge RAO.
     pitch : obj
@@ -72,20 +169,13 @@ def rigid_transform_surge(t: np.array, surge: RAO, pitch: RAO, yaw: RAO) -> RAO:
 
     Returns
     -------
-    surge_new : obj
-        Surge RAO (rigid body transformed).
+    surge_new : obj or array
+        Surge RAO (rigid body transformed). If several translation
+        vectors are given, the transformed RAO values are returned as an array
+        of shape (n_points, N, M).
     """
-    t = np.asarray_chkfinite(t)
-
-    try:
-        tx, ty, tz = t
-    except ValueError:
-        raise ValueError("Translation vector, `t`, should have length 3.")
-
-    if not isinstance(surge, RAO):
-        raise ValueError("RAO objects must be of type 'waveresponse.RAO'.")
-
-    return surge - ty * yaw + tz * pitch
+    (surge_new,) = _linear_combination(t, _surge_coeffs, surge, pitch, yaw)
+    return surge_new
 
 
 def rigid_transform_sway(t: np.array, sway: RAO, roll: RAO, yaw: RAO) -> RAO:
@@ -101,6 +191,8 @@ def rigid_transform_sway(t: np.array, sway: RAO, roll: RAO, yaw: RAO) -> RAO:
         on the rigid body. Given as ``(x_new, y_new, z_new) - (x_old, y_old, z_old)``,
         where ``(x_new, y_new, z_new)`` are coordinates of the 'new' location, and
         ``(x_old, y_old, z_old)`` are coordinates of the 'old' location.
+        Several locations can be transformed at once by giving an array of
+        translation vectors with shape (n_points, 3).
     sway : obj
         Sway RAO.
     roll : obj
@@ -110,20 +202,13 @@ def rigid_transform_sway(t: np.array, sway: RAO, roll: RAO, yaw: RAO) -> RAO:
 
     Returns
     -------
-    sway_new : obj
-        Sway RAO (rigid body transformed).
+    sway_new : obj or array
+        Sway RAO (rigid body transformed). If several translation
+        vectors are given, the transformed RAO values are returned as an array
+        of shape (n_points, N, M).
     """
-    t = np.asarray_chkfinite(t)
-
-    try:
-        tx, ty, tz = t
-    except ValueError:
-        raise ValueError("Translation vector, `t`, should have length 3.")
-
-    if not isinstance(sway, RAO):
-        raise ValueError("RAO objects must be of type 'waveresponse.RAO'.")
-
-    return sway + tx * yaw - tz * roll
+    (sway_new,) = _linear_combination(t, _sway_coeffs, sway, roll, yaw)
+    return sway_new
 
 
 def rigid_transform_heave(t: np.array, heave: RAO, roll: RAO, pitch: RAO) -> RAO:
@@ -139,6 +224,8 @@ def rigid_transform_heave(t: np.array, heave: RAO, roll: RAO, pitch: RAO) -> RAO
         on the rigid body. Given as ``(x_new, y_new, z_new) - (x_old, y_old, z_old)``,
         where ``(x_new, y_new, z_new)`` are coordinates of the 'new' location, and
         ``(x_old, y_old, z_old)`` are coordinates of the 'old' location.
+        Several locations can be transformed at once by giving an array of
+        translation vectors with shape (n_points, 3).
     heave : obj
         Heave RAO.
     roll : obj
@@ -148,17 +235,10 @@ def rigid_transform_heave(t: np.array, heave: RAO, roll: RAO, pitch: RAO) -> RAO
 
     Returns
     -------
-    heave_new : obj
-        Heave RAO (rigid body transformed).
+    heave_new : obj or array
+        Heave RAO (rigid body transformed). If several translation
+        vectors are given, the transformed RAO values are returned as an array
+        of shape (n_points, N, M).
     """
-    t = np.asarray_chkfinite(t)
-
-    try:
-        tx, ty, tz = t
-    except ValueError:
-        raise ValueError("Translation vector, `t`, should have length 3.")
-
-    if not isinstance(heave, RAO):
-        raise ValueError("RAO objects must be of type 'waveresponse.RAO'.")
-
-    return heave - tx * pitch + ty * roll
+    (heave_new,) = _linear_combination(t, _heave_coeffs, heave, roll, pitch)
+    return heave_new
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from waveresponse import RAO, WaveSpectrum
+
+
+@pytest.fixture
+def make_rao():
+    """
+    Factory of RAO objects with random (complex) values, defined on 10 frequencies
+    (in 'Hz') and 12 uniformly spaced directions (in 'degrees'). Keyword arguments
+    (e.g., the wave convention) are passed on to the RAO.
+    """
+
+    def make_rao(seed=1, **kwargs):
+        freq = np.linspace(0.05, 0.5, 10)
+        dirs = np.linspace(0.0, 360.0, 12, endpoint=False)
+        rng = np.random.default_rng(seed)
+        vals = rng.random((10, 12)) + 1j * rng.random((10, 12))
+        return RAO(freq, dirs, vals, freq_hz=True, degrees=True, **kwargs)
+
+    return make_rao
+
+
+@pytest.fixture
+def make_wave():
+    """
+    Factory of wave spectrum objects with random values, defined on 15 frequencies
+    (in 'Hz') and 18 uniformly spaced directions (in 'degrees'). Keyword arguments
+    (e.g., the wave convention) are passed on to the wave spectrum.
+    """
+
+    def make_wave(seed=2, **kwargs):
+        freq = np.linspace(0.0, 0.6, 15)
+        dirs = np.linspace(0.0, 360.0, 18, endpoint=False)
+        rng = np.random.default_rng(seed)
+        vals = rng.random((15, 18))
+        return WaveSpectrum(freq, dirs, vals, freq_hz=True, degrees=True, **kwargs)
+
+    return make_wave
+
+
+@pytest.fixture
+def rao(make_rao):
+    return make_rao()
+
+
+@pytest.fixture
+def wave(make_wave):
+    return make_wave()
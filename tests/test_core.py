@@ -5,22 +5,36 @@ from unittest.mock import patch
 import numpy as np
 import pandas as pd
 import pytest
-from scipy.integrate import quad
+from scipy.integrate import quad, trapezoid
+from scipy.special import gamma
 
 import waveresponse as wr
 from waveresponse import (
     RAO,
+    RAOSet,
     CosineFullSpreading,
     CosineHalfSpreading,
     DirectionalSpectrum,
     Grid,
     WaveSpectrum,
     calculate_response,
+    calculate_response_batch,
     complex_to_polar,
+    heading_sweep,
+    heading_sweep_fft,
     mirror,
     polar_to_complex,
+    response_moments,
+    response_std,
+)
+from waveresponse._core import (
+    _check_foldable,
+    _check_is_similar,
+    _cyclic_shift,
+    _robust_modulus,
+    _trapezoid_weights,
+    _trapezoid_weights_periodic,
 )
-from waveresponse._core import _check_foldable, _check_is_similar, _robust_modulus
 
 TEST_PATH = Path(__file__).parent
 
@@ -339,6 +353,16 @@ class Test_multiply:
         np.testing.assert_array_almost_equal(out._dirs, wave._dirs)
         np.testing.assert_array_almost_equal(out._vals, vals_expect)
 
+    def test_rao_and_rao_to_directional_spectrum_raises(self, rao):
+        with pytest.raises(ValueError):
+            wr.multiply(rao, rao, output_type="directional_spectrum")
+
+    def test_does_not_modify_input(self, wave):
+        vals_org = wave._vals.copy()
+        out = wr.multiply(wave, wave, output_type="wave_spectrum")
+        out._vals[:] = 0.0
+        np.testing.assert_array_equal(wave._vals, vals_org)
+
     def test_raises_output_type(self, grid):
         with pytest.raises(ValueError):
             wr.multiply(grid, grid.copy(), output_type="invalid-type")
@@ -653,6 +677,28 @@ class Test_mirror:
         np.testing.assert_array_almost_equal(vals_out, vals_expect)
 
 
+class Test__cyclic_shift:
+    @pytest.mark.parametrize(
+        "angle, shift_expect",
+        [(0.0, 0), (30.0, 3), (-10.0, 35), (360.0, 0), (370.0, 1)],
+    )
+    def test_multiple(self, angle, shift_expect):
+        dirs = np.radians(np.arange(0.0, 360.0, 10.0))
+        assert _cyclic_shift(dirs, np.radians(angle)) == shift_expect
+
+    def test_not_multiple(self):
+        dirs = np.radians(np.arange(0.0, 360.0, 10.0))
+        assert _cyclic_shift(dirs, np.radians(15.0)) is None
+
+    def test_not_uniform(self):
+        dirs = np.radians([0.0, 90.0, 180.0])
+        assert _cyclic_shift(dirs, np.radians(90.0)) is None
+
+    def test_not_full_circle(self):
+        dirs = np.radians(np.arange(0.0, 180.0, 10.0))
+        assert _cyclic_shift(dirs, np.radians(30.0)) is None
+
+
 class Test__check_foldable:
     check_foldable_valid = [
         (
@@ -906,6 +952,161 @@ class Test_Grid:
             vals = np.zeros((3, 10))
             Grid(freq, dirs, vals)
 
+    def test__init__copy(self):
+        freq = np.linspace(0, 1.0, 10)
+        dirs = np.linspace(0, 2.0 * np.pi, 15, endpoint=False)
+        vals = np.random.random((10, 15))
+
+        grid = Grid(freq, dirs, vals)
+        assert not np.shares_memory(grid._freq, freq)
+        assert not np.shares_memory(grid._dirs, dirs)
+        assert not np.shares_memory(grid._vals, vals)
+
+    def test__init__copy_false(self):
+        freq = np.linspace(0, 1.0, 10)
+        dirs = np.linspace(0, 2.0 * np.pi, 15, endpoint=False)
+        vals = np.random.random((10, 15))
+
+        grid = Grid(freq, dirs, vals, copy=False)
+        assert grid._freq is freq
+        assert grid._dirs is dirs
+        assert grid._vals is vals
+
+    def test__init__copy_false_raises(self):
+        freq = np.linspace(0, 1.0, 10)
+        dirs = np.linspace(0, 2.0 * np.pi, 15, endpoint=False)[::-1]
+        vals = np.random.random((10, 15))
+
+        with pytest.raises(ValueError):
+            Grid(freq, dirs, vals, copy=False)
+
+    @pytest.mark.parametrize(
+        "dtype,vals_dtype,dtype_expected",
+        [
+            (np.float32, np.float64, np.float32),
+            ("float32", np.float64, np.float32),
+            (np.float32, np.complex128, np.complex64),
+            (np.complex64, np.complex128, np.complex64),
+            (np.complex64, np.float64, np.complex64),
+            (np.float64, np.float32, np.float64),
+            (np.float64, np.complex64, np.complex128),
+        ],
+    )
+    def test__init__dtype(self, dtype, vals_dtype, dtype_expected):
+        freq = np.linspace(0, 1.0, 10)
+        dirs = np.linspace(0, 2.0 * np.pi, 15, endpoint=False)
+        vals = np.random.random((10, 15)).astype(vals_dtype)
+
+        grid = Grid(freq, dirs, vals, dtype=dtype)
+        assert grid._vals.dtype == dtype_expected
+        assert grid.dtype == dtype_expected
+        assert grid._freq.dtype == np.float64
+        assert grid._dirs.dtype == np.float64
+        np.testing.assert_allclose(grid._vals, vals, rtol=1e-6)
+
+    def test__init__dtype_none(self):
+        freq = np.linspace(0, 1.0, 10)
+        dirs = np.linspace(0, 2.0 * np.pi, 15, endpoint=False)
+        vals = np.random.random((10, 15)).astype(np.float32)
+
+        grid = Grid(freq, dirs, vals)
+        assert grid.dtype == np.float32
+        assert not np.shares_memory(grid._vals, vals)
+
+    def test__init__dtype_copy_false(self):
+        freq = np.linspace(0, 1.0, 10)
+        dirs = np.linspace(0, 2.0 * np.pi, 15, endpoint=False)
+        vals = np.random.random((10, 15)).astype(np.float32)
+
+        grid = Grid(freq, dirs, vals, copy=False, dtype=np.float32)
+        assert grid._vals is vals
+
+    @pytest.mark.parametrize("dtype", [int, bool, str, object])
+    def test__init__dtype_raises(self, dtype):
+        freq = np.linspace(0, 1.0, 10)
+        dirs = np.linspace(0, 2.0 * np.pi, 15, endpoint=False)
+        vals = np.random.random((10, 15))
+
+        with pytest.raises(ValueError):
+            Grid(freq, dirs, vals, dtype=dtype)
+
+    def test__new(self):
+        freq = np.linspace(0, 1.0, 10)
+        dirs = np.linspace(0, 2.0 * np.pi, 15, endpoint=False)
+        vals = np.random.random((10, 15))
+
+        grid = Grid._new(freq, dirs, vals, freq_hz=True, degrees=True, clockwise=True)
+
+        assert isinstance(grid, Grid)
+        assert grid._freq is freq
+        assert grid._dirs is dirs
+        assert grid._vals is vals
+        assert grid._freq_hz is True
+        assert grid._degrees is True
+        assert grid.wave_convention == {"clockwise": True, "waves_coming_from": True}
+        np.testing.assert_array_almost_equal(grid.freq(), freq / (2.0 * np.pi))
+
+    def test_astype(self, grid):
+        grid_single = grid.astype(np.float32)
+
+        assert isinstance(grid_single, Grid)
+        assert grid_single is not grid
+        assert grid_single.dtype == np.float32
+        assert grid.dtype == np.float64
+        np.testing.assert_allclose(grid_single._vals, grid._vals, rtol=1e-6)
+        np.testing.assert_array_equal(grid_single._freq, grid._freq)
+        np.testing.assert_array_equal(grid_single._dirs, grid._dirs)
+        assert grid_single.wave_convention == grid.wave_convention
+
+    def test_astype_complex(self, rao):
+        rao_single = rao.astype(np.float32)
+
+        assert isinstance(rao_single, RAO)
+        assert rao_single.dtype == np.complex64
+        np.testing.assert_allclose(rao_single._vals, rao._vals, rtol=1e-6)
+
+    def test_astype_raises(self, grid):
+        with pytest.raises(ValueError):
+            grid.astype(int)
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.complex64])
+    def test_reshape_single_precision(self, grid, dtype):
+        grid = grid.astype(dtype)
+        freq_new = np.linspace(0.0, 0.9, 7)
+        dirs_new = np.linspace(5.0, 355.0, 11)
+
+        grid_reshaped = grid.reshape(freq_new, dirs_new, freq_hz=True, degrees=True)
+        assert grid_reshaped.dtype == dtype
+
+        vals_expected = grid.astype(np.float64).interpolate(
+            freq_new, dirs_new, freq_hz=True, degrees=True
+        )
+        np.testing.assert_allclose(grid_reshaped._vals, vals_expected, rtol=1e-5)
+
+    def test_encounter_values_single_precision(self):
+        freq = np.linspace(0.05, 1.0, 10)
+        dirs = np.linspace(0, 360.0, 12, endpoint=False)
+        vals = np.random.random((10, 12))
+        grid = Grid(freq, dirs, vals, freq_hz=True, degrees=True)
+        grid_single = Grid(
+            freq, dirs, vals, freq_hz=True, degrees=True, dtype=np.float32
+        )
+
+        vals_out = grid_single.encounter_values(0.5, [1.0, 2.0])
+        assert vals_out.dtype == np.float32
+        np.testing.assert_allclose(
+            vals_out, grid.encounter_values(0.5, [1.0, 2.0]), rtol=1e-5, atol=1e-7
+        )
+
+    def test__shallow_copy(self, grid):
+        grid.interpolate(grid._freq, grid._dirs)
+        grid_copy = grid._shallow_copy()
+
+        assert grid_copy is not grid
+        assert grid_copy._vals is grid._vals
+        assert grid_copy.wave_convention == grid.wave_convention
+        assert grid_copy._cache == {}
+
     def test_from_grid(self):
         freq = np.linspace(0, 1.0, 10)
         dirs = np.linspace(0, 360.0, 15, endpoint=False)
@@ -1285,6 +1486,38 @@ class Test_Grid:
         np.testing.assert_array_almost_equal(grid_rot._dirs, dirs_expect)
         np.testing.assert_array_almost_equal(grid_rot._vals, vals_expect)
 
+    @pytest.mark.parametrize("angle", [30.0, -30.0, 390.0, 0.0, 360.0, -720.0])
+    def test_rotate_uniform(self, angle):
+        freq = np.array([0.0, 0.5, 1.0])
+        dirs = np.arange(0.0, 360.0, 10.0)
+        vals = np.random.default_rng(0).random((3, 36))
+        grid = Grid(freq, dirs, vals, degrees=True)
+
+        grid_rot = grid.rotate(angle, degrees=True)
+
+        # Exact cyclic shift; the direction coordinates are kept as is
+        shift = int(angle // 10) % 36
+        assert grid_rot._dirs is grid._dirs
+        np.testing.assert_array_equal(grid_rot._vals, np.roll(vals, -shift, axis=1))
+
+        # Same as rotating the coordinates and sorting
+        dirs_expect = _robust_modulus(grid._dirs - np.radians(angle), 2.0 * np.pi)
+        order = np.argsort(dirs_expect)
+        np.testing.assert_array_almost_equal(grid_rot._dirs, dirs_expect[order])
+        np.testing.assert_array_almost_equal(grid_rot._vals, vals[:, order])
+
+    def test_rotate_uniform_not_multiple(self):
+        freq = np.array([0.0, 0.5, 1.0])
+        dirs = np.arange(0.0, 360.0, 10.0)
+        vals = np.random.default_rng(0).random((3, 36))
+        grid = Grid(freq, dirs, vals, degrees=True)
+
+        grid_rot = grid.rotate(25.0, degrees=True)
+
+        dirs_expect = np.sort(_robust_modulus(np.radians(dirs - 25.0), 2.0 * np.pi))
+        np.testing.assert_array_almost_equal(grid_rot._dirs, dirs_expect)
+        np.testing.assert_array_equal(grid_rot._vals, np.roll(vals, -3, axis=1))
+
     def test_grid(self):
         freq = np.array([0, 1])
         dirs = np.array([0, 90, 180])
@@ -1573,6 +1806,51 @@ class Test_Grid:
                 [0, 1, 2], [0, 1, 2, 100], degrees=False
             )  # dirs outside bound
 
+    def test_interpolate_function_cached(self, grid):
+        interp_fun = grid._interpolate_function(
+            method="linear", bounds_error=False, fill_value=0.0
+        )
+        assert (
+            grid._interpolate_function(
+                method="linear", bounds_error=False, fill_value=0.0
+            )
+            is interp_fun
+        )
+        assert (
+            grid._interpolate_function(
+                method="linear", bounds_error=False, fill_value=None
+            )
+            is not interp_fun
+        )
+
+    def test_interpolate_function_cache_invalidated(self, grid):
+        interp_fun = grid._interpolate_function(
+            method="linear", bounds_error=False, fill_value=0.0
+        )
+        grid.set_wave_convention(clockwise=False, waves_coming_from=False)
+        assert (
+            grid._interpolate_function(
+                method="linear", bounds_error=False, fill_value=0.0
+            )
+            is not interp_fun
+        )
+
+    def test_interpolate_function_cache_updated_vals(self, grid):
+        freq, dirs = grid._freq, grid._dirs
+        vals_org = grid.interpolate(freq, dirs)
+        grid._vals = 2.0 * grid._vals
+        np.testing.assert_array_almost_equal(
+            grid.interpolate(freq, dirs), 2.0 * vals_org
+        )
+
+    def test_copy_cache_not_copied(self, grid):
+        grid.interpolate(grid._freq, grid._dirs)
+        assert len(grid._cache) == 1
+
+        grid_copy = grid.copy()
+        assert grid_copy._cache == {}
+        assert grid_copy._cache_ref is None
+
     def test_reshape(self):
         a = 7
         b = 6
@@ -1986,6 +2264,100 @@ class Test_Grid:
         assert isinstance(grid_imag, Grid)
         np.testing.assert_array_almost_equal(grid_imag._vals, vals_expect)
 
+    @staticmethod
+    def _encounter_reference(freq, dirs, vals, sailing_direction, sailing_velocity):
+        """Per-direction (1-D) encounter transformation, one direction pair at a time"""
+        nd = len(dirs) // 2
+        omega = 2.0 * np.pi * freq
+        vals_out = np.zeros_like(vals)
+        for i in range(nd):
+            freq_e, vals_e = [], []
+            for j, sign in ((i, 1.0), (i + nd, -1.0)):
+                u = sailing_velocity * np.cos(np.radians(sailing_direction - dirs[j]))
+                freq_e.append(sign * (omega - omega**2 * u / 9.81) / (2.0 * np.pi))
+                vals_e.append(vals[:, j] / (1.0 - 2.0 * omega * u / 9.81))
+            freq_e = np.concatenate(freq_e)
+            vals_e = np.concatenate(vals_e)
+            idx = np.argsort(freq_e)
+            for j, sign in ((i, 1.0), (i + nd, -1.0)):
+                vals_out[:, j] = np.interp(
+                    sign * freq, freq_e[idx], vals_e[idx], left=0.0, right=0.0
+                )
+        return vals_out
+
+    def test_encounter(self):
+        freq = np.linspace(0.05, 0.3, 20)
+        dirs = np.arange(0.0, 360.0, 30.0)
+        vals = np.random.default_rng(123).random((20, 12))
+        grid = Grid(freq, dirs, vals, freq_hz=True, degrees=True)
+
+        out = grid.encounter(20.0, 3.0)
+
+        vals_expect = self._encounter_reference(freq, dirs, vals, 20.0, 3.0)
+        assert out is None
+        np.testing.assert_array_almost_equal(grid._vals, vals_expect)
+        np.testing.assert_array_almost_equal(grid.freq(freq_hz=True), freq)
+        np.testing.assert_array_almost_equal(grid.dirs(degrees=True), dirs)
+
+    def test_encounter_zero_velocity(self):
+        freq = np.linspace(0.05, 0.3, 20)
+        dirs = np.arange(0.0, 360.0, 30.0)
+        vals = np.random.default_rng(123).random((20, 12))
+        grid = Grid(freq, dirs, vals, freq_hz=True, degrees=True)
+
+        grid.encounter(45.0, 0.0)
+
+        np.testing.assert_array_almost_equal(grid._vals, vals)
+
+    def test_encounter_values(self):
+        freq = np.linspace(0.05, 0.3, 20)
+        dirs = np.arange(0.0, 360.0, 30.0)
+        vals = np.random.default_rng(123).random((20, 12))
+        grid = Grid(freq, dirs, vals, freq_hz=True, degrees=True)
+
+        sailing_direction = np.array([0.0, 100.0, 250.0])
+        sailing_velocity = np.array([0.0, 2.0, 5.0, 8.0])
+        vals_out = grid.encounter_values(
+            sailing_direction[:, np.newaxis], sailing_velocity[np.newaxis, :]
+        )
+
+        assert vals_out.shape == (3, 4, 20, 12)
+        np.testing.assert_array_almost_equal(grid._vals, vals)  # not modified
+        for i, sd in enumerate(sailing_direction):
+            for j, sv in enumerate(sailing_velocity):
+                vals_expect = self._encounter_reference(freq, dirs, vals, sd, sv)
+                np.testing.assert_array_almost_equal(vals_out[i, j], vals_expect)
+
+    def test_encounter_values_scalar(self):
+        freq = np.linspace(0.05, 0.3, 20)
+        dirs = np.arange(0.0, 360.0, 30.0)
+        vals = np.random.default_rng(123).random((20, 12))
+        grid = Grid(freq, dirs, vals, freq_hz=True, degrees=True)
+
+        vals_out = grid.encounter_values(20.0, 3.0)
+
+        vals_expect = self._encounter_reference(freq, dirs, vals, 20.0, 3.0)
+        assert vals_out.shape == (20, 12)
+        np.testing.assert_array_almost_equal(vals_out, vals_expect)
+
+    def test_encounter_raises_waterdepth(self, grid):
+        with pytest.raises(NotImplementedError):
+            grid.encounter(0.0, 1.0, waterdepth=100.0)
+
+    def test_encounter_raises_dirs(self):
+        freq = np.linspace(0.05, 0.3, 20)
+        dirs = np.array([0.0, 90.0, 180.0])
+        grid = Grid(freq, dirs, np.ones((20, 3)), freq_hz=True, degrees=True)
+
+        with pytest.raises(ValueError):
+            grid.encounter(0.0, 1.0)
+
+        dirs = np.array([0.0, 90.0, 180.0, 300.0])
+        grid = Grid(freq, dirs, np.ones((20, 4)), freq_hz=True, degrees=True)
+
+        with pytest.raises(ValueError):
+            grid.encounter_values(0.0, 1.0)
+
 
 class Test_RAO:
     def test__init__(self):
@@ -2020,6 +2392,15 @@ class Test_RAO:
         assert rao._phase_degrees is False
         assert rao._phase_leading is True
 
+    def test__init__dtype(self):
+        freq = np.linspace(0, 1.0, 10)
+        dirs = np.linspace(0, 360.0, 15, endpoint=False)
+        vals = np.random.random((10, 15)) + 1j * np.random.random((10, 15))
+
+        rao = RAO(freq, dirs, vals, degrees=True, dtype=np.float32)
+        assert rao.dtype == np.complex64
+        np.testing.assert_allclose(rao._vals, vals, rtol=1e-6)
+
     def test_from_grid(self):
         freq = np.linspace(0, 1.0, 10)
         dirs = np.linspace(0, 360.0, 15, endpoint=False)
@@ -2047,6 +2428,18 @@ class Test_RAO:
         assert rao_out._freq_hz == grid_in._freq_hz
         assert rao_out._degrees == grid_in._degrees
 
+    def test__new(self):
+        freq = np.linspace(0, 1.0, 10)
+        dirs = np.linspace(0, 2.0 * np.pi, 15, endpoint=False)
+        vals = np.random.random((10, 15)) + 1j * np.random.random((10, 15))
+
+        rao = RAO._new(freq, dirs, vals)
+
+        assert isinstance(rao, RAO)
+        assert rao._vals is vals
+        assert rao._phase_degrees is False
+        assert rao._phase_leading is True
+
     def test_from_amp_phase_rad(self):
         freq_in = np.array([0, 1, 2])
         dirs_in = np.array([0, 45, 90, 135])
@@ -2637,6 +3030,75 @@ class Test_RAO:
         assert not isinstance(grid_imag, RAO)
         np.testing.assert_array_almost_equal(grid_imag._vals, vals_expect)
 
+    def test_squared_magnitude(self, rao):
+        grid_out = rao.squared_magnitude()
+        grid_expect = (rao * rao.conjugate()).real
+
+        assert isinstance(grid_out, Grid)
+        assert not isinstance(grid_out, RAO)
+        np.testing.assert_array_almost_equal(grid_out._freq, grid_expect._freq)
+        np.testing.assert_array_almost_equal(grid_out._dirs, grid_expect._dirs)
+        np.testing.assert_array_almost_equal(grid_out._vals, grid_expect._vals)
+        assert grid_out._freq_hz == grid_expect._freq_hz
+        assert grid_out._degrees == grid_expect._degrees
+        assert grid_out.wave_convention == grid_expect.wave_convention
+
+    def test_squared_magnitude_cached(self, rao):
+        assert rao._squared_magnitude() is rao._squared_magnitude()
+
+        grid_out = rao.squared_magnitude()
+        assert grid_out is not rao._squared_magnitude()
+        assert grid_out is not rao.squared_magnitude()
+
+    def test_squared_magnitude_invalidated(self, rao):
+        squared_org = rao._squared_magnitude()
+        rao.set_wave_convention(clockwise=False, waves_coming_from=False)
+
+        squared_new = rao._squared_magnitude()
+        assert squared_new is not squared_org
+        assert squared_new.wave_convention == rao.wave_convention
+        np.testing.assert_array_almost_equal(squared_new._dirs, rao._dirs)
+        np.testing.assert_array_almost_equal(squared_new._vals, np.abs(rao._vals) ** 2)
+
+    def test__squared_magnitude_reshaped(self, rao):
+        freq = np.linspace(0.0, 5.0, 7)
+        dirs = np.linspace(0.1, 6.0, 11)
+
+        grid_out = rao._squared_magnitude_reshaped(freq, dirs)
+        grid_expect = (rao * rao.conjugate()).real.reshape(freq, dirs)
+
+        np.testing.assert_array_almost_equal(grid_out._freq, freq)
+        np.testing.assert_array_almost_equal(grid_out._dirs, dirs)
+        np.testing.assert_array_almost_equal(grid_out._vals, grid_expect._vals)
+
+    def test__squared_magnitude_reshaped_cached(self, rao):
+        freq = np.linspace(0.0, 5.0, 7)
+        dirs = np.linspace(0.1, 6.0, 11)
+
+        grid_out = rao._squared_magnitude_reshaped(freq, dirs)
+        assert rao._squared_magnitude_reshaped(freq.copy(), dirs.copy()) is grid_out
+        assert rao._squared_magnitude_reshaped(freq, dirs + 0.1) is not grid_out
+
+        rao.set_wave_convention(clockwise=False, waves_coming_from=False)
+        assert rao._squared_magnitude_reshaped(freq, dirs) is not grid_out
+
+    def test__squared_magnitude_reshaped_cache_size(self, rao):
+        freq = np.linspace(0.0, 5.0, 7)
+        dirs = np.linspace(0.1, 6.0, 11)
+
+        grid_first = rao._squared_magnitude_reshaped(freq, dirs)
+        for i in range(1, wr._core._RESHAPED_CACHE_SIZE):
+            rao._squared_magnitude_reshaped(freq, dirs + 0.01 * i)
+
+        # Most recently used coordinates are kept
+        assert rao._squared_magnitude_reshaped(freq, dirs) is grid_first
+        rao._squared_magnitude_reshaped(freq, dirs + 0.1)
+        assert rao._squared_magnitude_reshaped(freq, dirs) is grid_first
+
+        for i in range(wr._core._RESHAPED_CACHE_SIZE):
+            rao._squared_magnitude_reshaped(freq, dirs + 0.2 + 0.01 * i)
+        assert rao._squared_magnitude_reshaped(freq, dirs) is not grid_first
+
 
 class Test_DirectionalSpectrum:
     def test__init___hz_deg(self):
@@ -2786,6 +3248,37 @@ class Test_DirectionalSpectrum:
         with pytest.raises(ValueError):
             DirectionalSpectrum(freq, dirs, vals, freq_hz=True, degrees=True)
 
+    def test__init__copy_false(self):
+        freq = np.linspace(0, 1.0, 10)
+        dirs = np.linspace(0, 2.0 * np.pi, 15, endpoint=False)
+        vals = np.random.random((10, 15))
+
+        spectrum = DirectionalSpectrum(freq, dirs, vals, copy=False)
+        assert spectrum._vals is vals
+
+    def test__init__copy_false_hz(self):
+        freq = np.linspace(0, 1.0, 10)
+        dirs = np.linspace(0, 2.0 * np.pi, 15, endpoint=False)
+        vals = np.random.random((10, 15))
+        vals_org = vals.copy()
+
+        spectrum = DirectionalSpectrum(freq, dirs, vals, freq_hz=True, copy=False)
+        np.testing.assert_array_almost_equal(spectrum._vals, vals_org / (2.0 * np.pi))
+        np.testing.assert_array_equal(vals, vals_org)
+
+    def test__init__dtype(self):
+        freq = np.linspace(0, 1.0, 10)
+        dirs = np.linspace(0, 360.0, 15, endpoint=False)
+        vals = np.random.random((10, 15))
+
+        spectrum = DirectionalSpectrum(
+            freq, dirs, vals, freq_hz=True, degrees=True, dtype=np.float32
+        )
+        assert spectrum.dtype == np.float32
+        np.testing.assert_allclose(
+            spectrum._vals, vals / (2.0 * np.pi) * (180.0 / np.pi), rtol=1e-6
+        )
+
     def test__repr___(self, directional_spectrum):
         assert str(directional_spectrum) == "DirectionalSpectrum"
 
@@ -3088,6 +3581,87 @@ class Test_DirectionalSpectrum:
         np.testing.assert_array_almost_equal(freq_out, freq)
         np.testing.assert_array_almost_equal(vals1d_out, vals1d)
 
+    def test_from_spectrum1d_scalar_spread_fun(self):
+        freq = np.array([0.0, 0.5, 1.0])
+        dirs = np.array([0.0, 90.0, 180.0, 270.0])
+        spectrum1d = np.array([1.0, 2.0, 3.0])
+
+        def spread_fun(f, d):
+            if d > 180.0:
+                return 0.0
+            return np.cos(np.radians(d) / 2.0) ** 2
+
+        spectrum = DirectionalSpectrum.from_spectrum1d(
+            freq, dirs, spectrum1d, spread_fun, 45.0, freq_hz=False, degrees=True
+        )
+
+        vals_expect = np.array(
+            [
+                [
+                    0.0,
+                    np.cos(1 * np.pi / 8) ** 2 * 1.0,
+                    np.cos(3 * np.pi / 8) ** 2 * 1.0,
+                    0.0,
+                ],
+                [
+                    0.0,
+                    np.cos(1 * np.pi / 8) ** 2 * 2.0,
+                    np.cos(3 * np.pi / 8) ** 2 * 2.0,
+                    0.0,
+                ],
+                [
+                    0.0,
+                    np.cos(1 * np.pi / 8) ** 2 * 3.0,
+                    np.cos(3 * np.pi / 8) ** 2 * 3.0,
+                    0.0,
+                ],
+            ]
+        )
+        vals_expect = vals_expect / (np.pi / 180.0)
+
+        np.testing.assert_array_almost_equal(spectrum._vals, vals_expect)
+
+    def test_from_spectrum1d_spread_fun_wrong_shape(self):
+        freq = np.array([0.0, 0.5, 1.0])
+        dirs = np.array([0.0, 90.0, 180.0, 270.0])
+        spectrum1d = np.array([1.0, 2.0, 3.0])
+
+        def spread_fun(f, d):
+            # Frequency-independent, i.e., shape (1, M) for array input
+            return np.full_like(d, 0.25, dtype=float)
+
+        spectrum = DirectionalSpectrum.from_spectrum1d(
+            freq, dirs, spectrum1d, spread_fun, 0.0, freq_hz=False, degrees=True
+        )
+
+        vals_expect = np.tile(0.25 * spectrum1d.reshape(-1, 1), (1, 4))
+        vals_expect = vals_expect / (np.pi / 180.0)
+
+        np.testing.assert_array_almost_equal(spectrum._vals, vals_expect)
+
+    @pytest.mark.parametrize(
+        "spreading_type", [CosineFullSpreading, CosineHalfSpreading]
+    )
+    def test_from_spectrum1d_spreading(self, spreading_type):
+        freq = np.linspace(0.0, 1.0, 10)
+        dirs = np.linspace(0.0, 360.0, 36, endpoint=False)
+        spectrum1d = np.random.random(len(freq))
+        spread_fun = spreading_type(s=2, degrees=True)
+
+        spectrum = DirectionalSpectrum.from_spectrum1d(
+            freq, dirs, spectrum1d, spread_fun, 30.0, freq_hz=True, degrees=True
+        )
+
+        vals_expect = np.array(
+            [
+                [spread_fun(f_i, d_i - 30.0) * s_i for d_i in dirs]
+                for f_i, s_i in zip(freq, spectrum1d)
+            ]
+        )
+        vals_expect = vals_expect / (2.0 * np.pi) / (np.pi / 180.0)
+
+        np.testing.assert_array_almost_equal(spectrum._vals, vals_expect)
+
     def test_interpolate_hz_deg(self):
         a = 7
         b = 6
@@ -3185,6 +3759,38 @@ class Test_DirectionalSpectrum:
 
         assert var_out == pytest.approx(integral_expect)
 
+    def test_var_no_interpolation(self, directional_spectrum):
+        with patch.object(DirectionalSpectrum, "interpolate") as mock_interpolate:
+            directional_spectrum.var()
+            directional_spectrum.spectrum1d(axis=0)
+            directional_spectrum.spectrum1d(axis=1)
+            directional_spectrum.moment(2)
+        mock_interpolate.assert_not_called()
+
+    def test_quadrature_weights(self):
+        freq = np.array([0.0, 0.5, 2.0])
+        dirs = np.array([0.5, 1.0, 4.0])
+        spectrum = DirectionalSpectrum(freq, dirs, np.ones((3, 3)))
+
+        w_freq, w_dirs = spectrum._quadrature_weights()
+
+        np.testing.assert_array_almost_equal(w_freq, [0.25, 1.0, 0.75])
+        np.testing.assert_array_almost_equal(
+            w_dirs,
+            [
+                (1.0 - (4.0 - 2.0 * np.pi)) / 2.0,
+                (4.0 - 0.5) / 2.0,
+                ((0.5 + 2.0 * np.pi) - 1.0) / 2.0,
+            ],
+        )
+
+    def test_quadrature_weights_cached(self, directional_spectrum):
+        weights = directional_spectrum._quadrature_weights()
+        assert directional_spectrum._quadrature_weights() is weights
+
+        directional_spectrum.set_wave_convention(clockwise=False)
+        assert directional_spectrum._quadrature_weights() is not weights
+
     def test_std(self):
         y0 = 0.0
         y1 = 2
@@ -3744,6 +4350,35 @@ class Test_calculate_response:
         assert response._freq_hz is False
         assert response._degrees is False
 
+    @pytest.mark.parametrize("coord_freq", ["wave", "rao"])
+    @pytest.mark.parametrize("coord_dirs", ["wave", "rao"])
+    def test_calculate_response_single_precision(
+        self, rao, wave, coord_freq, coord_dirs
+    ):
+        response = calculate_response(
+            rao, wave, 0.3, coord_freq=coord_freq, coord_dirs=coord_dirs
+        )
+        response_single = calculate_response(
+            rao.astype(np.float32),
+            wave.astype(np.float32),
+            0.3,
+            coord_freq=coord_freq,
+            coord_dirs=coord_dirs,
+        )
+
+        assert response_single.dtype == np.float32
+        np.testing.assert_allclose(
+            response_single._vals, response._vals, rtol=1e-5, atol=1e-7
+        )
+
+        # Integrals are accumulated in double precision
+        var = response_single.var()
+        m2 = response_single.moment(2)
+        assert var.dtype == np.float64
+        assert m2.dtype == np.float64
+        assert var == pytest.approx(response.var(), rel=1e-6)
+        assert m2 == pytest.approx(response.moment(2), rel=1e-6)
+
     def test_calculate_response_raises_coord_freq(self, rao, wave):
         with pytest.raises(ValueError):
             calculate_response(rao, wave, 0.0, coord_freq="invalid-value")
@@ -4006,6 +4641,480 @@ class Test_calculate_response:
         assert response._clockwise == rao._clockwise
         assert response._waves_coming_from == rao._waves_coming_from
 
+    def test_calculate_response_rao_reused(self, rao, wave):
+        response_1 = calculate_response(rao, wave, 0.3)
+        response_2 = calculate_response(rao, wave, 0.3)
+        np.testing.assert_array_almost_equal(response_1._vals, response_2._vals)
+
+        # Changes to the RAO are reflected in the response
+        rao_copy = rao.copy()
+        rao.set_wave_convention(clockwise=False, waves_coming_from=False)
+        rao_copy.set_wave_convention(clockwise=False, waves_coming_from=False)
+        response_3 = calculate_response(rao, wave, 0.3)
+        response_expect = calculate_response(rao_copy, wave, 0.3)
+        np.testing.assert_array_almost_equal(response_3._vals, response_expect._vals)
+        assert response_3.wave_convention == response_expect.wave_convention
+
+    @pytest.mark.parametrize("coord_dirs", ["wave", "rao"])
+    def test_calculate_response_uniform_no_interpolation(self, coord_dirs):
+        freq = np.linspace(0.1, 1.0, 10)
+        dirs = np.arange(0.0, 360.0, 10.0)
+        rng = np.random.default_rng(0)
+        vals = rng.random((10, 36)) + 1j * rng.random((10, 36))
+        rao = RAO(freq, dirs, vals, degrees=True)
+        wave = WaveSpectrum(freq, dirs, rng.random((10, 36)), degrees=True)
+
+        with wr.profile(memory=False) as prof:
+            response = calculate_response(
+                rao, wave, 30.0, heading_degrees=True, coord_dirs=coord_dirs
+            )
+        assert "Grid.reshape" not in prof.stats
+        assert "Grid._interpolate_function" not in prof.stats
+
+        # Same as a heading just off the grid (which is interpolated)
+        response_expect = calculate_response(
+            rao, wave, 30.0 - 1e-7, heading_degrees=True, coord_dirs=coord_dirs
+        )
+        np.testing.assert_allclose(
+            response._vals, response_expect._vals, rtol=1e-6, atol=1e-8
+        )
+        np.testing.assert_array_almost_equal(response._dirs, response_expect._dirs)
+
+
+class Test_response_moments:
+    @pytest.fixture
+    def rao_wave(self):
+        rng = np.random.default_rng(0)
+        freq = np.linspace(0.05, 2.0, 20)
+        dirs = np.linspace(0.0, 360.0, 12, endpoint=False)
+        rao = RAO(
+            freq,
+            dirs,
+            rng.random((20, 12)) + 1j * rng.random((20, 12)),
+            degrees=True,
+            clockwise=True,
+        )
+        wave = WaveSpectrum(
+            np.linspace(0.02, 0.35, 15),
+            np.linspace(3.0, 357.0, 10),
+            rng.random((15, 10)),
+            freq_hz=True,
+            degrees=True,
+            waves_coming_from=False,
+        )
+        return rao, wave
+
+    @pytest.mark.parametrize("coord_freq", ["wave", "rao"])
+    @pytest.mark.parametrize("coord_dirs", ["wave", "rao"])
+    @pytest.mark.parametrize("freq_hz", [False, True])
+    def test_response_moments(self, rao_wave, coord_freq, coord_dirs, freq_hz):
+        rao, wave = rao_wave
+        response = calculate_response(
+            rao,
+            wave,
+            33.0,
+            heading_degrees=True,
+            coord_freq=coord_freq,
+            coord_dirs=coord_dirs,
+        )
+
+        moments_out = response_moments(
+            rao,
+            wave,
+            33.0,
+            n=(0, 1, 2, 4),
+            heading_degrees=True,
+            coord_freq=coord_freq,
+            coord_dirs=coord_dirs,
+            freq_hz=freq_hz,
+        )
+        moments_expect = [response.moment(n, freq_hz=freq_hz) for n in (0, 1, 2, 4)]
+
+        assert moments_out.shape == (4,)
+        np.testing.assert_allclose(moments_out, moments_expect, rtol=1e-12)
+
+    def test_response_moments_default(self, rao_wave):
+        rao, wave = rao_wave
+        response = calculate_response(rao, wave, 0.5)
+
+        m0, m2 = response_moments(rao, wave, 0.5)
+        assert m0 == pytest.approx(response.var())
+        assert m2 == pytest.approx(response.moment(2, freq_hz=False))
+
+    def test_response_moments_scalar(self, rao_wave):
+        rao, wave = rao_wave
+        m0 = response_moments(rao, wave, 0.5, n=0)
+        assert np.ndim(m0) == 0
+        assert m0 == pytest.approx(calculate_response(rao, wave, 0.5).var())
+
+    @pytest.mark.parametrize("n", [(0, 2, 4), 2])
+    def test_response_moments_raoset(self, rao_wave, n):
+        rao, wave = rao_wave
+        rng = np.random.default_rng(1)
+        raoset = RAOSet(
+            rao._freq,
+            rao._dirs,
+            rng.random((6, 20, 12)) + 1j * rng.random((6, 20, 12)),
+            clockwise=True,
+        )
+
+        moments_out = response_moments(
+            raoset, wave, 33.0, n=n, heading_degrees=True, freq_hz=True
+        )
+        moments_expect = np.stack(
+            [
+                response_moments(
+                    rao_i, wave, 33.0, n=n, heading_degrees=True, freq_hz=True
+                )
+                for rao_i in raoset
+            ],
+            axis=-1,
+        )
+
+        assert moments_out.shape == np.shape(n) + (6,)
+        np.testing.assert_allclose(moments_out, moments_expect, rtol=1e-12)
+
+        std_out = response_std(raoset, wave, 33.0, heading_degrees=True)
+        std_expect = [
+            response_std(rao_i, wave, 33.0, heading_degrees=True) for rao_i in raoset
+        ]
+        np.testing.assert_allclose(std_out, std_expect, rtol=1e-12)
+
+    def test_response_moments_unchanged(self, rao_wave):
+        rao, wave = rao_wave
+        rao_copy, wave_copy = rao.copy(), wave.copy()
+
+        response_moments(rao, wave, 0.5, coord_freq="rao", coord_dirs="rao")
+
+        for grid, grid_copy in ((rao, rao_copy), (wave, wave_copy)):
+            np.testing.assert_array_equal(grid._freq, grid_copy._freq)
+            np.testing.assert_array_equal(grid._dirs, grid_copy._dirs)
+            np.testing.assert_array_equal(grid._vals, grid_copy._vals)
+            assert grid.wave_convention == grid_copy.wave_convention
+
+    def test_response_moments_raises_coord_freq(self, rao_wave):
+        rao, wave = rao_wave
+        with pytest.raises(ValueError):
+            response_moments(rao, wave, 0.0, coord_freq="invalid-value")
+
+    def test_response_moments_raises_coord_dirs(self, rao_wave):
+        rao, wave = rao_wave
+        with pytest.raises(ValueError):
+            response_moments(rao, wave, 0.0, coord_dirs="invalid-value")
+
+
+class Test_response_std:
+    @pytest.mark.parametrize("coord_freq", ["wave", "rao"])
+    @pytest.mark.parametrize("coord_dirs", ["wave", "rao"])
+    def test_response_std(self, rao, wave, coord_freq, coord_dirs):
+        std_out = response_std(
+            rao,
+            wave,
+            45.0,
+            heading_degrees=True,
+            coord_freq=coord_freq,
+            coord_dirs=coord_dirs,
+        )
+        std_expect = calculate_response(
+            rao,
+            wave,
+            45.0,
+            heading_degrees=True,
+            coord_freq=coord_freq,
+            coord_dirs=coord_dirs,
+        ).std()
+
+        assert std_out == pytest.approx(std_expect, rel=1e-12)
+
+
+class Test_heading_sweep:
+    @pytest.mark.parametrize(
+        "coord_freq,coord_dirs,clockwise,waves_coming_from",
+        list(product(("wave", "rao"), ("wave", "rao"), (True, False), (True, False))),
+    )
+    def test_heading_sweep(self, coord_freq, coord_dirs, clockwise, waves_coming_from):
+        freq_rao = np.linspace(0.0, 1.2, 15)
+        dirs_rao = np.linspace(0.0, 360.0, 12, endpoint=False)
+        rao = RAO.from_amp_phase(
+            freq_rao,
+            dirs_rao,
+            np.random.random((15, 12)),
+            np.random.random((15, 12)),
+            clockwise=False,
+            waves_coming_from=True,
+        )
+
+        freq_wave = np.linspace(0.05, 1.0, 20)
+        dirs_wave = np.linspace(0.0, 360.0, 24, endpoint=False)
+        wave = WaveSpectrum(
+            freq_wave,
+            dirs_wave,
+            np.random.random((20, 24)),
+            freq_hz=True,
+            degrees=True,
+            clockwise=clockwise,
+            waves_coming_from=waves_coming_from,
+        )
+
+        headings = np.array([0.0, 10.0, 33.3, 95.0, 180.0, 359.9])
+        freq_out, dirs_out, vals_out = heading_sweep(
+            rao,
+            wave,
+            headings,
+            heading_degrees=True,
+            coord_freq=coord_freq,
+            coord_dirs=coord_dirs,
+        )
+        var_out = heading_sweep(
+            rao,
+            wave,
+            headings,
+            heading_degrees=True,
+            coord_freq=coord_freq,
+            coord_dirs=coord_dirs,
+            output="var",
+        )
+
+        assert vals_out.shape == (len(headings), len(freq_out), dirs_out.shape[1])
+        for i, heading_i in enumerate(headings):
+            response_expect = calculate_response(
+                rao,
+                wave,
+                heading_i,
+                heading_degrees=True,
+                coord_freq=coord_freq,
+                coord_dirs=coord_dirs,
+            )
+            np.testing.assert_array_almost_equal(freq_out, response_expect._freq)
+            np.testing.assert_array_almost_equal(dirs_out[i], response_expect._dirs)
+            np.testing.assert_array_almost_equal(vals_out[i], response_expect._vals)
+            assert var_out[i] == pytest.approx(response_expect.var())
+
+    def test_heading_sweep_radians(self, rao, wave):
+        headings = np.array([0.0, np.pi / 3.0, np.pi])
+        var_out = heading_sweep(rao, wave, headings, output="var")
+        var_expect = [calculate_response(rao, wave, h).var() for h in headings]
+        np.testing.assert_array_almost_equal(var_out, var_expect)
+
+    @pytest.mark.parametrize("coord_dirs", ["wave", "rao"])
+    @pytest.mark.parametrize("clockwise", [True, False])
+    def test_heading_sweep_grid_headings(self, make_rao, coord_dirs, clockwise):
+        # Same (uniform) directions, and headings at multiples of the direction
+        # step, such that no direction interpolation is needed
+        rao = make_rao()
+        wave = WaveSpectrum(
+            np.linspace(0.0, 0.6, 15),
+            rao.dirs(degrees=True),
+            np.random.default_rng(2).random((15, 12)),
+            freq_hz=True,
+            degrees=True,
+            clockwise=clockwise,
+        )
+        headings = np.linspace(0.0, 360.0, 12, endpoint=False)
+
+        _, dirs_out, vals_out = heading_sweep(
+            rao, wave, headings, heading_degrees=True, coord_dirs=coord_dirs
+        )
+        var_out = heading_sweep(
+            rao,
+            wave,
+            headings,
+            heading_degrees=True,
+            coord_dirs=coord_dirs,
+            output="var",
+        )
+
+        for i, heading_i in enumerate(headings):
+            response_expect = calculate_response(
+                rao, wave, heading_i, heading_degrees=True, coord_dirs=coord_dirs
+            )
+            np.testing.assert_array_almost_equal(dirs_out[i], response_expect._dirs)
+            np.testing.assert_array_almost_equal(vals_out[i], response_expect._vals)
+            assert var_out[i] == pytest.approx(response_expect.var())
+
+    def test_heading_sweep_raises_coord_freq(self, rao, wave):
+        with pytest.raises(ValueError):
+            heading_sweep(rao, wave, [0.0], coord_freq="invalid-input")
+
+    def test_heading_sweep_raises_coord_dirs(self, rao, wave):
+        with pytest.raises(ValueError):
+            heading_sweep(rao, wave, [0.0], coord_dirs="invalid-input")
+
+    def test_heading_sweep_raises_output(self, rao, wave):
+        with pytest.raises(ValueError):
+            heading_sweep(rao, wave, [0.0], output="invalid-input")
+
+
+class Test_heading_sweep_fft:
+    @pytest.mark.parametrize(
+        "clockwise,waves_coming_from,coord_freq,coord_dirs",
+        list(product((True, False), (True, False), ("wave", "rao"), ("wave", "rao"))),
+    )
+    def test_heading_sweep_fft(
+        self, clockwise, waves_coming_from, coord_freq, coord_dirs
+    ):
+        rng = np.random.default_rng(0)
+        rao = RAO(
+            np.linspace(0.05, 1.0, 15),
+            np.linspace(0.0, 360.0, 24, endpoint=False),
+            rng.random((15, 24)) + 1j * rng.random((15, 24)),
+            freq_hz=True,
+            degrees=True,
+            clockwise=False,
+            waves_coming_from=True,
+        )
+        wave = WaveSpectrum(
+            np.linspace(0.0, 1.2, 20),
+            np.linspace(5.0, 365.0, 36, endpoint=False),
+            rng.random((20, 36)),
+            freq_hz=True,
+            degrees=True,
+            clockwise=clockwise,
+            waves_coming_from=waves_coming_from,
+        )
+
+        headings, var = heading_sweep_fft(
+            rao,
+            wave,
+            heading_degrees=True,
+            coord_freq=coord_freq,
+            coord_dirs=coord_dirs,
+        )
+
+        n_dirs = 36 if coord_dirs == "wave" else 24
+        headings_expect = np.linspace(0.0, 360.0, n_dirs, endpoint=False)
+        np.testing.assert_array_almost_equal(headings, headings_expect)
+
+        var_expect = [
+            calculate_response(
+                rao,
+                wave,
+                heading,
+                heading_degrees=True,
+                coord_freq=coord_freq,
+                coord_dirs=coord_dirs,
+            ).var()
+            for heading in headings_expect
+        ]
+        np.testing.assert_allclose(var, var_expect, rtol=1e-10)
+
+    def test_heading_sweep_fft_radians(self, rao, wave):
+        headings, var = heading_sweep_fft(rao, wave)
+        headings_deg, var_deg = heading_sweep_fft(rao, wave, heading_degrees=True)
+        np.testing.assert_array_almost_equal(headings, np.radians(headings_deg))
+        np.testing.assert_array_almost_equal(var, var_deg)
+
+        var_expect = heading_sweep(rao, wave, headings, output="var")
+        np.testing.assert_allclose(var, var_expect, rtol=1e-10)
+
+    def test_heading_sweep_fft_raises_not_uniform(self, rao):
+        wave = WaveSpectrum(
+            np.linspace(0.0, 1.0, 10),
+            [0.0, 10.0, 90.0, 180.0],
+            np.ones((10, 4)),
+            degrees=True,
+        )
+        with pytest.raises(ValueError):
+            heading_sweep_fft(rao, wave)
+        heading_sweep_fft(rao, wave, coord_dirs="rao")
+
+    def test_heading_sweep_fft_raises_coord_freq(self, rao, wave):
+        with pytest.raises(ValueError):
+            heading_sweep_fft(rao, wave, coord_freq="invalid-input")
+
+    def test_heading_sweep_fft_raises_coord_dirs(self, rao, wave):
+        with pytest.raises(ValueError):
+            heading_sweep_fft(rao, wave, coord_dirs="invalid-input")
+
+
+class Test_calculate_response_batch:
+    @pytest.mark.parametrize(
+        "freq_hz,degrees,clockwise,waves_coming_from",
+        list(product((True, False), (True, False), (True, False), (True, False))),
+    )
+    def test_calculate_response_batch(
+        self, freq_hz, degrees, clockwise, waves_coming_from
+    ):
+        rao = RAO.from_amp_phase(
+            np.linspace(0.0, 1.2, 15),
+            np.linspace(0.0, 360.0, 12, endpoint=False),
+            np.random.random((15, 12)),
+            np.random.random((15, 12)),
+            clockwise=False,
+            waves_coming_from=True,
+        )
+
+        freq = np.linspace(0.05, 1.0, 20)
+        dirs = np.linspace(0.0, 360.0, 24, endpoint=False)
+        if not freq_hz:
+            freq = 2.0 * np.pi * freq
+        if not degrees:
+            dirs = (np.pi / 180.0) * dirs
+        vals = np.random.random((5, 20, 24))
+
+        var_out, tz_out = calculate_response_batch(
+            rao,
+            freq,
+            dirs,
+            vals,
+            45.0,
+            heading_degrees=True,
+            freq_hz=freq_hz,
+            degrees=degrees,
+            clockwise=clockwise,
+            waves_coming_from=waves_coming_from,
+        )
+
+        assert var_out.shape == (5,)
+        assert tz_out.shape == (5,)
+        for i, vals_i in enumerate(vals):
+            wave_i = WaveSpectrum(
+                freq,
+                dirs,
+                vals_i,
+                freq_hz=freq_hz,
+                degrees=degrees,
+                clockwise=clockwise,
+                waves_coming_from=waves_coming_from,
+            )
+            response_expect = calculate_response(
+                rao, wave_i, 45.0, heading_degrees=True
+            )
+            assert var_out[i] == pytest.approx(response_expect.var())
+            assert tz_out[i] == pytest.approx(response_expect.tz)
+
+    def test_calculate_response_batch_raises_shape(self, rao, freq_dirs):
+        freq, dirs = freq_dirs
+        with pytest.raises(ValueError):
+            calculate_response_batch(
+                rao, freq, dirs, np.ones((len(freq), len(dirs))), 0.0, degrees=True
+            )
+
+
+class Test__trapezoid_weights:
+    def test__trapezoid_weights(self):
+        x = np.array([0.0, 0.5, 2.0, 3.0])
+        y = np.random.random(4)
+        w = _trapezoid_weights(x)
+        assert np.sum(w * y) == pytest.approx(trapezoid(y, x))
+
+    def test__trapezoid_weights_periodic(self):
+        x = np.array([0.5, 1.0, 4.0])
+        w_out = _trapezoid_weights_periodic(x)
+        w_expect = np.array(
+            [
+                (1.0 - (4.0 - 2.0 * np.pi)) / 2.0,
+                (4.0 - 0.5) / 2.0,
+                ((0.5 + 2.0 * np.pi) - 1.0) / 2.0,
+            ]
+        )
+        np.testing.assert_array_almost_equal(w_out, w_expect)
+        assert np.sum(w_out) == pytest.approx(2.0 * np.pi)
+
+    def test__trapezoid_weights_periodic_single(self):
+        w_out = _trapezoid_weights_periodic(np.array([1.0]))
+        np.testing.assert_array_almost_equal(w_out, [2.0 * np.pi])
+
 
 class Test__check_is_similar:
     def test_check_is_similar(self):
@@ -4204,6 +5313,55 @@ class Test__check_is_similar:
             _check_is_similar(grid_a, grid_b, grid_c)
 
 
+class Test_BaseSpreading:
+    class FrequencySpreading(wr.BaseSpreading):
+        """
+        Custom (vectorized) spreading function.
+        """
+
+        def __init__(self, freq_hz=False, degrees=False):
+            self.calls = 0
+            super().__init__(freq_hz=freq_hz, degrees=degrees)
+
+        def _spread_fun(self, omega, theta, /):
+            self.calls += 1
+            return 1.0 + 0.1 * omega * np.cos(theta)
+
+    def test__call__(self):
+        spreading = self.FrequencySpreading(freq_hz=True, degrees=True)
+        spread_out = spreading(0.5, 360.0 + 60.0)
+        assert spread_out == pytest.approx((1.0 + 0.1 * np.pi * 0.5) / 360.0)
+
+    def test__call__array(self):
+        spreading = self.FrequencySpreading(freq_hz=False, degrees=False)
+        freq = np.array([0.0, 0.5, 1.0]).reshape(-1, 1)
+        dirs = np.linspace(0.0, 2.0 * np.pi, 8, endpoint=False)
+
+        spread_out = spreading(freq, dirs)
+
+        spread_expect = (1.0 + 0.1 * freq * np.cos(dirs)) / (2.0 * np.pi)
+        np.testing.assert_array_almost_equal(spread_out, spread_expect)
+        assert spreading.calls == 1
+
+    def test_from_spectrum1d(self):
+        spreading = self.FrequencySpreading(freq_hz=True, degrees=True)
+        freq = np.linspace(0.0, 1.0, 10)
+        dirs = np.linspace(0.0, 360.0, 36, endpoint=False)
+
+        spectrum = DirectionalSpectrum.from_spectrum1d(
+            freq, dirs, np.ones(10), spreading, 0.0, freq_hz=True, degrees=True
+        )
+
+        assert spreading.calls == 1
+        np.testing.assert_array_almost_equal(
+            spectrum.spectrum1d(axis=1, freq_hz=True)[1], np.ones(10)
+        )
+
+    def test_abstract(self):
+        with pytest.raises(TypeError):
+            wr.BaseSpreading()
+
+
 class Test_CosineFullSpreading:
     def test__init__(self):
         spreading = CosineFullSpreading(123, degrees=True)
@@ -4297,6 +5455,33 @@ class Test_CosineFullSpreading:
 
         assert len(np.unique(np.array(spread_out_list))) == 1
 
+    @pytest.mark.parametrize("s", [0, 1, 2.5, 10])
+    def test_normalization_constant(self, s):
+        spreading = CosineFullSpreading(s)
+        c_expect = 2 ** (2 * s) * gamma(s + 1) ** 2 / gamma(2 * s + 1)
+        assert spreading._c == pytest.approx(c_expect)
+
+    def test_large_s(self):
+        spreading = CosineFullSpreading(200, degrees=True)
+        assert np.isfinite(spreading(0.0, 0.0))
+        assert quad(lambda d: spreading(0.0, d), -90.0, 90.0)[0] == pytest.approx(1)
+
+    def test__call__array(self):
+        spreading = CosineFullSpreading(2, degrees=True)
+        freq = np.array([0.0, 0.5, 1.0]).reshape(-1, 1)
+        dirs = np.linspace(-180.0, 540.0, 25)
+
+        spread_out = spreading(freq, dirs)
+
+        spread_expect = [[spreading(f, d) for d in dirs] for f in freq[:, 0]]
+        assert spread_out.shape == (3, 25)
+        np.testing.assert_array_almost_equal(spread_out, spread_expect)
+
+    def test__call__broadcast(self):
+        spreading = CosineFullSpreading(2, degrees=True)
+        assert spreading([0.1, 0.2, 0.3], 45.0).shape == (3,)
+        assert isinstance(spreading(0.1, 45.0), float)
+
 
 class Test_CosineHalfSpreading:
     def test__init__(self):
@@ -4305,6 +5490,24 @@ class Test_CosineHalfSpreading:
         assert spreading._s == 123
         assert spreading._degrees is True
 
+    @pytest.mark.parametrize("s", [0, 1, 2.5, 10])
+    def test_normalization_constant(self, s):
+        spreading = CosineHalfSpreading(s)
+        c_expect = 2 ** (2 * s + 1) * gamma(s + 1) ** 2 / gamma(2 * s + 1)
+        assert spreading._c == pytest.approx(c_expect)
+
+    def test__call__array(self):
+        spreading = CosineHalfSpreading(2, degrees=True)
+        freq = np.array([0.0, 0.5, 1.0]).reshape(-1, 1)
+        dirs = np.linspace(-180.0, 540.0, 25)
+
+        spread_out = spreading(freq, dirs)
+
+        spread_expect = [[spreading(f, d) for d in dirs] for f in freq[:, 0]]
+        assert spread_out.shape == (3, 25)
+        np.testing.assert_array_almost_equal(spread_out, spread_expect)
+        assert np.all(spread_out[:, (dirs % 360 > 90) & (dirs % 360 < 270)] == 0.0)
+
     def test_integrate_degrees(self):
         def integrate(spread_fun, a, b):
             f0 = 1
@@ -0,0 +1,69 @@
+import subprocess
+import sys
+
+import pytest
+
+# Heavy dependencies that should only be imported on first use
+LAZY_MODULES = [
+    "pandas",
+    "pyarrow",
+    "scipy.integrate",
+    "scipy.interpolate",
+    "scipy.sparse",
+    "scipy.special",
+]
+
+
+def imported_modules(code):
+    """
+    Modules imported after running code in a fresh interpreter.
+    """
+    code += "\nimport sys\nprint('\\n'.join(sys.modules))\n"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+class Test_import:
+    def test_lazy_imports(self):
+        modules = imported_modules("import waveresponse")
+        assert "waveresponse" in modules
+        for name in LAZY_MODULES:
+            assert name not in modules
+
+    def test_jonswap(self):
+        modules = imported_modules(
+            "import numpy as np\n"
+            "import waveresponse as wr\n"
+            "wr.JONSWAP(np.linspace(0.1, 2.0, 100))(3.5, 10.0)\n"
+        )
+        for name in LAZY_MODULES:
+            assert name not in modules
+
+    def test_spreading(self):
+        modules = imported_modules(
+            "import waveresponse as wr\n"
+            "wr.CosineFullSpreading(2)(0.1, 0.5)\n"
+            "wr.CosineHalfSpreading(2)(0.1, 0.5)\n"
+        )
+        for name in LAZY_MODULES:
+            assert name not in modules
+
+    @pytest.mark.parametrize(
+        "code,name",
+        [
+            (
+                "wr.Grid([0.1, 0.2], [0.0, 1.0], np.ones((2, 2)))"
+                ".interpolate([0.15], [0.5])",
+                "scipy.interpolate",
+            ),
+            ("wr.OchiHubble(np.linspace(0.1, 2.0, 10))(3.5, 10.0)", "scipy.special"),
+            ("wr.ProfileResult().to_dataframe()", "pandas"),
+        ],
+    )
+    def test_loaded_on_first_use(self, code, name):
+        modules = imported_modules(
+            "import numpy as np\nimport waveresponse as wr\n" + code
+        )
+        assert name in modules
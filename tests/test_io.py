@@ -0,0 +1,306 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from waveresponse import (
+    RAO,
+    DirectionalSpectrum,
+    Grid,
+    GridLibrary,
+    ResultsWriter,
+    write_library,
+)
+
+TEST_PATH = Path(__file__).parent
+
+
+@pytest.fixture
+def grids(make_wave):
+    freq = np.linspace(0.05, 0.5, 10)
+    dirs = np.linspace(0.0, 360.0, 12, endpoint=False)
+    rng = np.random.default_rng(1)
+
+    rao = RAO.from_amp_phase(
+        freq,
+        dirs,
+        rng.random((10, 12)),
+        rng.random((10, 12)),
+        phase_degrees=False,
+        phase_leading=False,
+    )
+    spectrum = DirectionalSpectrum(
+        freq,
+        dirs[::2],
+        rng.random((10, 6)),
+        degrees=True,
+        clockwise=True,
+        waves_coming_from=False,
+    )
+    grid = Grid(freq, dirs, rng.random((10, 12)) + 1j, freq_hz=True, degrees=True)
+    return {"vessel/rao": rao, "wave": make_wave(), "spectrum": spectrum, "grid": grid}
+
+
+def assert_grids_equal(grid_out, grid_expect):
+    assert type(grid_out) is type(grid_expect)
+    np.testing.assert_array_equal(grid_out._freq, grid_expect._freq)
+    np.testing.assert_array_equal(grid_out._dirs, grid_expect._dirs)
+    np.testing.assert_array_equal(grid_out._vals, grid_expect._vals)
+    assert grid_out._vals.dtype == grid_expect._vals.dtype
+    assert grid_out._freq_hz == grid_expect._freq_hz
+    assert grid_out._degrees == grid_expect._degrees
+    assert grid_out.wave_convention == grid_expect.wave_convention
+
+
+class Test_write_library:
+    @pytest.mark.parametrize("filename", ["library.arrow", "library.parquet"])
+    def test_round_trip(self, tmp_path, grids, filename):
+        path = tmp_path / filename
+        write_library(path, grids)
+
+        with GridLibrary(path) as library:
+            assert library.keys() == list(grids)
+            for key, grid in grids.items():
+                assert_grids_equal(library[key], grid)
+
+    @pytest.mark.parametrize("format", ["arrow", "parquet"])
+    def test_format(self, tmp_path, grids, format):
+        path = tmp_path / "library.dat"
+        write_library(path, grids, format=format)
+
+        with GridLibrary(path, format=format) as library:
+            assert_grids_equal(library["wave"], grids["wave"])
+
+    @pytest.mark.parametrize("filename", ["library.arrow", "library.parquet"])
+    def test_round_trip_float32(self, tmp_path, grids, filename):
+        grids = {key: grid.astype(np.float32) for key, grid in grids.items()}
+        path = tmp_path / filename
+        write_library(path, grids)
+
+        with GridLibrary(path) as library:
+            for key, grid in grids.items():
+                assert_grids_equal(library[key], grid)
+
+            assert library["wave"]._vals.dtype == np.float32
+            assert library["vessel/rao"]._vals.dtype == np.complex64
+
+    def test_rao_phase_convention(self, tmp_path, grids):
+        path = tmp_path / "library.arrow"
+        write_library(path, grids)
+
+        with GridLibrary(path) as library:
+            rao = library["vessel/rao"]
+
+        assert rao._phase_degrees is False
+        assert rao._phase_leading is False
+        for out, expect in zip(rao.to_amp_phase(), grids["vessel/rao"].to_amp_phase()):
+            np.testing.assert_array_almost_equal(out, expect)
+
+    def test_csv_rao(self, tmp_path):
+        rao_df = pd.read_csv(
+            TEST_PATH / "testdata" / "rao_heave_symmetric.csv", index_col=0
+        )
+        rao = RAO(
+            rao_df.index.astype(float),
+            rao_df.columns.astype(float),
+            rao_df.values.astype(complex),
+        )
+
+        path = tmp_path / "library.arrow"
+        write_library(path, {"heave": rao})
+        with GridLibrary(path) as library:
+            assert_grids_equal(library["heave"], rao)
+
+    def test_raises_keys(self, tmp_path, grids):
+        with pytest.raises(ValueError):
+            write_library(
+                tmp_path / "library.arrow", {1: grids["wave"], "1": grids["grid"]}
+            )
+
+    def test_raises_type(self, tmp_path):
+        with pytest.raises(ValueError):
+            write_library(tmp_path / "library.arrow", {"a": np.zeros((2, 2))})
+
+    def test_raises_format(self, tmp_path, grids):
+        with pytest.raises(ValueError):
+            write_library(tmp_path / "library.arrow", grids, format="csv")
+
+
+class Test_GridLibrary:
+    @pytest.fixture
+    def path(self, tmp_path, grids):
+        path = tmp_path / "library.arrow"
+        write_library(path, grids)
+        return path
+
+    def test_mapping(self, path, grids):
+        with GridLibrary(path) as library:
+            assert len(library) == 4
+            assert list(library) == list(grids)
+            assert "wave" in library
+            assert "foo" not in library
+            assert repr(library) == "GridLibrary(4 grids)"
+
+    def test_zero_copy(self, path):
+        with GridLibrary(path) as library:
+            rao = library["vessel/rao"]
+
+        assert not rao._vals.flags.owndata
+        assert not rao._vals.flags.writeable
+
+    def test_lazy(self, path, grids):
+        with patch("pyarrow.ipc.RecordBatchFileReader.get_batch") as mock_get_batch:
+            library = GridLibrary(path)
+            mock_get_batch.assert_not_called()
+            library.close()
+
+        with GridLibrary(path) as library:
+            with patch.object(
+                library._file, "get_batch", wraps=library._file.get_batch
+            ) as mock_get_batch:
+                library["spectrum"]
+            mock_get_batch.assert_called_once_with(2)
+
+    def test_lazy_parquet(self, tmp_path, grids):
+        path = tmp_path / "library.parquet"
+        write_library(path, grids)
+
+        with GridLibrary(path) as library:
+            with patch.object(
+                library._file, "read_row_group", wraps=library._file.read_row_group
+            ) as mock_read:
+                library.coords("wave")
+            mock_read.assert_called_once_with(
+                1, columns=["freq", "dirs", "freq_hz", "degrees"]
+            )
+
+    @pytest.mark.parametrize("filename", ["library.arrow", "library.parquet"])
+    def test_coords(self, tmp_path, grids, filename):
+        path = tmp_path / filename
+        write_library(path, grids)
+
+        with GridLibrary(path) as library:
+            freq, dirs = library.coords("wave")
+
+        np.testing.assert_array_almost_equal(freq, grids["wave"].freq())
+        np.testing.assert_array_almost_equal(dirs, grids["wave"].dirs())
+
+    def test_no_memory_map(self, path, grids):
+        with GridLibrary(path, memory_map=False) as library:
+            assert_grids_equal(library["grid"], grids["grid"])
+
+    def test_raises_key(self, path):
+        with GridLibrary(path) as library:
+            with pytest.raises(KeyError):
+                library["foo"]
+
+
+class Test_ResultsWriter:
+    def test_append(self, tmp_path):
+        path = tmp_path / "results.parquet"
+        with ResultsWriter(path, row_group_size=4) as writer:
+            for i in range(5):
+                writer.append(
+                    heading=np.array([0.0, 90.0]), dof="heave", i=i, std=[1.0, 2.0]
+                )
+            assert writer.n_rows == 10
+
+        df = pd.read_parquet(path)
+        assert list(df.columns) == ["heading", "dof", "i", "std"]
+        assert len(df) == 10
+        np.testing.assert_array_equal(df["heading"], [0.0, 90.0] * 5)
+        np.testing.assert_array_equal(df["i"], np.repeat(np.arange(5), 2))
+        assert (df["dof"] == "heave").all()
+
+        metadata = pq.ParquetFile(path).metadata
+        assert metadata.num_row_groups == 3
+        assert [metadata.row_group(i).num_rows for i in range(3)] == [4, 4, 2]
+
+    def test_bounded_buffer(self, tmp_path):
+        path = tmp_path / "results.parquet"
+        writer = ResultsWriter(path, row_group_size=10)
+        for i in range(25):
+            writer.append(i=i, std=0.1 * i)
+            assert writer._n_buffered < 10
+        writer.close()
+
+        df = pd.read_parquet(path)
+        np.testing.assert_array_equal(df["i"], np.arange(25))
+        assert pq.ParquetFile(path).metadata.num_row_groups == 3
+
+    def test_append_response(self, tmp_path, make_wave):
+        responses = [make_wave(seed=i) for i in range(3)]
+        times = pd.date_range("2020-01-01", periods=3, freq="3h")
+
+        path = tmp_path / "results.parquet"
+        with ResultsWriter(path) as writer:
+            for time, response in zip(times, responses):
+                writer.append_response(
+                    response, t=3600.0, time=time, dof="roll", point=1
+                )
+
+        df = pd.read_parquet(path)
+        assert list(df.columns) == ["time", "dof", "point", "std", "tz", "extreme"]
+        np.testing.assert_array_equal(df["time"], times)
+        np.testing.assert_array_almost_equal(
+            df["std"], [response.std() for response in responses]
+        )
+        np.testing.assert_array_almost_equal(
+            df["tz"], [response.tz for response in responses]
+        )
+        np.testing.assert_array_almost_equal(
+            df["extreme"], [response.extreme(3600.0) for response in responses]
+        )
+
+    def test_append_response_quantiles(self, tmp_path, wave):
+        q = np.array([0.37, 0.5, 0.9])
+
+        path = tmp_path / "results.parquet"
+        with ResultsWriter(path) as writer:
+            writer.append_response(wave, t=3600.0, q=q, dof="roll")
+
+        df = pd.read_parquet(path)
+        assert list(df.columns) == ["dof", "std", "tz", "q", "extreme"]
+        np.testing.assert_array_equal(df["q"], q)
+        np.testing.assert_array_almost_equal(df["extreme"], wave.extreme(3600.0, q=q))
+
+    def test_no_appends(self, tmp_path):
+        path = tmp_path / "results.parquet"
+        with ResultsWriter(path):
+            pass
+        assert not path.exists()
+
+    def test_no_rows(self, tmp_path):
+        path = tmp_path / "results.parquet"
+        with ResultsWriter(path) as writer:
+            writer.append(heading=np.array([]), dof="heave", std=np.array([]))
+
+        df = pd.read_parquet(path)
+        assert list(df.columns) == ["heading", "dof", "std"]
+        assert len(df) == 0
+
+    def test_close_twice(self, tmp_path):
+        path = tmp_path / "results.parquet"
+        writer = ResultsWriter(path)
+        writer.append(i=np.arange(3), std=1.0)
+        writer.close()
+        writer.close()
+
+        assert len(pd.read_parquet(path)) == 3
+
+    def test_raises_columns(self, tmp_path):
+        with ResultsWriter(tmp_path / "results.parquet") as writer:
+            writer.append(a=1.0, b=2.0)
+            with pytest.raises(ValueError):
+                writer.append(a=1.0, c=2.0)
+            with pytest.raises(ValueError):
+                writer.append(a=[1.0, 2.0], b=[1.0, 2.0, 3.0])
+            with pytest.raises(ValueError):
+                writer.append(a=np.ones((2, 2)), b=1.0)
+
+    def test_raises_row_group_size(self, tmp_path):
+        with pytest.raises(ValueError):
+            ResultsWriter(tmp_path / "results.parquet", row_group_size=0)
@@ -0,0 +1,133 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from waveresponse import (
+    DirectionalSpectrum,
+    calculate_response,
+    calculate_response_parallel,
+)
+from waveresponse._parallel import _init_worker, _response_chunk
+
+
+@pytest.fixture
+def raos(make_rao):
+    return [make_rao(seed=i) for i in range(2)]
+
+
+@pytest.fixture
+def waves(make_wave):
+    return [make_wave(seed=i) for i in range(3)]
+
+
+@pytest.fixture
+def jobs(raos, waves):
+    return [
+        (rao, wave, heading)
+        for rao in raos
+        for wave in waves
+        for heading in (0.0, 45.0, 200.0)
+    ]
+
+
+class Test_calculate_response_parallel:
+    @pytest.mark.parametrize("max_workers,chunksize", [(1, None), (2, None), (2, 4)])
+    def test_spectrum(self, jobs, max_workers, chunksize):
+        responses = calculate_response_parallel(
+            jobs, heading_degrees=True, max_workers=max_workers, chunksize=chunksize
+        )
+
+        assert len(responses) == len(jobs)
+        for response, (rao, wave, heading) in zip(responses, jobs):
+            response_expect = calculate_response(
+                rao, wave, heading, heading_degrees=True
+            )
+            assert isinstance(response, DirectionalSpectrum)
+            np.testing.assert_array_almost_equal(response._freq, response_expect._freq)
+            np.testing.assert_array_almost_equal(response._dirs, response_expect._dirs)
+            np.testing.assert_array_almost_equal(response._vals, response_expect._vals)
+
+    @pytest.mark.parametrize("output", ["var", "std"])
+    def test_output(self, jobs, output):
+        out = calculate_response_parallel(
+            jobs,
+            heading_degrees=True,
+            coord_freq="rao",
+            coord_dirs="rao",
+            output=output,
+            max_workers=2,
+            chunksize=5,
+        )
+
+        out_expect = [
+            getattr(
+                calculate_response(
+                    rao,
+                    wave,
+                    heading,
+                    heading_degrees=True,
+                    coord_freq="rao",
+                    coord_dirs="rao",
+                ),
+                output,
+            )()
+            for rao, wave, heading in jobs
+        ]
+        np.testing.assert_array_almost_equal(out, out_expect)
+
+    def test_empty(self):
+        assert calculate_response_parallel([]) == []
+
+    def test_raos_sent_once(self, jobs, raos):
+        with patch("waveresponse._parallel.ProcessPoolExecutor") as mock_executor:
+            mock_executor.return_value.__enter__.return_value.map.return_value = []
+            calculate_response_parallel(jobs, max_workers=3, chunksize=2)
+
+        _, kwargs = mock_executor.call_args
+        assert kwargs["max_workers"] == 3
+        assert kwargs["initializer"] is _init_worker
+        assert len(kwargs["initargs"][0]) == 2
+        assert kwargs["initargs"][0][0] is raos[0]
+        assert kwargs["initargs"][0][1] is raos[1]
+
+        (_, chunks), _ = mock_executor.return_value.__enter__.return_value.map.call_args
+        assert len(chunks) == 9
+        for chunk in chunks:
+            for rao_index, _, _ in chunk:
+                assert rao_index in (0, 1)
+
+    def test_raises_output(self, jobs):
+        with pytest.raises(ValueError):
+            calculate_response_parallel(jobs, output="foo")
+
+    def test_raises_job(self, raos, waves):
+        with pytest.raises(ValueError):
+            calculate_response_parallel([(raos[0], waves[0])])
+
+    @pytest.mark.parametrize("max_workers,chunksize", [(0, None), (2, 0)])
+    def test_raises_workers_chunksize(self, jobs, max_workers, chunksize):
+        with pytest.raises(ValueError):
+            calculate_response_parallel(
+                jobs, max_workers=max_workers, chunksize=chunksize
+            )
+
+
+class Test__response_chunk:
+    def test_worker_raos(self, raos, waves):
+        _init_worker(raos)
+        try:
+            out = _response_chunk(
+                [(1, waves[0], 30.0)],
+                heading_degrees=True,
+                coord_freq="wave",
+                coord_dirs="wave",
+                output="var",
+            )
+        finally:
+            _init_worker(None)
+
+        var_expect = calculate_response(
+            raos[1], waves[0], 30.0, heading_degrees=True
+        ).var()
+        assert out == [pytest.approx(var_expect)]
@@ -0,0 +1,144 @@
+import types
+
+import numpy as np
+import pytest
+
+from waveresponse import (
+    DirectionalSpectrum,
+    RAOSet,
+    WaveSpectrum,
+    calculate_response,
+    response_stats_stream,
+)
+
+
+@pytest.fixture
+def waves(make_wave):
+    return [
+        make_wave(seed=i, clockwise=True, waves_coming_from=False) for i in range(7)
+    ]
+
+
+def collect(stream):
+    std, tz = zip(*stream)
+    return np.concatenate(std), np.concatenate(tz)
+
+
+class Test_response_stats_stream:
+    @pytest.mark.parametrize("coord_freq", ["wave", "rao"])
+    @pytest.mark.parametrize("coord_dirs", ["wave", "rao"])
+    def test_stats(self, rao, waves, coord_freq, coord_dirs):
+        std, tz = collect(
+            response_stats_stream(
+                rao,
+                waves,
+                30.0,
+                heading_degrees=True,
+                coord_freq=coord_freq,
+                coord_dirs=coord_dirs,
+                chunksize=3,
+            )
+        )
+
+        responses = [
+            calculate_response(
+                rao,
+                wave,
+                30.0,
+                heading_degrees=True,
+                coord_freq=coord_freq,
+                coord_dirs=coord_dirs,
+            )
+            for wave in waves
+        ]
+        np.testing.assert_array_almost_equal(
+            std, [response.std() for response in responses]
+        )
+        np.testing.assert_array_almost_equal(
+            tz, [response.tz for response in responses]
+        )
+
+    def test_chunks(self, rao, waves):
+        stream = response_stats_stream(rao, waves, 0.5, chunksize=3)
+
+        assert isinstance(stream, types.GeneratorType)
+        shapes = [(std.shape, tz.shape) for std, tz in stream]
+        assert shapes == [((3,), (3,)), ((3,), (3,)), ((1,), (1,))]
+
+    def test_lazy(self, rao, waves):
+        consumed = []
+
+        def wave_iter():
+            for wave in waves:
+                consumed.append(wave)
+                yield wave
+
+        stream = response_stats_stream(rao, wave_iter(), 0.5, chunksize=2)
+        assert consumed == []
+        next(stream)
+        assert len(consumed) == 2
+
+    def test_mixed_coordinates(self, rao, waves):
+        wave_other = WaveSpectrum(
+            rao.freq(),
+            rao.dirs(),
+            np.ones((10, 12)),
+            freq_hz=True,
+            degrees=True,
+        )
+        waves = waves[:2] + [wave_other] + waves[2:4]
+
+        std, tz = collect(response_stats_stream(rao, waves, 1.0, chunksize=4))
+
+        responses = [calculate_response(rao, wave, 1.0) for wave in waves]
+        np.testing.assert_array_almost_equal(
+            std, [response.std() for response in responses]
+        )
+        np.testing.assert_array_almost_equal(
+            tz, [response.tz for response in responses]
+        )
+
+    def test_raoset(self, waves):
+        freq = np.linspace(0.05, 0.5, 10)
+        dirs = np.linspace(0.0, 360.0, 12, endpoint=False)
+        rng = np.random.default_rng(3)
+        vals = rng.random((6, 10, 12)) + 1j * rng.random((6, 10, 12))
+        raoset = RAOSet(freq, dirs, vals, freq_hz=True, degrees=True)
+
+        std, tz = collect(
+            response_stats_stream(raoset, waves, 1.0, coord_freq="rao", chunksize=4)
+        )
+
+        assert std.shape == (7, 6)
+        for j, rao in enumerate(raoset):
+            responses = [
+                calculate_response(rao, wave, 1.0, coord_freq="rao") for wave in waves
+            ]
+            np.testing.assert_array_almost_equal(
+                std[:, j], [response.std() for response in responses]
+            )
+            np.testing.assert_array_almost_equal(
+                tz[:, j], [response.tz for response in responses]
+            )
+
+    def test_empty(self, rao):
+        assert list(response_stats_stream(rao, [], 0.0)) == []
+
+    def test_raises_type(self, rao, waves):
+        with pytest.raises(ValueError):
+            list(response_stats_stream(rao, [waves[0], rao], 0.0))
+
+    def test_raises_type_directional_spectrum(self, rao, waves):
+        spectrum = DirectionalSpectrum.from_grid(waves[0])
+        with pytest.raises(ValueError):
+            list(response_stats_stream(rao, [waves[0], spectrum], 0.0))
+
+    def test_raises_coord(self, rao, waves):
+        with pytest.raises(ValueError):
+            list(response_stats_stream(rao, waves, 0.0, coord_freq="foo"))
+        with pytest.raises(ValueError):
+            list(response_stats_stream(rao, waves, 0.0, coord_dirs="foo"))
+
+    def test_raises_chunksize(self, rao, waves):
+        with pytest.raises(ValueError):
+            list(response_stats_stream(rao, waves, 0.0, chunksize=0))
@@ -0,0 +1,207 @@
+import os
+import subprocess
+import sys
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from waveresponse import (
+    ProfileResult,
+    _profiling,
+    calculate_response,
+    profile,
+)
+from waveresponse._profiling import _instrument
+
+
+@_instrument
+def allocate(n):
+    return np.ones(n)
+
+
+@_instrument
+def allocate_nested(n):
+    return allocate(n).sum() + np.ones(2 * n).sum()
+
+
+class Test_profile:
+    def test_stages(self, rao, wave):
+        with profile() as prof:
+            response = calculate_response(rao, wave, 0.5, coord_freq="rao")
+            response.std()
+            response.tz
+            response.copy()
+
+        assert isinstance(prof, ProfileResult)
+        stats = prof.stats
+        assert stats["Grid.reshape"]["calls"] == 2
+        assert stats["Grid._interpolate_function"]["calls"] == 2
+        assert stats["Grid._convert"]["calls"] == 1
+        assert stats["Grid.copy"]["calls"] == 1
+        assert stats["_check_is_similar"]["calls"] >= 1
+        assert stats["_trapezoid_weights"]["calls"] == 1
+        assert stats["_trapezoid_weights_periodic"]["calls"] == 1
+        assert stats["DirectionalSpectrum.var"]["calls"] == 1
+        assert stats["DirectionalSpectrum.moment"]["calls"] == 2
+
+        for stats_i in stats.values():
+            assert stats_i["total_time"] >= 0.0
+            assert stats_i["mean_time"] == stats_i["total_time"] / stats_i["calls"]
+            assert stats_i["max_bytes"] >= 0
+            assert stats_i["total_bytes"] >= stats_i["max_bytes"]
+
+    def test_sorted_by_time(self, rao, wave):
+        with profile() as prof:
+            calculate_response(rao, wave, 0.5)
+
+        total_time = [stats_i["total_time"] for stats_i in prof.stats.values()]
+        assert total_time == sorted(total_time, reverse=True)
+
+    def test_disabled(self, rao, wave):
+        with profile() as prof:
+            pass
+        calculate_response(rao, wave, 0.5)
+
+        assert prof.stats == {}
+        assert _profiling._ACTIVE == []
+
+    def test_nested_profiles(self):
+        with profile() as outer:
+            allocate(10)
+            with profile(memory=False) as inner:
+                allocate(10)
+
+        assert outer.stats["allocate"]["calls"] == 2
+        assert inner.stats["allocate"]["calls"] == 1
+        assert inner.stats["allocate"]["max_bytes"] is None
+
+    def test_memory(self):
+        with profile() as prof:
+            allocate(100_000)
+
+        stats = prof.stats["allocate"]
+        assert stats["max_bytes"] >= 800_000
+        assert stats["max_bytes"] < 900_000
+
+    def test_memory_nested_stages(self):
+        with profile() as prof:
+            allocate_nested(100_000)
+
+        assert prof.stats["allocate"]["max_bytes"] >= 800_000
+        assert prof.stats["allocate_nested"]["max_bytes"] >= 1_600_000
+
+    def test_memory_tracing_stopped(self):
+        assert not tracemalloc.is_tracing()
+        with profile():
+            assert tracemalloc.is_tracing()
+        assert not tracemalloc.is_tracing()
+
+    def test_memory_tracing_kept(self):
+        tracemalloc.start()
+        try:
+            with profile():
+                pass
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+    def test_no_memory(self):
+        with profile(memory=False) as prof:
+            assert not tracemalloc.is_tracing()
+            allocate(10)
+
+        assert prof.memory is False
+        assert prof.stats["allocate"]["max_bytes"] is None
+        assert prof.stats["allocate"]["total_bytes"] is None
+
+    def test_exception(self):
+        @_instrument
+        def fail():
+            raise RuntimeError()
+
+        with profile() as prof:
+            with pytest.raises(RuntimeError):
+                fail()
+
+        assert prof.stats["Test_profile.test_exception.<locals>.fail"]["calls"] == 1
+        assert _profiling._MEMORY_STACK == []
+
+    def test_wraps(self):
+        assert allocate.__name__ == "allocate"
+        assert allocate.__wrapped__(3).shape == (3,)
+
+
+class Test_ProfileResult:
+    def test_to_dataframe(self):
+        with profile() as prof:
+            allocate(10)
+            allocate(10)
+
+        df = prof.to_dataframe()
+        assert isinstance(df, pd.DataFrame)
+        assert df.index.name == "stage"
+        assert list(df.columns) == [
+            "calls",
+            "total_time",
+            "mean_time",
+            "max_bytes",
+            "total_bytes",
+        ]
+        assert df.loc["allocate", "calls"] == 2
+
+    def test_summary(self):
+        with profile() as prof:
+            allocate(10)
+
+        summary = prof.summary()
+        assert "allocate" in summary
+        assert "total_time" in summary
+
+    def test_summary_empty(self):
+        assert ProfileResult().summary() == "No stages recorded."
+
+    def test_reset(self):
+        with profile() as prof:
+            allocate(10)
+        prof.reset()
+        assert prof.stats == {}
+
+    def test_repr(self):
+        with profile() as prof:
+            allocate(10)
+        assert repr(prof) == "ProfileResult(1 stages)"
+
+
+class Test_environment_variable:
+    def run(self, value):
+        env = dict(os.environ, WAVERESPONSE_PROFILE=value)
+        code = (
+            "import tracemalloc\n"
+            "import numpy as np, waveresponse as wr\n"
+            "wr.WaveSpectrum([0.1, 0.2], [0.0, 1.0], np.ones((2, 2))).var()\n"
+            "print(tracemalloc.is_tracing())\n"
+        )
+        return subprocess.run(
+            [sys.executable, "-c", code],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+    def test_enabled(self):
+        result = self.run("1")
+        assert "waveresponse profile:" in result.stderr
+        assert "DirectionalSpectrum.var" in result.stderr
+        assert result.stdout.strip() == "False"
+
+    def test_enabled_memory(self):
+        result = self.run("memory")
+        assert "DirectionalSpectrum.var" in result.stderr
+        assert result.stdout.strip() == "True"
+
+    def test_disabled(self):
+        result = self.run("0")
+        assert result.stderr == ""
@@ -0,0 +1,256 @@
+import numpy as np
+import pytest
+
+from waveresponse import (
+    RAO,
+    DirectionalSpectrum,
+    RAOSet,
+    calculate_response,
+    mirror,
+    rigid_transform,
+)
+
+
+@pytest.fixture
+def freq_dirs():
+    freq = np.linspace(0.05, 0.5, 10)
+    dirs = np.linspace(0.0, 360.0, 12, endpoint=False)
+    return freq, dirs
+
+
+@pytest.fixture
+def vals(freq_dirs):
+    freq, dirs = freq_dirs
+    rng = np.random.default_rng(1)
+    shape = (6, len(freq), len(dirs))
+    return rng.random(shape) + 1j * rng.random(shape)
+
+
+@pytest.fixture
+def raoset(freq_dirs, vals):
+    freq, dirs = freq_dirs
+    return RAOSet(freq, dirs, vals, freq_hz=True, degrees=True)
+
+
+@pytest.fixture
+def raos(freq_dirs, vals):
+    freq, dirs = freq_dirs
+    return [RAO(freq, dirs, vals_i, freq_hz=True, degrees=True) for vals_i in vals]
+
+
+@pytest.fixture
+def wave(make_wave):
+    return make_wave(clockwise=True)
+
+
+def assert_raos_equal(rao_out, rao_expect):
+    assert isinstance(rao_out, RAO)
+    np.testing.assert_array_almost_equal(rao_out._freq, rao_expect._freq)
+    np.testing.assert_array_almost_equal(rao_out._dirs, rao_expect._dirs)
+    np.testing.assert_array_almost_equal(rao_out._vals, rao_expect._vals)
+    assert rao_out._freq_hz == rao_expect._freq_hz
+    assert rao_out._degrees == rao_expect._degrees
+    assert rao_out.wave_convention == rao_expect.wave_convention
+
+
+class Test_RAOSet:
+    def test__init__(self, freq_dirs, vals):
+        freq, dirs = freq_dirs
+        raoset = RAOSet(freq, dirs, vals, freq_hz=True, degrees=True, clockwise=True)
+
+        np.testing.assert_array_almost_equal(raoset._freq, 2.0 * np.pi * freq)
+        np.testing.assert_array_almost_equal(raoset._dirs, np.radians(dirs))
+        np.testing.assert_array_almost_equal(raoset._vals, vals)
+        assert raoset._vals is not vals
+        assert raoset._freq_hz is True
+        assert raoset._degrees is True
+        assert raoset.wave_convention == {"clockwise": True, "waves_coming_from": True}
+
+    def test__init__no_copy(self, freq_dirs, vals):
+        freq, dirs = freq_dirs
+        raoset = RAOSet(freq, dirs, vals, freq_hz=True, degrees=True, copy=False)
+        assert raoset._vals is vals
+
+    @pytest.mark.parametrize("shape", [(5, 10, 12), (6, 10, 11), (10, 12)])
+    def test__init__raises_shape(self, freq_dirs, shape):
+        freq, dirs = freq_dirs
+        with pytest.raises(ValueError):
+            RAOSet(freq, dirs, np.zeros(shape), freq_hz=True, degrees=True)
+
+    def test__init__raises_dirs(self, freq_dirs):
+        freq, _ = freq_dirs
+        dirs = np.linspace(0.0, 360.0, 12)
+        with pytest.raises(ValueError):
+            RAOSet(freq, dirs, np.zeros((6, 10, 12)), freq_hz=True, degrees=True)
+
+    def test_from_raos(self, raos, vals):
+        raoset = RAOSet.from_raos(*raos)
+
+        np.testing.assert_array_almost_equal(raoset._vals, vals)
+        np.testing.assert_array_almost_equal(raoset._freq, raos[0]._freq)
+        np.testing.assert_array_almost_equal(raoset._dirs, raos[0]._dirs)
+        assert raoset._freq_hz is True
+        assert raoset._degrees is True
+
+    def test_from_raos_raises_type(self, raos):
+        raos[3] = DirectionalSpectrum(
+            raos[3].freq(),
+            raos[3].dirs(),
+            np.ones((10, 12)),
+            freq_hz=True,
+            degrees=True,
+        )
+        with pytest.raises(ValueError):
+            RAOSet.from_raos(*raos)
+
+    def test_from_raos_raises_convention(self, raos):
+        raos[2].set_wave_convention(clockwise=True, waves_coming_from=False)
+        with pytest.raises(ValueError):
+            RAOSet.from_raos(*raos)
+
+    def test__getitem__(self, raoset, raos):
+        assert_raos_equal(raoset["heave"], raos[2])
+        assert_raos_equal(raoset["Yaw"], raos[5])
+        assert_raos_equal(raoset[0], raos[0])
+
+    def test__getitem__raises(self, raoset):
+        with pytest.raises(KeyError):
+            raoset["foo"]
+
+    def test_to_raos(self, raoset, raos):
+        raos_out = raoset.to_raos()
+        assert len(raos_out) == 6
+        for rao_out, rao_expect in zip(raos_out, raos):
+            assert_raos_equal(rao_out, rao_expect)
+
+    def test_freq_dirs(self, raoset, freq_dirs):
+        freq, dirs = freq_dirs
+        np.testing.assert_array_almost_equal(raoset.freq(), freq)
+        np.testing.assert_array_almost_equal(
+            raoset.freq(freq_hz=False), 2 * np.pi * freq
+        )
+        np.testing.assert_array_almost_equal(raoset.dirs(), dirs)
+        np.testing.assert_array_almost_equal(
+            raoset.dirs(degrees=False), np.radians(dirs)
+        )
+
+    def test_set_wave_convention(self, raoset, raos):
+        raoset.set_wave_convention(clockwise=True, waves_coming_from=False)
+
+        for rao_out, rao_expect in zip(raoset, raos):
+            rao_expect.set_wave_convention(clockwise=True, waves_coming_from=False)
+            assert_raos_equal(rao_out, rao_expect)
+
+    def test_copy(self, raoset):
+        raoset_copy = raoset.copy()
+        assert raoset_copy is not raoset
+        assert raoset_copy._vals is not raoset._vals
+        np.testing.assert_array_almost_equal(raoset_copy._vals, raoset._vals)
+
+    def test_rotate(self, raoset, raos):
+        raoset_out = raoset.rotate(35.0, degrees=True)
+
+        assert isinstance(raoset_out, RAOSet)
+        for rao_out, rao_expect in zip(raoset_out, raos):
+            assert_raos_equal(rao_out, rao_expect.rotate(35.0, degrees=True))
+
+    def test_rotate_uniform(self, raoset, raos):
+        raoset_out = raoset.rotate(60.0, degrees=True)
+
+        assert raoset_out._dirs is raoset._dirs
+        np.testing.assert_array_equal(
+            raoset_out._vals, np.roll(raoset._vals, -2, axis=-1)
+        )
+        for rao_out, rao_expect in zip(raoset_out, raos):
+            assert_raos_equal(rao_out, rao_expect.rotate(60.0, degrees=True))
+
+    @pytest.mark.parametrize("fill_value", [0.0, None])
+    def test_reshape(self, raoset, raos, fill_value):
+        freq_new = np.linspace(0.0, 0.7, 20)
+        dirs_new = np.linspace(0.0, 360.0, 25, endpoint=False)
+        raoset_out = raoset.reshape(
+            freq_new, dirs_new, freq_hz=True, degrees=True, fill_value=fill_value
+        )
+
+        for rao_out, rao_expect in zip(raoset_out, raos):
+            rao_expect = rao_expect.reshape(
+                freq_new, dirs_new, freq_hz=True, degrees=True, fill_value=fill_value
+            )
+            assert_raos_equal(rao_out, rao_expect)
+
+    @pytest.mark.parametrize("sym_plane", ["xz", "yz"])
+    def test_mirror(self, sym_plane):
+        freq = np.linspace(0.05, 0.5, 10)
+        if sym_plane == "xz":
+            dirs = np.linspace(0.0, 180.0, 7)
+        else:
+            dirs = np.linspace(90.0, 270.0, 7)
+        rng = np.random.default_rng(3)
+        vals = rng.random((6, 10, 7)) + 1j * rng.random((6, 10, 7))
+
+        raoset_out = RAOSet(freq, dirs, vals, freq_hz=True, degrees=True).mirror(
+            sym_plane
+        )
+
+        dofs = ("surge", "sway", "heave", "roll", "pitch", "yaw")
+        for dof, rao_out, vals_i in zip(dofs, raoset_out, vals):
+            rao_expect = mirror(
+                RAO(freq, dirs, vals_i, freq_hz=True, degrees=True),
+                dof,
+                sym_plane=sym_plane,
+            )
+            assert_raos_equal(rao_out, rao_expect)
+
+    def test_differentiate(self, raoset, raos):
+        raoset_out = raoset.differentiate(2)
+
+        for rao_out, rao_expect in zip(raoset_out, raos):
+            assert_raos_equal(rao_out, rao_expect.differentiate(2))
+
+    def test_rigid_transform(self, raoset, raos):
+        t = np.array([10.0, -2.0, 5.0])
+        raoset_out = raoset.rigid_transform(t)
+
+        surge, sway, heave = rigid_transform(t, *raos)
+        for rao_out, rao_expect in zip(raoset_out, [surge, sway, heave, *raos[3:]]):
+            assert_raos_equal(rao_out, rao_expect)
+
+    def test_rigid_transform_raises(self, raoset):
+        with pytest.raises(ValueError):
+            raoset.rigid_transform(np.ones((2, 3)))
+
+    @pytest.mark.parametrize("coord_freq", ["wave", "rao"])
+    @pytest.mark.parametrize("coord_dirs", ["wave", "rao"])
+    def test_calculate_response(self, raoset, raos, wave, coord_freq, coord_dirs):
+        responses = raoset.calculate_response(
+            wave,
+            20.0,
+            heading_degrees=True,
+            coord_freq=coord_freq,
+            coord_dirs=coord_dirs,
+        )
+
+        assert len(responses) == 6
+        for response, rao in zip(responses, raos):
+            response_expect = calculate_response(
+                rao,
+                wave,
+                20.0,
+                heading_degrees=True,
+                coord_freq=coord_freq,
+                coord_dirs=coord_dirs,
+            )
+            assert isinstance(response, DirectionalSpectrum)
+            np.testing.assert_array_almost_equal(response._freq, response_expect._freq)
+            np.testing.assert_array_almost_equal(response._dirs, response_expect._dirs)
+            np.testing.assert_array_almost_equal(response._vals, response_expect._vals)
+            assert response.wave_convention == response_expect.wave_convention
+
+    def test_calculate_response_raises(self, raoset, wave):
+        with pytest.raises(ValueError):
+            raoset.calculate_response(wave, 0.0, coord_freq="foo")
+        with pytest.raises(ValueError):
+            raoset.calculate_response(wave, 0.0, coord_dirs="foo")
+
+    def test__repr__(self, raoset):
+        assert str(raoset) == "RAOSet"
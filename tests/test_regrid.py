@@ -0,0 +1,202 @@
+import numpy as np
+import pytest
+
+from waveresponse import RAO, DirectionalSpectrum, Grid, Regridder
+
+
+@pytest.fixture
+def freq_dirs_org():
+    freq = np.linspace(0.1, 1.0, 12)
+    dirs = np.array([5.0, 30.0, 60.0, 95.0, 150.0, 200.0, 230.0, 300.0, 355.0])
+    return freq, dirs
+
+
+@pytest.fixture
+def freq_dirs_new():
+    freq = np.linspace(0.0, 1.3, 17)
+    dirs = np.linspace(0.0, 360.0, 25, endpoint=False)
+    return freq, dirs
+
+
+class Test_Regridder:
+    def test__init__(self, freq_dirs_org, freq_dirs_new):
+        freq_org, dirs_org = freq_dirs_org
+        freq_new, dirs_new = freq_dirs_new
+        regridder = Regridder(
+            freq_org, dirs_org, freq_new, dirs_new, freq_hz=True, degrees=True
+        )
+
+        np.testing.assert_array_almost_equal(
+            regridder._freq_org, 2.0 * np.pi * freq_org
+        )
+        np.testing.assert_array_almost_equal(regridder._dirs_org, np.radians(dirs_org))
+        np.testing.assert_array_almost_equal(
+            regridder._freq_new, 2.0 * np.pi * freq_new
+        )
+        np.testing.assert_array_almost_equal(regridder._dirs_new, np.radians(dirs_new))
+        assert regridder._weights.shape == (17 * 25, 12 * 9)
+
+    def test__init__raises_dirs(self, freq_dirs_org):
+        freq_org, dirs_org = freq_dirs_org
+        with pytest.raises(ValueError):
+            Regridder(freq_org, dirs_org, freq_org, [0.0, 360.0], degrees=True)
+
+    def test__init__raises_single_freq(self, freq_dirs_new):
+        freq_new, dirs_new = freq_dirs_new
+        with pytest.raises(ValueError):
+            Regridder([0.5], [0.0, 180.0], freq_new, dirs_new, degrees=True)
+
+    @pytest.mark.parametrize("fill_value", [0.0, 5.0, None])
+    def test__call__(self, freq_dirs_org, freq_dirs_new, fill_value):
+        freq_org, dirs_org = freq_dirs_org
+        freq_new, dirs_new = freq_dirs_new
+        vals = np.random.random((12, 9))
+        grid = Grid(freq_org, dirs_org, vals, freq_hz=True, degrees=True)
+
+        regridder = Regridder(
+            freq_org,
+            dirs_org,
+            freq_new,
+            dirs_new,
+            freq_hz=True,
+            degrees=True,
+            fill_value=fill_value,
+        )
+
+        vals_out = regridder(vals)
+        vals_expect = grid.interpolate(
+            freq_new, dirs_new, freq_hz=True, degrees=True, fill_value=fill_value
+        )
+        np.testing.assert_array_almost_equal(vals_out, vals_expect)
+
+    @pytest.mark.parametrize("fill_value", [0.0, 5.0, None])
+    def test__call__complex(self, freq_dirs_org, freq_dirs_new, fill_value):
+        freq_org, dirs_org = freq_dirs_org
+        freq_new, dirs_new = freq_dirs_new
+        vals = np.random.random((12, 9)) + 1j * np.random.random((12, 9))
+        rao = RAO(freq_org, dirs_org, vals, freq_hz=True, degrees=True)
+
+        regridder = Regridder(
+            freq_org,
+            dirs_org,
+            freq_new,
+            dirs_new,
+            freq_hz=True,
+            degrees=True,
+            fill_value=fill_value,
+        )
+
+        vals_out = regridder(vals)
+        vals_expect = rao.interpolate(
+            freq_new,
+            dirs_new,
+            freq_hz=True,
+            degrees=True,
+            complex_convert="rectangular",
+            fill_value=fill_value,
+        )
+        np.testing.assert_array_almost_equal(vals_out, vals_expect)
+
+    def test__call__stack(self, freq_dirs_org, freq_dirs_new):
+        freq_org, dirs_org = freq_dirs_org
+        freq_new, dirs_new = freq_dirs_new
+        vals = np.random.random((4, 12, 9))
+
+        regridder = Regridder(
+            freq_org, dirs_org, freq_new, dirs_new, freq_hz=True, degrees=True
+        )
+
+        vals_out = regridder(vals)
+        vals_expect = np.array([regridder(vals_i) for vals_i in vals])
+
+        assert vals_out.shape == (4, 17, 25)
+        np.testing.assert_array_almost_equal(vals_out, vals_expect)
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.complex64])
+    @pytest.mark.parametrize("fill_value", [0.0, 5.0])
+    def test__call__single_precision(
+        self, freq_dirs_org, freq_dirs_new, dtype, fill_value
+    ):
+        freq_org, dirs_org = freq_dirs_org
+        freq_new, dirs_new = freq_dirs_new
+        vals = np.random.random((4, 12, 9)).astype(dtype)
+        if np.iscomplexobj(vals):
+            vals += 1j * np.random.random((4, 12, 9)).astype(np.float32)
+
+        regridder = Regridder(
+            freq_org,
+            dirs_org,
+            freq_new,
+            dirs_new,
+            freq_hz=True,
+            degrees=True,
+            fill_value=fill_value,
+        )
+
+        vals_out = regridder(vals)
+        vals_expect = regridder(vals.astype(np.result_type(vals, np.float64)))
+
+        assert vals_out.dtype == dtype
+        np.testing.assert_allclose(vals_out, vals_expect, rtol=1e-5)
+
+    def test__call__single_direction(self, freq_dirs_org, freq_dirs_new):
+        freq_org, _ = freq_dirs_org
+        freq_new, dirs_new = freq_dirs_new
+        vals = np.random.random((12, 1))
+        grid = Grid(freq_org, [45.0], vals, freq_hz=True, degrees=True)
+
+        regridder = Regridder(
+            freq_org, [45.0], freq_new, dirs_new, freq_hz=True, degrees=True
+        )
+
+        vals_out = regridder(vals)
+        vals_expect = grid.interpolate(freq_new, dirs_new, freq_hz=True, degrees=True)
+        np.testing.assert_array_almost_equal(vals_out, vals_expect)
+
+    def test__call__raises_shape(self, freq_dirs_org, freq_dirs_new):
+        freq_org, dirs_org = freq_dirs_org
+        freq_new, dirs_new = freq_dirs_new
+        regridder = Regridder(freq_org, dirs_org, freq_new, dirs_new, degrees=True)
+
+        with pytest.raises(ValueError):
+            regridder(np.ones((9, 12)))
+
+    def test_reshape(self, freq_dirs_org, freq_dirs_new):
+        freq_org, dirs_org = freq_dirs_org
+        freq_new, dirs_new = freq_dirs_new
+        vals = np.random.random((12, 9))
+        spectrum = DirectionalSpectrum(
+            freq_org,
+            dirs_org,
+            vals,
+            freq_hz=True,
+            degrees=True,
+            clockwise=True,
+            waves_coming_from=False,
+        )
+
+        regridder = Regridder(
+            freq_org, dirs_org, freq_new, dirs_new, freq_hz=True, degrees=True
+        )
+        spectrum_out = regridder.reshape(spectrum)
+        spectrum_expect = spectrum.reshape(
+            freq_new, dirs_new, freq_hz=True, degrees=True
+        )
+
+        assert isinstance(spectrum_out, DirectionalSpectrum)
+        assert spectrum_out.wave_convention == spectrum.wave_convention
+        np.testing.assert_array_almost_equal(spectrum_out._freq, spectrum_expect._freq)
+        np.testing.assert_array_almost_equal(spectrum_out._dirs, spectrum_expect._dirs)
+        np.testing.assert_array_almost_equal(spectrum_out._vals, spectrum_expect._vals)
+
+    def test_reshape_raises_coordinates(self, freq_dirs_org, freq_dirs_new):
+        freq_org, dirs_org = freq_dirs_org
+        freq_new, dirs_new = freq_dirs_new
+        grid = Grid(freq_new, dirs_new, np.ones((17, 25)), freq_hz=True, degrees=True)
+
+        regridder = Regridder(
+            freq_org, dirs_org, freq_new, dirs_new, freq_hz=True, degrees=True
+        )
+
+        with pytest.raises(ValueError):
+            regridder.reshape(grid)
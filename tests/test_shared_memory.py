@@ -0,0 +1,190 @@
+import copy
+import gc
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from waveresponse import RAO, Grid, _shared_memory, calculate_response
+from waveresponse._shared_memory import (
+    SharedArrayHandle,
+    from_shared,
+    to_shared,
+    unlink,
+)
+
+
+@pytest.fixture
+def shared_rao(rao):
+    rao_shared = rao.share_memory()
+    yield rao_shared
+    rao_shared.unlink_shared_memory()
+
+
+def _vals_sum(grid):
+    return grid._vals.sum()
+
+
+class Test_to_shared:
+    def test_round_trip(self):
+        arr = np.arange(12.0).reshape(3, 4)
+        arr_shared, handle = to_shared(arr)
+
+        try:
+            assert isinstance(handle, SharedArrayHandle)
+            assert handle.shape == (3, 4)
+            np.testing.assert_array_equal(arr_shared, arr)
+            assert not arr_shared.flags.writeable
+
+            arr_attached = from_shared(handle)
+            np.testing.assert_array_equal(arr_attached, arr)
+            assert np.shares_memory(arr_attached, arr_shared)
+        finally:
+            unlink(handle)
+
+    def test_complex(self):
+        arr = np.array([1.0 + 2.0j, 3.0 - 1.0j])
+        arr_shared, handle = to_shared(arr)
+        try:
+            np.testing.assert_array_equal(from_shared(handle), arr)
+        finally:
+            unlink(handle)
+
+
+class Test_Grid_share_memory:
+    def test_share_memory(self, rao, shared_rao):
+        assert isinstance(shared_rao, RAO)
+        assert shared_rao is not rao
+        np.testing.assert_array_equal(shared_rao._freq, rao._freq)
+        np.testing.assert_array_equal(shared_rao._dirs, rao._dirs)
+        np.testing.assert_array_equal(shared_rao._vals, rao._vals)
+        assert shared_rao.wave_convention == rao.wave_convention
+        assert shared_rao._freq_hz is True
+        assert shared_rao._degrees is True
+        assert not shared_rao._vals.flags.writeable
+        assert rao._shared == {}
+
+    def test_pickle_small(self, rao):
+        freq = np.linspace(0.0, 1.0, 200)
+        dirs = np.linspace(0.0, 360.0, 180, endpoint=False)
+        grid = Grid(freq, dirs, np.ones((200, 180)), freq_hz=True, degrees=True)
+        grid_shared = grid.share_memory()
+
+        try:
+            assert len(pickle.dumps(grid_shared)) < 2_000
+            assert len(pickle.dumps(grid)) > 200 * 180 * 8
+        finally:
+            grid_shared.unlink_shared_memory()
+
+    def test_pickle_zero_copy(self, shared_rao):
+        rao_out = pickle.loads(pickle.dumps(shared_rao))
+
+        assert isinstance(rao_out, RAO)
+        assert np.shares_memory(rao_out._vals, shared_rao._vals)
+        assert np.shares_memory(rao_out._freq, shared_rao._freq)
+        assert np.shares_memory(rao_out._dirs, shared_rao._dirs)
+        assert rao_out.wave_convention == shared_rao.wave_convention
+        assert set(rao_out._shared) == {"_freq", "_dirs", "_vals"}
+
+    def test_pickle_replaced_array(self, shared_rao):
+        shared_rao.set_wave_convention(clockwise=True, waves_coming_from=True)
+        rao_out = pickle.loads(pickle.dumps(shared_rao))
+
+        np.testing.assert_array_equal(rao_out._dirs, shared_rao._dirs)
+        np.testing.assert_array_equal(rao_out._vals, shared_rao._vals)
+        assert np.shares_memory(rao_out._freq, shared_rao._freq)
+        assert not np.shares_memory(rao_out._vals, shared_rao._vals)
+        # The (uniformly spaced) directions are only permuted, and thus kept
+        assert set(rao_out._shared) == {"_freq", "_dirs"}
+
+    def test_copy(self, shared_rao):
+        rao_copy = shared_rao.copy()
+
+        np.testing.assert_array_equal(rao_copy._vals, shared_rao._vals)
+        assert not np.shares_memory(rao_copy._vals, shared_rao._vals)
+        assert rao_copy._vals.flags.writeable
+        assert rao_copy._shared == {}
+
+    def test_shallow_copy(self, shared_rao):
+        rao_copy = copy.copy(shared_rao)
+
+        assert rao_copy._vals is shared_rao._vals
+        assert rao_copy._shared == shared_rao._shared
+        assert rao_copy._shared is not shared_rao._shared
+
+    def test_operations(self, rao, shared_rao, wave):
+        np.testing.assert_array_almost_equal(
+            calculate_response(shared_rao, wave, 0.3)._vals,
+            calculate_response(rao, wave, 0.3)._vals,
+        )
+        np.testing.assert_array_almost_equal(
+            shared_rao.rotate(0.3)._vals, rao.rotate(0.3)._vals
+        )
+        np.testing.assert_array_almost_equal(
+            shared_rao.differentiate()._vals, rao.differentiate()._vals
+        )
+
+    def test_unlink_shared_memory(self, rao):
+        rao_shared = rao.share_memory()
+        rao_shared.unlink_shared_memory()
+
+        assert rao_shared._shared == {}
+        np.testing.assert_array_equal(rao_shared._vals, rao._vals)
+        rao_out = pickle.loads(pickle.dumps(rao_shared))
+        np.testing.assert_array_equal(rao_out._vals, rao._vals)
+
+    def test_unlink_shared_memory_closed(self, rao):
+        rao_shared = rao.share_memory()
+        handles = [handle for _, handle in rao_shared._shared.values()]
+        rao_shared.unlink_shared_memory()
+
+        assert _shared_memory._UNLINKED == []
+        for handle in handles:
+            assert not _shared_memory.is_linked(handle)
+            with pytest.raises(FileNotFoundError):
+                from_shared(handle)
+
+        # Unlinking again has no effect
+        for handle in handles:
+            unlink(handle)
+
+    @pytest.mark.parametrize(
+        "derive",
+        [
+            lambda grid: grid * 2.0,
+            lambda grid: grid.rotate(30.0, degrees=True),
+            copy.copy,
+        ],
+    )
+    def test_pickle_derived_after_unlink(self, rao, derive):
+        rao_shared = rao.share_memory()
+        rao_derived = derive(rao_shared)
+        assert rao_derived._shared != {}
+        rao_shared.unlink_shared_memory()
+
+        # The blocks are still used by the derived object
+        assert len(_shared_memory._UNLINKED) > 0
+
+        rao_out = pickle.loads(pickle.dumps(rao_derived))
+        assert rao_out._shared == {}
+        np.testing.assert_array_equal(rao_out._freq, rao_derived._freq)
+        np.testing.assert_array_equal(rao_out._dirs, rao_derived._dirs)
+        np.testing.assert_array_equal(rao_out._vals, rao_derived._vals)
+
+        # The blocks are closed once the derived object is garbage collected
+        del rao_derived
+        gc.collect()
+        assert _shared_memory._UNLINKED == []
+
+    @pytest.mark.parametrize("start_method", ["fork", "spawn"])
+    def test_worker_process(self, shared_rao, start_method):
+        if start_method not in multiprocessing.get_all_start_methods():
+            pytest.skip(f"Start method '{start_method}' not available")
+
+        mp_context = multiprocessing.get_context(start_method)
+        with ProcessPoolExecutor(max_workers=1, mp_context=mp_context) as executor:
+            out = executor.submit(_vals_sum, shared_rao).result()
+
+        assert out == pytest.approx(shared_rao._vals.sum())
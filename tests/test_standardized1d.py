@@ -99,6 +99,27 @@ class Test_BasePMSpectrum:
         np.testing.assert_array_almost_equal(freq_out, freq_expect)
         np.testing.assert_array_almost_equal(spectrum_out, spectrum_expect)
 
+    def test__call__array(self):
+        freq = np.arange(0.01, 1, 0.01)
+        spectrum = wr.BasePMSpectrum(freq, freq_hz=True)
+
+        A = np.array([0.1, 0.2, 0.3])
+        B = np.array([0.5, 1.0, 2.0])
+        freq_out, spectrum_out = spectrum(A, B)
+
+        spectrum_expect = np.array([spectrum(A_i, B_i)[1] for A_i, B_i in zip(A, B)])
+
+        np.testing.assert_array_almost_equal(freq_out, freq)
+        assert spectrum_out.shape == (3, len(freq))
+        np.testing.assert_array_almost_equal(spectrum_out, spectrum_expect)
+
+    def test__call__raises_array_2d(self):
+        freq = np.arange(0.01, 1, 0.01)
+        spectrum = wr.BasePMSpectrum(freq, freq_hz=True)
+
+        with pytest.raises(ValueError):
+            spectrum(np.ones((2, 2)), np.ones((2, 2)))
+
 
 class Test_ModifiedPiersonMoskowitz:
     def test__init___hz(self):
@@ -189,6 +210,22 @@ class Test_ModifiedPiersonMoskowitz:
 
         assert var_rad == pytest.approx(var_hz)
 
+    def test__call__array(self):
+        freq = np.arange(0.01, 1, 0.01)
+        spectrum = wr.ModifiedPiersonMoskowitz(freq, freq_hz=True)
+
+        hs = np.array([1.0, 3.5, 5.0])
+        tp = np.array([6.0, 10.0, 12.0])
+        freq_out, spectrum_out = spectrum(hs, tp, freq_hz=False)
+
+        spectrum_expect = np.array(
+            [spectrum(hs_i, tp_i, freq_hz=False)[1] for hs_i, tp_i in zip(hs, tp)]
+        )
+
+        np.testing.assert_array_almost_equal(freq_out, 2.0 * np.pi * freq)
+        assert spectrum_out.shape == (3, len(freq))
+        np.testing.assert_array_almost_equal(spectrum_out, spectrum_expect)
+
 
 class Test_JONSWAP:
     def test__init___hz(self):
@@ -364,6 +401,40 @@ class Test_JONSWAP:
         np.testing.assert_array_almost_equal(freq_out, freq_expected)
         np.testing.assert_array_almost_equal(ps_out, ps_expected, decimal=2)
 
+    def test__call__array(self):
+        freq = np.arange(0.01, 1, 0.01)
+        spectrum = wr.JONSWAP(freq, freq_hz=True)
+
+        hs = np.array([1.0, 3.5, 5.0, 2.0])
+        tp = np.array([6.0, 10.0, 12.0, 8.0])
+        gamma = np.array([1.0, 2.0, 3.3, 5.0])
+        freq_out, spectrum_out = spectrum(hs, tp, gamma=gamma)
+
+        spectrum_expect = np.array(
+            [
+                spectrum(hs_i, tp_i, gamma=gamma_i)[1]
+                for hs_i, tp_i, gamma_i in zip(hs, tp, gamma)
+            ]
+        )
+
+        np.testing.assert_array_almost_equal(freq_out, freq)
+        assert spectrum_out.shape == (4, len(freq))
+        np.testing.assert_array_almost_equal(spectrum_out, spectrum_expect)
+
+    def test__call__array_scalar_gamma(self):
+        freq = np.arange(0.01, 1, 0.01)
+        spectrum = wr.JONSWAP(freq, freq_hz=True)
+
+        hs = np.array([1.0, 3.5])
+        tp = np.array([6.0, 10.0])
+        _, spectrum_out = spectrum(hs, tp, gamma=2.0)
+
+        spectrum_expect = np.array(
+            [spectrum(hs_i, tp_i, gamma=2.0)[1] for hs_i, tp_i in zip(hs, tp)]
+        )
+
+        np.testing.assert_array_almost_equal(spectrum_out, spectrum_expect)
+
 
 class Test_OchiHubble:
     def test__init___hz(self):
@@ -422,6 +493,23 @@ class Test_OchiHubble:
         np.testing.assert_array_almost_equal(freq_return, freq_expected)
         np.testing.assert_array_almost_equal(ps_return, ps_expected, decimal=2)
 
+    def test__call__array(self):
+        freq = np.arange(0.01, 1, 0.01)
+        spectrum = wr.OchiHubble(freq, freq_hz=True)
+
+        hs = np.array([1.0, 3.5, 5.0])
+        tp = np.array([6.0, 10.0, 12.0])
+        q = np.array([1.0, 2.0, 3.0])
+        freq_out, spectrum_out = spectrum(hs, tp, q=q)
+
+        spectrum_expect = np.array(
+            [spectrum(hs_i, tp_i, q=q_i)[1] for hs_i, tp_i, q_i in zip(hs, tp, q)]
+        )
+
+        np.testing.assert_array_almost_equal(freq_out, freq)
+        assert spectrum_out.shape == (3, len(freq))
+        np.testing.assert_array_almost_equal(spectrum_out, spectrum_expect)
+
 
 class Test_Torsethaugen:
     def test__init___hz(self):
@@ -492,3 +492,77 @@ class Test_rigid_transform:
         t = np.array([40, 50, 60])
         with pytest.raises(ValueError):
             rigid_transform(t, surge, sway, heave, roll, pitch, yaw)
+
+    @pytest.fixture
+    def raos(self):
+        freq = np.array([0.0, 0.5, 1.0])
+        dirs = np.array([0.0, 90.0, 180.0, 270.0])
+        rng = np.random.default_rng(42)
+        return [
+            RAO(
+                freq,
+                dirs,
+                rng.random((3, 4)) + 1j * rng.random((3, 4)),
+                degrees=True,
+            )
+            for _ in range(6)
+        ]
+
+    def test_rigid_transform_multiple_points(self, raos):
+        t = np.array([[40.0, 50.0, 60.0], [-1.0, 2.0, 0.5], [0.0, 0.0, 0.0]])
+        surge_out, sway_out, heave_out = rigid_transform(t, *raos)
+
+        assert surge_out.shape == (3, 3, 4)
+        assert sway_out.shape == (3, 3, 4)
+        assert heave_out.shape == (3, 3, 4)
+
+        for i, t_i in enumerate(t):
+            surge_expect, sway_expect, heave_expect = rigid_transform(t_i, *raos)
+            np.testing.assert_array_almost_equal(surge_out[i], surge_expect._vals)
+            np.testing.assert_array_almost_equal(sway_out[i], sway_expect._vals)
+            np.testing.assert_array_almost_equal(heave_out[i], heave_expect._vals)
+
+        np.testing.assert_array_almost_equal(surge_out[2], raos[0]._vals)
+        np.testing.assert_array_almost_equal(sway_out[2], raos[1]._vals)
+        np.testing.assert_array_almost_equal(heave_out[2], raos[2]._vals)
+
+    def test_rigid_transform_dof_multiple_points(self, raos):
+        surge, sway, heave, roll, pitch, yaw = raos
+        t = np.array([[40.0, 50.0, 60.0], [-1.0, 2.0, 0.5]])
+
+        surge_out = rigid_transform_surge(t, surge, pitch, yaw)
+        sway_out = rigid_transform_sway(t, sway, roll, yaw)
+        heave_out = rigid_transform_heave(t, heave, roll, pitch)
+
+        for i, (tx, ty, tz) in enumerate(t):
+            np.testing.assert_array_almost_equal(
+                surge_out[i], surge._vals - ty * yaw._vals + tz * pitch._vals
+            )
+            np.testing.assert_array_almost_equal(
+                sway_out[i], sway._vals + tx * yaw._vals - tz * roll._vals
+            )
+            np.testing.assert_array_almost_equal(
+                heave_out[i], heave._vals - tx * pitch._vals + ty * roll._vals
+            )
+
+    def test_rigid_transform_keeps_units(self, raos):
+        surge, sway, heave, roll, pitch, yaw = raos
+        surge = RAO(
+            surge.freq(freq_hz=True),
+            surge.dirs(degrees=False),
+            surge._vals,
+            freq_hz=True,
+            degrees=False,
+        )
+
+        surge_out = rigid_transform_surge([1.0, 2.0, 3.0], surge, pitch, yaw)
+
+        assert surge_out._freq_hz is True
+        assert surge_out._degrees is False
+        assert surge_out is not surge
+        assert surge_out._vals is not surge._vals
+
+    @pytest.mark.parametrize("t", [[1.0, 2.0], np.ones((2, 2)), np.ones((2, 3, 1))])
+    def test_rigid_transform_raises_t(self, raos, t):
+        with pytest.raises(ValueError):
+            rigid_transform(t, *raos)